@@ -33,6 +33,20 @@ def backendName():
 # note this is required for a lot of functionality
 doMeshing = True
 
+# otherwise (or with lazyMeshing) the mesh of a logical volume is generated on first use
+# of LogicalVolume.mesh, or for all volumes at once by Registry.prefetchMeshes
+lazyMeshing = True
+
+# approximate memory cap in bytes of the mesh cache of boolean solids in each registry,
+# least recently used meshes are evicted beyond this and 0 disables the cache
+meshCacheMemory = 512 * 1024 * 1024
+
+# MultiUnion meshes are built as a balanced tree of unions. Constituents with disjoint
+# bounding boxes can be concatenated rather than unioned and independent subtrees can be
+# meshed in a (forked) process pool of this many processes (0 or 1 for serial)
+multiUnionConcatenateDisjoint = True
+multiUnionParallel = 0
+
 # Global settings for default meshing settings for solids
 # nslice and and nstacks determine the discretisation of curved solids.
 # Solids that are curved in the x-y plane (e.g. Tubs) only need nslice. Solids that are
@@ -1,8 +1,11 @@
 from copy import deepcopy as _deepcopy
 from collections import namedtuple as _namedtuple
 from functools import reduce as _reduce
+import io as _io
 import logging as _logging
+import multiprocessing as _mp
 import numpy as _np
+import pickle as _pickle
 import types as _types
 import warnings as _warnings
 
@@ -37,6 +40,7 @@ def fluka2Geant4(
     worldDimensions=None,
     omitBlackholeRegions=True,
     quadricRegionAABBs=None,
+    parallel=0,
     **kwargs,
 ):
     """
@@ -56,6 +60,8 @@ def fluka2Geant4(
     :type omitBlackholeRegions: bool
     :param quadricRegionAABBs: The axis-aligned aabbs of any regions featuring QUA bodies, mapping region names to fluka.AABB instances.
     :type quadricRegionAABBs: dict
+    :param parallel: Number of processes to mesh the zones and build the solids of the regions in (0 or 1 is serial). The result is the same as the serial conversion.
+    :type parallel: int
 
     Developer options (to kwargs) withLengthSafety: Whether or not to apply automatic length safety.
 
@@ -81,7 +87,7 @@ def fluka2Geant4(
         flukareg = _makeLengthSafetyRegistry(flukareg, regions)
 
     if kwargs["minimiseSolids"]:
-        regionZoneAABBs = _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs)
+        regionZoneAABBs = _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs, parallel)
         flukareg, regionZoneAABBs = _filterRegistryNullZones(flukareg, regionZoneAABBs)
         regions = [r for r in regions if r in regionZoneAABBs]
         if not regions:
@@ -103,10 +109,10 @@ def fluka2Geant4(
 
     # After the several steps above transforming the fluka registry, we now
     # take the transformed fluka registry and convert it to a g4 registry.
-    return _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo)
+    return _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo, parallel)
 
 
-def _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo):
+def _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo, parallel=0):
     """
     Convert a transformed fluka registry to a geant4 registry.
     """
@@ -114,9 +120,12 @@ def _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo):
     f2g4mat = _makeFlukaToG4MaterialsMap(flukareg, greg)
     wlv = _makeWorldVolume(_getWorldDimensions(worldinfo.dimensions), worldinfo.material, greg)
     regionNamesToLVs = {}
-    for region in regions:
+
+    regions = list(regions)
+    regionSolids = _regionSolids(regions, greg, aabbinfo.aabbMap, parallel)
+
+    for region, region_solid in zip(regions, regionSolids):
         name = region.name
-        region_solid = region.geant4Solid(greg, aabb=aabbinfo.aabbMap)
 
         try:
             materialName = flukareg.assignmas[name]
@@ -211,13 +220,184 @@ def _makeLengthSafetyRegistry(flukareg, regions):
     return fluka_reg_out
 
 
-def _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs):
+def _regionSolids(regions, greg, aabbMap, parallel=0):
+    """
+    Yield the geant4 solid of each region in turn, added to greg. In parallel the
+    solids are built (and meshed) in a process pool, each region in a registry of its
+    own, and are then transferred to greg in the order of the regions. As in the serial
+    conversion the solid of a body is only made once and shared by all regions using
+    the body. The mesh cache of greg is seeded with the meshes from the workers.
+    """
+    if parallel <= 1 or len(regions) < 2:
+        for region in regions:
+            yield region.geant4Solid(greg, aabb=aabbMap)
+        return
+
+    from pyg4ometry.visualisation import _meshFromVerticesAndPolygons
+
+    global _parallelJobs
+
+    _parallelJobs = [regions, aabbMap]
+    try:
+        ctx = _mp.get_context("fork")
+        with ctx.Pool(parallel) as pool:
+            chunksize = max(1, len(regions) // (4 * parallel))
+            results = pool.imap(_regionSolidWorker, range(len(regions)), chunksize)
+            for defines, solids, solidName, vertices, polygons in results:
+                for data in defines:
+                    greg.addDefine(_loadsRegistryObjects(data, greg, {}))
+
+                data = {name: (isBodySolid, d) for name, isBodySolid, _, d in solids}
+                transferred = {}
+                for name in data:
+                    _transferSolid(name, data, transferred, greg)
+                for name, _, dependents, _ in solids:
+                    transferred[name].dependents.extend(transferred[d] for d in dependents)
+
+                solid = transferred[solidName]
+                if vertices is not None:
+                    greg.meshCache.add(solid, _meshFromVerticesAndPolygons(vertices, polygons))
+                yield solid
+    finally:
+        _parallelJobs = []
+
+
+# regions (and aabbs) shared with the forked worker processes
+_parallelJobs = []
+
+
+def _regionSolidWorker(iRegion):
+    regions, aabbMap = _parallelJobs
+    region = regions[iRegion]
+
+    reg = _g4.Registry()
+    solid = region.geant4Solid(reg, aabb=aabbMap)
+    bodyNames = {body.name for body in region.bodies()}
+
+    vertices = polygons = None
+    if _config.doMeshing:
+        try:
+            vertices, polygons, _ = solid.mesh().toVerticesAndPolygons()
+        except Exception:
+            pass  # meshed again (and the error reported) when making the logical volume
+
+    # each define and solid separately, in the order they were made, with the
+    # (back referencing) dependents of a solid by name
+    defines = [_dumpsRegistryObjects(define, reg) for define in reg.defineDict.values()]
+    solids = [
+        (
+            s.name,
+            s.name in bodyNames,
+            [d.name for d in getattr(s, "dependents", [])],
+            _dumpsRegistryObjects(s, reg),
+        )
+        for s in reg.solidDict.values()
+    ]
+    return defines, solids, solid.name, vertices, polygons
+
+
+def _zoneAABBsWorker(iRegion):
+    regions = _parallelJobs[0]
+    return regions[iRegion].zoneAABBs(aabb=None)
+
+
+def _transferSolid(name, data, transferred, greg):
+    # solids referred to by a solid are transferred first, body solids only once
+    if name not in transferred:
+        isBodySolid, d = data[name]
+        if isBodySolid and name in greg.solidDict:
+            transferred[name] = greg.solidDict[name]
+        else:
+            solids = _SolidTransfer(data, transferred, greg)
+            transferred[name] = _loadsRegistryObjects(d, greg, solids)
+            greg.addSolid(transferred[name])
+    return transferred[name]
+
+
+class _SolidTransfer:
+    # solid lookup for _RegistryUnpickler, transferring solids on demand
+    def __init__(self, data, transferred, greg):
+        self.data = data
+        self.transferred = transferred
+        self.greg = greg
+
+    def __getitem__(self, name):
+        return _transferSolid(name, self.data, self.transferred, self.greg)
+
+
+class _RegistryPickler(_pickle.Pickler):
+    # the registry and the other solids and defines in it are pickled as references and
+    # the dependents of the object as an empty list
+    def __init__(self, file, registry, obj):
+        super().__init__(file, _pickle.HIGHEST_PROTOCOL)
+        self.registry = registry
+        self.obj = obj
+
+    def persistent_id(self, obj):
+        if obj is self.registry:
+            return ("registry",)
+        if obj is self.obj:
+            return None
+        if obj is getattr(self.obj, "dependents", None):
+            return ("dependents",)
+        name = getattr(obj, "name", None)
+        if not isinstance(name, str):
+            return None
+        if self.registry.solidDict.get(name) is obj:
+            return ("solid", name)
+        if self.registry.defineDict.get(name) is obj:
+            return ("define", name)
+        return None
+
+
+class _RegistryUnpickler(_pickle.Unpickler):
+    def __init__(self, file, registry, solids):
+        super().__init__(file)
+        self.registry = registry
+        self.solids = solids
+
+    def persistent_load(self, pid):
+        if pid[0] == "registry":
+            return self.registry
+        elif pid[0] == "solid":
+            return self.solids[pid[1]]
+        elif pid[0] == "define":
+            return self.registry.defineDict[pid[1]]
+        elif pid[0] == "dependents":
+            return []
+        msg = f"Unknown persistent id {pid}"
+        raise _pickle.UnpicklingError(msg)
+
+
+def _dumpsRegistryObjects(obj, registry):
+    """
+    Pickle a geant4 solid or define of a registry, referring to the registry and to
+    the other solids and defines in it by name.
+    """
+    f = _io.BytesIO()
+    _RegistryPickler(f, registry, obj).dump(obj)
+    return f.getvalue()
+
+
+def _loadsRegistryObjects(data, registry, solids):
+    """
+    Unpickle a solid or define from _dumpsRegistryObjects into registry, where solids
+    maps the names of the solids referred to to their solids.
+    """
+    return _RegistryUnpickler(_io.BytesIO(data), registry, solids).load()
+
+
+def _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs, parallel=0):
     """Loop over the regions, and for each region, get all the aabbs
     of the zones belonging to that region.  Don't do this for
     quadricRegionAABBs, instead, just continue to use the aabb
-    provided by the user."""
+    provided by the user.  With parallel > 1 the zones are meshed
+    in a process pool."""
+
+    global _parallelJobs
 
     regionZoneAABBs = {}
+    parallelRegions = []
     for name, region in flukareg.regionDict.items():
         if name in quadricRegionAABBs:
             # We choose to use the quadricRegionAABBs rather than
@@ -240,8 +420,24 @@ def _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs):
             continue
         elif name not in regions:
             continue
+        elif parallel > 1:
+            regionZoneAABBs[name] = None  # filled in below, keeping the serial order
+            parallelRegions.append((name, region))
         else:
             regionZoneAABBs[name] = region.zoneAABBs(aabb=None)
+
+    if parallelRegions:
+        _parallelJobs = [[region for _, region in parallelRegions]]
+        try:
+            ctx = _mp.get_context("fork")
+            with ctx.Pool(parallel) as pool:
+                chunksize = max(1, len(parallelRegions) // (4 * parallel))
+                results = pool.map(_zoneAABBsWorker, range(len(parallelRegions)), chunksize)
+        finally:
+            _parallelJobs = []
+        for (name, _), zoneAABBs in zip(parallelRegions, results):
+            regionZoneAABBs[name] = zoneAABBs
+
     return regionZoneAABBs
 
 
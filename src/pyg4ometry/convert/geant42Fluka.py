@@ -6,6 +6,7 @@ from pyg4ometry.pycgal.core import PolygonProcessing as _PolygonProcessing
 from pyg4ometry.fluka.directive import (
     rotoTranslationFromTra2 as _rotoTranslationFromTra2,
 )
+from pyg4ometry.fluka.fluka_registry import RotoTranslationStore as _RotoTranslationStore
 import numpy as _np
 import copy as _copy
 import scipy.linalg as _la
@@ -108,23 +109,29 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None):
         )
         return
 
-    flukaMotherRegion = _copy.deepcopy(flukaMotherOuterRegion)
+    flukaMotherRegion = flukaMotherOuterRegion.copy()
     flukaNameCount += 1
+    solidRegionCache = SolidRegionCache()
 
     for zone in flukaMotherOuterRegion.zones:
         fzone.addSubtraction(zone)
 
+    placementTree = logicalVolume.placementTree()
+    daughterNodes = _daughterNodes(placementTree, 0)
+
     for dv in logicalVolume.daughterVolumes:
-        pvmrot = _transformation.tbzyx2matrix(-_np.array(dv.rotation.eval()))
-        pvtra = _np.array(dv.position.eval())
-        reflection = _np.diag([1, 1, 1])
-        if dv.scale:
-            reflection = _np.diag([dv.scale.eval()[0], dv.scale.eval()[1], dv.scale.eval()[2]])
-        new_mtra = mtra @ pvmrot @ reflection
-        new_tra = mtra @ reflection @ pvtra + tra
+        node = daughterNodes.get(id(dv))
+        new_mtra, new_tra = _placementTransform(dv, mtra, tra, placementTree, node)
 
         flukaDaughterOuterRegion, flukaNameCount = geant4PhysicalVolume2Fluka(
-            dv, new_mtra, new_tra, flukaRegistry, flukaNameCount
+            dv,
+            new_mtra,
+            new_tra,
+            flukaRegistry,
+            flukaNameCount,
+            solidRegionCache,
+            placementTree,
+            node,
         )
 
         # subtract daughters from black body
@@ -164,17 +171,62 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None):
     return flukaRegistry
 
 
+def _daughterNodes(placementTree, node):
+    """
+    Map of id(physicalVolume) to placement tree node of the daughters of a node.
+    """
+    if placementTree is None or node is None:
+        return {}
+    return {id(placementTree.physicalVolumes[i]): i for i in placementTree.children(node)}
+
+
+def _placementTransform(dv, mtra, tra, placementTree=None, node=None):
+    """
+    Rotation and translation of the placement dv in a mother placed with mtra and
+    tra. The (reflected) local transform is read from node of the placement tree
+    if given and evaluated from the placement otherwise.
+    """
+    if placementTree is not None and node is not None:
+        pvmrot = placementTree.localRotations[node]  # includes the reflection
+        pvtra = placementTree.scales[node] * placementTree.localTranslations[node]
+    else:
+        reflection = _np.diag([1, 1, 1])
+        if dv.scale:
+            reflection = _np.diag([dv.scale.eval()[0], dv.scale.eval()[1], dv.scale.eval()[2]])
+        pvmrot = _transformation.tbzyx2matrix(-_np.array(dv.rotation.eval())) @ reflection
+        pvtra = reflection @ _np.array(dv.position.eval())
+
+    return mtra @ pvmrot, mtra @ pvtra + tra
+
+
 def geant4PhysicalVolume2Fluka(
     physicalVolume,
     mtra=_np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),
     tra=_np.array([0, 0, 0]),
     flukaRegistry=None,
     flukaNameCount=0,
+    solidRegionCache=None,
+    placementTree=None,
+    node=None,
 ):
+    """
+    Convert a physical volume and its daughters placed with the rotation matrix mtra
+    and translation tra.
+
+    :param solidRegionCache: regions of solids already converted, shared by all placements
+    :type solidRegionCache: SolidRegionCache
+    :param placementTree: tree the daughter placement transforms are read from
+    :type placementTree: PlacementTree
+    :param node: index of physicalVolume in placementTree
+    :type node: int
+    """
+    if solidRegionCache is None:
+        solidRegionCache = SolidRegionCache()
+
     # logical volume (outer and complete)
     if physicalVolume.logicalVolume.type == "logical":
         geant4LvOuterSolid = physicalVolume.logicalVolume.solid
-        flukaMotherOuterRegion, flukaNameCount = geant4Solid2FlukaRegion(
+        flukaMotherOuterRegion, flukaNameCount = solidRegionCache.region(
             flukaNameCount,
             geant4LvOuterSolid,
             mtra,
@@ -199,7 +251,7 @@ def geant4PhysicalVolume2Fluka(
         # z = _fluka.Zone()
         # flukaMotherOuterRegion.addZone(z)
 
-    flukaMotherRegion = _copy.deepcopy(flukaMotherOuterRegion)
+    flukaMotherRegion = flukaMotherOuterRegion.copy()
     flukaMotherRegion.comment = physicalVolume.name
 
     # Check if we have a replica - a replica is a special case where we have an in-effect dummy mother
@@ -218,19 +270,15 @@ def geant4PhysicalVolume2Fluka(
         # this unintentionally adds the PVs to the mother LV
         daughterVolumes, transforms = replica.getPhysicalVolumes()
         for dv in daughterVolumes:
-            pvmrot = _transformation.tbzyx2matrix(-_np.array(dv.rotation.eval()))
-            pvtra = _np.array(dv.position.eval())
-            reflection = _np.diag([1, 1, 1])
-            if dv.scale:
-                reflection = _np.diag([dv.scale.eval()[0], dv.scale.eval()[1], dv.scale.eval()[2]])
-            new_mtra = mtra @ pvmrot @ reflection
-            new_tra = mtra @ reflection @ pvtra + tra
+            # temporary placements, not in the placement tree
+            new_mtra, new_tra = _placementTransform(dv, mtra, tra)
             flukaDaughterOuterRegion, flukaNameCount = geant4PhysicalVolume2Fluka(
                 dv,
                 new_mtra,
                 new_tra,
                 flukaRegistry=flukaRegistry,
                 flukaNameCount=flukaNameCount,
+                solidRegionCache=solidRegionCache,
             )
 
         materialName = daughterVolumes[0].logicalVolume.material.name
@@ -242,16 +290,13 @@ def geant4PhysicalVolume2Fluka(
         except KeyError:
             pass
     else:
+        daughterNodes = _daughterNodes(placementTree, node)
+
         # loop over daughters and remove from mother region
         for dv in physicalVolume.logicalVolume.daughterVolumes:
             # placement information for daughter
-            pvmrot = _transformation.tbzyx2matrix(-_np.array(dv.rotation.eval()))
-            pvtra = _np.array(dv.position.eval())
-            reflection = _np.diag([1, 1, 1])
-            if dv.scale:
-                reflection = _np.diag([dv.scale.eval()[0], dv.scale.eval()[1], dv.scale.eval()[2]])
-            new_mtra = mtra @ pvmrot @ reflection
-            new_tra = mtra @ reflection @ pvtra + tra
+            daughterNode = daughterNodes.get(id(dv))
+            new_mtra, new_tra = _placementTransform(dv, mtra, tra, placementTree, daughterNode)
 
             flukaDaughterOuterRegion, flukaNameCount = geant4PhysicalVolume2Fluka(
                 dv,
@@ -259,6 +304,9 @@ def geant4PhysicalVolume2Fluka(
                 new_tra,
                 flukaRegistry=flukaRegistry,
                 flukaNameCount=flukaNameCount,
+                solidRegionCache=solidRegionCache,
+                placementTree=placementTree,
+                node=daughterNode,
             )
             if physicalVolume.logicalVolume.type == "logical":
                 for motherZones in flukaMotherRegion.zones:
@@ -283,6 +331,159 @@ def geant4PhysicalVolume2Fluka(
     return flukaMotherOuterRegion, flukaNameCount
 
 
+def _reflectionSigns(mtra):
+    """
+    Diagonal of R in the QR decomposition of a rotation matrix, used as the
+    reflection of each axis by the ExtrudedSolid conversion.
+    """
+    rotation, reflection = _np.linalg.qr(mtra)
+    return (reflection.item(0, 0), reflection.item(1, 1), reflection.item(2, 2))
+
+
+class _TemplateFlukaRegistry(_fluka.FlukaRegistry):
+    """
+    Registry of SolidRegionCache templates, recording the bodies made through the
+    deduplicating makeBody.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.madeBodies = set()
+
+    def makeBody(self, clas, *args, **kwargs):
+        body = super().makeBody(clas, *args, **kwargs)
+        self.madeBodies.add(id(body))
+        return body
+
+
+class SolidRegionCache:
+    """
+    FLUKA regions of solids converted once in their local frame and then placed
+    by cloning. The zone decomposition of a solid (which can mean meshing and a
+    convex decomposition) is done only for the first placement of the solid. For
+    every placement the bodies are copied with new names and with the placement
+    rotation and translation composed with their local transform. Bodies made with
+    makeBody are placed through getDegenerateBody, so equal bodies are shared as
+    by the direct conversion.
+
+    The bodies of an ExtrudedSolid depend on the signs of the diagonal of R in
+    the QR decomposition of its rotation matrix (see _reflectionSigns), which
+    composing transforms does not preserve (e.g. a reflection or a half turn).
+    The axis of the TRC bodies of a Cons is rotated by its placement rotation
+    (as well as by its transform). Placements changing either are converted
+    without the cache.
+    """
+
+    _commentMarker = "\0"
+
+    def __init__(self):
+        self._templates = {}  # key -> (solid, template)
+        self._registry = None
+
+    @staticmethod
+    def _key(solid):
+        return (id(solid), getattr(solid, "nslice", None), getattr(solid, "nstack", None))
+
+    def region(self, flukaNameCount, solid, mtra, tra, flukaRegistry, commentName=""):
+        """
+        Same as geant4Solid2FlukaRegion(flukaNameCount, solid, mtra, tra, \
+        flukaRegistry, commentName=commentName).
+        """
+        key = self._key(solid)
+        try:
+            template = self._templates[key][1]
+        except KeyError:
+            template = self._makeTemplate(solid)
+            self._templates[key] = (solid, template)
+
+        if template is None or not self._placeable(template, mtra):
+            return geant4Solid2FlukaRegion(
+                flukaNameCount, solid, mtra, tra, flukaRegistry, commentName=commentName
+            )
+
+        return self._place(template, flukaNameCount, mtra, tra, flukaRegistry, commentName)
+
+    def _makeTemplate(self, solid):
+        if self._registry is None:
+            self._registry = _TemplateFlukaRegistry()
+        # fresh stores, so only the bodies of this solid are in the registry
+        self._registry.bodyDict = _fluka.FlukaBodyStoreExact()
+        self._registry.rotoTranslations = _RotoTranslationStore()
+        self._registry.madeBodies = set()
+
+        transforms = []
+        region, nNames = geant4Solid2FlukaRegion(
+            0,
+            solid,
+            _np.identity(3),
+            _np.zeros(3),
+            self._registry,
+            commentName=self._commentMarker,
+            transforms=transforms,
+        )
+
+        # name count offset of each transform name
+        offsets = {"T" + format(offset, "04"): offset for offset, _, _, _ in transforms}
+
+        bodies = []
+        for body in self._registry.bodyDict.values():
+            offset = offsets.get(getattr(body.transform, "name", None))
+            prefix = "B" + format(offset, "04") if offset is not None else None
+            if prefix is None or not body.name.startswith(prefix):
+                return None
+            made = id(body) in self._registry.madeBodies
+            bodies.append((body, offset, body.name[len(prefix) :], made))
+
+        if region.name != "R0000":
+            return None
+        if not region.bodies() <= {body for body, _, _, _ in bodies}:
+            return None
+
+        return region, bodies, transforms, nNames
+
+    @staticmethod
+    def _placeable(template, mtra):
+        for _, lmtra, _, solidType in template[2]:
+            if solidType == "ExtrudedSolid":
+                signs = _np.sign(_reflectionSigns(lmtra))
+                if (_np.sign(_reflectionSigns(mtra @ lmtra)) != signs).any():
+                    return False
+            elif solidType == "Cons":
+                if not (mtra @ lmtra == lmtra).all():
+                    return False
+        return True
+
+    def _place(self, template, flukaNameCount, mtra, tra, flukaRegistry, commentName):
+        region, bodies, transforms, nNames = template
+
+        placed = {}
+        for offset, lmtra, ltra, _ in transforms:
+            m = mtra @ lmtra
+            t = mtra @ ltra + tra
+            placed[offset] = _rotoTranslationFromTra2(
+                "T" + format(flukaNameCount + offset, "04"),
+                [_transformation.matrix2tbxyz(m), t],
+                flukaregistry=flukaRegistry,
+            )
+
+        clones = {}
+        for body, offset, suffix, made in bodies:
+            clone = _copy.copy(body)
+            clone.name = "B" + format(flukaNameCount + offset, "04") + suffix
+            clone.transform = placed[offset]
+            if clone.comment.startswith(self._commentMarker):
+                clone.comment = commentName + clone.comment[len(self._commentMarker) :]
+            if made:
+                # an equal body already in the registry is used instead
+                clone = flukaRegistry.getDegenerateBody(clone)
+            else:
+                flukaRegistry.addBody(clone)
+            clones[id(body)] = clone
+
+        fregion = region.copy("R" + format(flukaNameCount, "04"), clones)
+        return fregion, flukaNameCount + nNames
+
+
 def geant4Solid2FlukaRegion(
     flukaNameCount,
     solid,
@@ -291,7 +492,16 @@ def geant4Solid2FlukaRegion(
     flukaRegistry=None,
     addRegistry=True,
     commentName="",
+    transforms=None,
 ):
+    """
+    Convert a solid to a FLUKA region of zones of bodies, placed with the rotation
+    matrix mtra and translation tra.
+
+    :param transforms: optional list to which (flukaNameCount, mtra, tra, solid.type) of \
+    this conversion and of all nested ones (boolean constituents) are appended
+    :type transforms: list
+    """
     import pyg4ometry.gdml.Units as _Units  # TODO move circular import
 
     name = format(flukaNameCount, "04")
@@ -299,17 +509,14 @@ def geant4Solid2FlukaRegion(
     fregion = None
     fbodies = []
 
-    rotation, reflection = _np.linalg.qr(mtra)
-    gdmlReflection = [
-        reflection.item(0, 0),
-        reflection.item(1, 1),
-        reflection.item(2, 2),
-    ]
+    gdmlReflection = _reflectionSigns(mtra)
 
     rotation = _transformation.matrix2tbxyz(mtra)
     position = tra
 
     transform = _rotoTranslationFromTra2("T" + name, [rotation, tra], flukaregistry=flukaRegistry)
+    if transforms is not None:
+        transforms.append((flukaNameCount, mtra, tra, solid.type))
 
     commentName = commentName + " " + solid.name
 
@@ -1811,6 +2018,7 @@ def geant4Solid2FlukaRegion(
             flukaRegistry,
             False,
             commentName=commentName,
+            transforms=transforms,
         )
         r2, flukaNameCount = geant4Solid2FlukaRegion(
             flukaNameCount,
@@ -1820,6 +2028,7 @@ def geant4Solid2FlukaRegion(
             flukaRegistry,
             False,
             commentName=commentName,
+            transforms=transforms,
         )
 
         if 0:
@@ -1863,6 +2072,7 @@ def geant4Solid2FlukaRegion(
             flukaRegistry,
             False,
             commentName=commentName,
+            transforms=transforms,
         )
         r2, flukaNameCount = geant4Solid2FlukaRegion(
             flukaNameCount,
@@ -1872,6 +2082,7 @@ def geant4Solid2FlukaRegion(
             flukaRegistry,
             False,
             commentName=commentName,
+            transforms=transforms,
         )
 
         if 0:
@@ -1917,6 +2128,7 @@ def geant4Solid2FlukaRegion(
             flukaRegistry,
             False,
             commentName=commentName,
+            transforms=transforms,
         )
         r2, flukaNameCount = geant4Solid2FlukaRegion(
             flukaNameCount,
@@ -1926,6 +2138,7 @@ def geant4Solid2FlukaRegion(
             flukaRegistry,
             False,
             commentName=commentName,
+            transforms=transforms,
         )
 
         if 0:
@@ -1953,6 +2166,7 @@ def geant4Solid2FlukaRegion(
             flukaRegistry=flukaRegistry,
             addRegistry=True,
             commentName=solid.name,
+            transforms=transforms,
         )
         # flukaRegistry.regionDict.pop(fregion.name)
         print(fregion.name, flukaRegistry.regionDict.keys())
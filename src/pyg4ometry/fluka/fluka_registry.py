@@ -5,7 +5,6 @@ from collections.abc import MutableMapping as _MutableMapping
 from itertools import count as _count
 
 import numpy as _np
-import pandas as _pd
 import pyg4ometry.geant4 as _g4
 from .region import Region as _Region
 from .region import bracket_depth as _bracket_depth
@@ -541,10 +540,17 @@ class RotoTranslationStore(_MutableMapping):
 
 
 class FlukaBodyStore(_MutableMapping):
+    """
+    Bodies by name, which also finds degenerate bodies: half spaces and infinite
+    cylinders equal to an already stored one within numpy.isclose tolerances. These
+    are indexed in a spatial hash of their plane or axis parameters, so adding,
+    looking up and matching bodies are O(1) amortised.
+    """
+
     def __init__(self):
-        self._df = _pd.DataFrame()
-        hscacher = HalfSpaceCacher(self._df)
-        infCylCacher = InfiniteCylinderCacher(self._df)
+        self._bodyDict = {}
+        hscacher = HalfSpaceCacher(self._bodyDict)
+        infCylCacher = InfiniteCylinderCacher(self._bodyDict)
 
         self._cachers = {
             _body.XZP: hscacher,
@@ -555,13 +561,13 @@ class FlukaBodyStore(_MutableMapping):
             _body.YCC: infCylCacher,
             _body.ZCC: infCylCacher,
         }
-        self._basecacher = BaseCacher(self._df)
+        self._basecacher = BaseCacher(self._bodyDict)
 
     def _bodyNames(self):
-        return list(self._df["name"])
+        return list(self._bodyDict.keys())
 
     def _bodies(self):
-        return list(self._df["body"])
+        return list(self._bodyDict.values())
 
     def _getCacherFromBody(self, body):
         return self._cachers.get(type(body), self._basecacher)
@@ -590,13 +596,14 @@ class FlukaBodyStore(_MutableMapping):
         c.setBody(value)
 
     def __getitem__(self, key):
-        if key not in self._bodyNames():
+        try:
+            return self._bodyDict[key]
+        except KeyError:
             msg = f"Undefined body: {key}"
             raise _FLUKAError(msg)
-        return self._df[self._df["name"] == key]["body"].item()
 
     def __delitem__(self, key):
-        if key not in self._bodyNames():
+        if key not in self._bodyDict:
             msg = f"Missing body name: {key}"
             raise KeyError(msg)
 
@@ -604,55 +611,37 @@ class FlukaBodyStore(_MutableMapping):
         self._getCacherFromBody(body).remove(key)
 
     def __len__(self):
-        return len(self._df)
+        return len(self._bodyDict)
 
     def __contains__(self, key):
-        return key in self._bodyNames()
+        return key in self._bodyDict
 
     def __iter__(self):
-        return iter(self._bodyNames())
+        return iter(self._bodyDict)
 
     def __repr__(self):
-        return repr(dict(zip(self._bodyNames(), self._bodies())))
+        return repr(dict(self._bodyDict))
 
 
 class BaseCacher:
-    COLUMNS = ["name", "body"]
-
-    def __init__(self, df):
-        self.df = df
-        for column in self.COLUMNS:
-            try:
-                self.df.insert(len(self.df), column, [])
-            except ValueError:  # already added the column maybe
-                pass
-
-    def appendData(self, variables):
-        df = _pd.DataFrame([variables], columns=self.COLUMNS)
-        self.df.loc[len(self.df.index)] = df.iloc[0]
+    def __init__(self, bodyDict):
+        self.bodyDict = bodyDict
 
     def append(self, body):
-        name = body.name
-        df = _pd.DataFrame([[name, body]], columns=self.COLUMNS)
-        self.df.loc[len(self.df.index)] = df.iloc[0]
+        self.bodyDict[body.name] = body
 
     def setBody(self, body):
-        name = body.name
-        if name not in self.df["name"]:
+        if body.name not in self.bodyDict:
             self.append(body)
         else:
-            rowIndex = self.df[self.df["name"] == name].index
             msg = "operation not implemented"
             raise NotImplementedError(msg)
 
     def addBody(self, body):
-        name = body.name
-        df = _pd.DataFrame([[name, body]], columns=self.COLUMNS)
-        self.df.loc[len(self.df.index)] = df.iloc[0]
+        self.append(body)
 
     def remove(self, key):
-        rowIndex = self.df[self.df["name"] == key].index
-        self.df.drop(rowIndex, inplace=True)
+        del self.bodyDict[key]
 
     def make(self, clas, *args, **kwargs):
         body = clas(*args, **kwargs)
@@ -666,59 +655,151 @@ class BaseCacher:
         return f"<{type(self).__name__}>"
 
 
+class ToleranceHash:
+    """
+    Spatial hash of parameter vectors in which vectors that are numpy.isclose
+    (componentwise, default tolerances) fall in the same or neighbouring buckets.
+
+    Each component x is mapped to sign(x) * log(1 + |x| / s) with s = atol / rtol. In
+    this space the isclose tolerance atol + rtol * |x| is at most rtol / (1 - rtol)
+    everywhere. Buckets are much wider than that, so a neighbouring bucket is only
+    searched for components close to a bucket edge.
+    """
+
+    rtol = 1e-5
+    atol = 1e-8
+    bucketWidth = 100 * rtol
+    edgeWidth = 2 * rtol
+
+    def __init__(self):
+        self._buckets = {}  # key -> list of items
+
+    def _scaled(self, values):
+        values = _np.asarray(values, dtype=float).ravel()
+        scaled = _np.sign(values) * _np.log1p(_np.abs(values) * (self.rtol / self.atol))
+        return scaled / self.bucketWidth
+
+    def key(self, values):
+        return tuple(_np.floor(self._scaled(values)).astype(int).tolist())
+
+    def keys(self, values):
+        """
+        Keys of all buckets that can hold vectors close to values.
+        """
+        scaled = self._scaled(values)
+        bucket = _np.floor(scaled)
+        frac = scaled - bucket
+        edge = self.edgeWidth / self.bucketWidth
+
+        keys = [()]
+        for b, f in zip(bucket.astype(int).tolist(), frac.tolist()):
+            options = [b]
+            if f < edge:
+                options.append(b - 1)
+            elif f > 1 - edge:
+                options.append(b + 1)
+            keys = [(*k, o) for k in keys for o in options]
+        return keys
+
+    def add(self, values, item):
+        self._buckets.setdefault(self.key(values), []).append(item)
+
+    def remove(self, values, item):
+        key = self.key(values)
+        bucket = self._buckets[key]
+        bucket.remove(item)
+        if not bucket:
+            del self._buckets[key]
+
+    def candidates(self, values):
+        for key in self.keys(values):
+            yield from self._buckets.get(key, [])
+
+
 class Cacheable(BaseCacher):
+    """
+    Cacher of bodies that are degenerate when their parameters (see parameters) are
+    close, indexed in a ToleranceHash.
+    """
+
+    def __init__(self, bodyDict):
+        super().__init__(bodyDict)
+        self._hash = ToleranceHash()
+        self._parameters = {}  # name -> parameters
+        self._order = _count()
+        self._index = {}  # name -> insertion index
+
+    def append(self, body):
+        super().append(body)
+        parameters = self.parameters(body)
+        self._parameters[body.name] = parameters
+        self._index[body.name] = next(self._order)
+        self._hash.add(self.hashValues(parameters), body.name)
+
+    def remove(self, key):
+        parameters = self._parameters.pop(key)
+        del self._index[key]
+        self._hash.remove(self.hashValues(parameters), key)
+        super().remove(key)
+
     def getDegenerateBody(self, body):
-        mask = self.mask(body)
-        if not mask.any():  # i.e. this half space has not been defined before.
+        parameters = self.parameters(body)
+
+        matches = set()
+        for values in self.queryValues(parameters):
+            for name in self._hash.candidates(values):
+                if self.isDegenerate(self._parameters[name], parameters):
+                    matches.add(name)
+
+        if not matches:  # i.e. this body has not been defined before.
             self.append(body)
             return body
-        result = self.df[mask]["body"].item()
-        return result  # self.df[mask]["body"].item()
-
-    def getMask(self, columns, values, predicates):
-        if self.df.empty:
-            return _np.array([], dtype=bool)
-        mask = _np.full_like(self.df["name"], True, dtype=bool)
-        for column, value, predicate in zip(columns, values, predicates):
-            mask &= self.df[column].apply(
-                lambda x, value=value, predicate=predicate: predicate(x, _np.array(value)).all()
-            )
-        return mask
+        return self.bodyDict[min(matches, key=self._index.__getitem__)]
 
+    def hashValues(self, parameters):
+        return _np.concatenate([_np.ravel(p) for p in parameters])
 
-class HalfSpaceCacher(Cacheable):
-    COLUMNS = ["name", "body", "planeNormal", "pointOnPlane"]
+    def queryValues(self, parameters):
+        return [self.hashValues(parameters)]
 
-    def append(self, body):
-        name = body.name
-        normal, point = body.toPlane()
-        super().appendData([name, body, _np.array(normal), _np.array(point)])
 
-    def mask(self, body):
+class HalfSpaceCacher(Cacheable):
+    def parameters(self, body):
         normal, point = body.toPlane()
-        return self.getMask(
-            ["planeNormal", "pointOnPlane"], [normal, point], [_np.isclose, _np.isclose]
-        )
+        return [_np.array(normal), _np.array(point)]
 
+    def isDegenerate(self, stored, parameters):
+        return all(_np.isclose(s, p).all() for s, p in zip(stored, parameters))
 
-class InfiniteCylinderCacher(Cacheable):
-    COLUMNS = ["name", "body", "direction", "pointOnLine", "radius"]
 
-    def append(self, body):
-        super().appendData(
-            [body.name, body, body.direction(), self._cylinderPoint(body), body.radius]
+class InfiniteCylinderCacher(Cacheable):
+    def parameters(self, body):
+        direction = _np.array(body.direction())
+        return [direction, self._cylinderPoint(body), _np.array([body.radius])]
+
+    def isDegenerate(self, stored, parameters):
+        return (
+            _vector.areParallelOrAntiParallel(stored[0], parameters[0])
+            and _np.isclose(stored[1], parameters[1]).all()
+            and _np.isclose(stored[2], parameters[2]).all()
         )
 
-    def mask(self, body):
-        return self.getMask(
-            ["direction", "pointOnLine", "radius"],
-            [body.direction(), self._cylinderPoint(body), body.radius],
-            [_vector.areParallelOrAntiParallel, _np.isclose, _np.isclose],
-        )
+    def hashValues(self, parameters):
+        direction = parameters[0] / _np.linalg.norm(parameters[0])
+        return super().hashValues([direction, *parameters[1:]])
+
+    def queryValues(self, parameters):
+        # anti-parallel directions are degenerate too
+        return [
+            self.hashValues(parameters),
+            self.hashValues([-parameters[0], *parameters[1:]]),
+        ]
 
     @staticmethod
     def _cylinderPoint(body):
-        return _vector.pointOnLineClosestToPoint([0, 0, 0], body.point(), body.direction())
+        return _np.array(
+            _vector.pointOnLineClosestToPoint([0, 0, 0], body.point(), body.direction())
+        )
 
 
 class FlukaBodyStoreExact:
@@ -734,6 +815,8 @@ class FlukaBodyStoreExact:
         return list(self.nameBody.values())
 
     def make(self, cls, *args, **kwargs):
+        # not added by the constructor, so an existing equal body can be returned instead
+        kwargs.pop("flukaregistry", None)
         body = cls(*args, **kwargs)
         return self.getDegenerateBody(body)
 
@@ -749,9 +832,10 @@ class FlukaBodyStoreExact:
             raise _IdenticalNameError(body.name)
         logger.debug("%s", body)
 
+        bodyHash = body.hash()
         self.nameBody[body.name] = body
-        self.hashBody[body.hash()] = body
-        self.hashName[body.hash()] = body.name
+        self.hashBody[bodyHash] = body
+        self.hashName[bodyHash] = body.name
 
     def keys(self):
         return self._bodyNames()
@@ -766,13 +850,13 @@ class FlukaBodyStoreExact:
         # c.setBody(value)
 
     def __getitem__(self, key):
-        if key not in self._bodyNames():
+        if key not in self.nameBody:
             msg = f"Undefined body: {key}"
             raise _FLUKAError(msg)
         return self.nameBody[key]
 
     def __delitem__(self, key):
-        if key not in self._bodyNames():
+        if key not in self.nameBody:
             msg = f"Missing body name: {key}"
             raise KeyError(msg)
 
@@ -785,7 +869,7 @@ class FlukaBodyStoreExact:
         return len(self.nameBody)
 
     def __contains__(self, key):
-        return key in self._bodyNames()
+        return key in self.nameBody
 
     def __iter__(self):
         return iter(self._bodies())
@@ -1,4 +1,3 @@
-import itertools
 import logging
 from copy import deepcopy
 from uuid import uuid4
@@ -13,18 +12,18 @@ from pyg4ometry.exceptions import FLUKAError, NullMeshError
 import pyg4ometry.geant4 as g4
 from pyg4ometry.transformation import matrix2tbxyz, tbxyz2matrix, reverse
 from pyg4ometry.fluka.body import BodyMixin
-from .vector import Three, AABB, areAABBsOverlapping
+from .vector import Three, AABB
 from . import boolean_algebra
 from pyg4ometry.transformation import tbxyz2axisangle
+from pyg4ometry.meshutils import sweepAndPrune as _sweepAndPrune
+from pyg4ometry.meshutils import pointsInsideMesh as _pointsInsideMesh
 
 import pyg4ometry.config as _config
 
 if _config.meshing == _config.meshingType.pycsg:
     from pyg4ometry.pycsg.core import CSG, do_intersect
 elif _config.meshing == _config.meshingType.cgal_sm:
-    pass
-    # TODO reinstate intersecting meshes
-    # from pyg4ometry.pycgal.core import CSG, do_intersect, intersecting_meshes
+    from pyg4ometry.pycgal.core import do_intersect
 
 from textwrap import wrap as _wrap
 
@@ -185,6 +184,29 @@ class Zone(vis.ViewableMixin):
         """
         self.intersections.append(Intersection(body))
 
+    def copy(self, bodies=None):
+        """
+        Copy of this zone and its subzones which shares the bodies with this zone,
+        so the copy can be changed independently without copying any body.
+
+        :param bodies: optional map of id(body) to the body to use instead in the copy
+        :type bodies: dict
+        """
+        zone = Zone(self.name)
+        for booleans, add in [
+            (self.intersections, zone.addIntersection),
+            (self.subtractions, zone.addSubtraction),
+        ]:
+            for boolean in booleans:
+                body = boolean.body
+                if isinstance(body, Zone):
+                    add(body.copy(bodies))
+                elif bodies is not None:
+                    add(bodies.get(id(body), body))
+                else:
+                    add(body)
+        return zone
+
     def convertToDNF(self, fluka_registry):
         zone = Zone()
 
@@ -565,6 +587,20 @@ class Region(vis.ViewableMixin):
         """
         self.zones.append(zone)
 
+    def copy(self, name=None, bodies=None):
+        """
+        Copy of this region and its zones which shares the bodies with this region.
+
+        :param name: optional name of the copy, otherwise the name of this region
+        :type name: str
+        :param bodies: optional map of id(body) to the body to use instead in the copy
+        :type bodies: dict
+        """
+        region = Region(self.name if name is None else name, comment=self.comment)
+        for zone in self.zones:
+            region.addZone(zone.copy(bodies))
+        return region
+
     def addIntersection(self, zone):
         for z in self.zones:
             z.addIntersection(zone)
@@ -690,57 +726,86 @@ class Region(vis.ViewableMixin):
             zone.allBodiesToRegistry(registry)
 
     def zoneGraph(self, zoneAABBs=None, aabb=None):
-        if _config.meshing == _config.meshingType.cgal_sm:
-            return self._zoneGraphPycgal()
-
+        """
+        Graph of the zones (by index) of this region with an edge between zones
+        that are connected. Candidate pairs of zones with overlapping AABBs are
+        found by sort and sweep and are only intersected if they are not already
+        known to be connected (union-find). Each zone is meshed at most once.
+        Zones whose surfaces do not intersect are still connected if one is
+        nested inside the other.
+
+        :param zoneAABBs: optional list of AABBs of the zones (None for null zones)
+        :type zoneAABBs: list of AABB
+        :param aabb: aabb used for meshing the zones
+        :type aabb: AABB
+        """
         zones = self.zones
         n_zones = len(zones)
 
-        tried = []
         # Build undirected graph, and add nodes corresponding to each zone.
         graph = nx.Graph()
         graph.add_nodes_from(range(n_zones))
         if n_zones == 1:  # return here if there's only one zone.
-            return nx.connected_components(graph)
+            return graph
 
-        # We allow the user to provide a list of zoneAABBs as an
-        # optimisation, but if they have not been provided, then we
-        # will generate them here
-        if zoneAABBs is None:
-            zoneAABBs = self.zoneAABBs(aabb=aabb)
+        meshes = {}
 
-        # Loop over all combinations of zone numbers within this region
-        for i, j in itertools.product(range(n_zones), range(n_zones)):
-            # Trivially connected to self or tried this combination.
-            if i == j or {i, j} in tried:
-                continue
-            tried.append({i, j})
+        def zoneMesh(i):
+            if i not in meshes:
+                meshes[i] = zones[i].mesh(aabb=aabb)
+            return meshes[i]
 
-            # Check if the bounding boxes overlap.  Cheaper than intersecting.
-            if not areAABBsOverlapping(zoneAABBs[i], zoneAABBs[j]):
-                continue
+        def isNested(i, j):
+            # surfaces do not intersect, so zone i is inside zone j if any vertex is
+            vertices, _ = zoneMesh(i).toVerticesAndFaces()
+            if len(vertices) == 0:
+                return False
+            return bool(_pointsInsideMesh(vertices[:1], *zoneMesh(j).toVerticesAndFaces())[0])
 
-            # Check if a path already exists.  Not sure how often this
-            # arises but should at least occasionally save some time.
-            if nx.has_path(graph, i, j):
+        # We allow the user to provide a list of zoneAABBs as an
+        # optimisation, but if they have not been provided, then we
+        # will generate them here (from the meshes used below)
+        if zoneAABBs is None:
+            zoneAABBs = []
+            for i in range(n_zones):
+                try:
+                    zoneAABBs.append(AABB.fromMesh(zoneMesh(i)))
+                except ValueError:
+                    zoneAABBs.append(None)
+
+        # null zones are connected to nothing
+        indices = [i for i, zoneAABB in enumerate(zoneAABBs) if zoneAABB is not None]
+        aabbMin = np.array([zoneAABBs[i].lower for i in indices], dtype=float).reshape(-1, 3)
+        aabbMax = np.array([zoneAABBs[i].upper for i in indices], dtype=float).reshape(-1, 3)
+
+        # union-find of the zones known to be connected
+        parent = list(range(n_zones))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # pairs of zones with overlapping bounding boxes, in ascending order
+        for a, b in _sweepAndPrune(aabbMin, aabbMax):
+            i, j = indices[a], indices[b]
+
+            # Check if a path already exists.
+            rootI, rootJ = find(i), find(j)
+            if rootI == rootJ:
                 graph.add_edge(i, j)
                 continue
 
             # Finally: we must do the intersection op.
             logger.debug("Region = %s, int zone %d with %d", self.name, i, j)
-            if do_intersect(zones[i].mesh(aabb=aabb), zones[j].mesh(aabb=aabb)):
+            # do_intersect (CGAL) only tests the surfaces, missing nested zones
+            if do_intersect(zoneMesh(i), zoneMesh(j)) or isNested(i, j) or isNested(j, i):
                 graph.add_edge(i, j)
+                parent[rootJ] = rootI
 
         return graph
 
-    def _zoneGraphPycgal(self):
-        meshes = [z.mesh() for z in self.zones]
-        intersections = intersecting_meshes(meshes)
-        graph = nx.Graph()
-        graph.add_nodes_from(range(len(self.zones)))
-        graph.add_edges_from(intersections)
-        return graph
-
     def connectedZones(self, zoneAABBs=None, aabb=None):
         return list(nx.connected_components(self.zoneGraph(zoneAABBs=zoneAABBs, aabb=aabb)))
 
@@ -152,11 +152,8 @@ class AABB:
 
     @classmethod
     def fromMesh(cls, csgmesh):
-        vertices = csgmesh.toVerticesAndPolygons()[0]
-        x = [v[0] for v in vertices]
-        y = [v[1] for v in vertices]
-        z = [v[2] for v in vertices]
-        return cls([min(x), min(y), min(z)], [max(x), max(y), max(z)])
+        vertices, _ = csgmesh.toVerticesAndFaces()
+        return cls(vertices.min(axis=0).tolist(), vertices.max(axis=0).tolist())
 
     def intersects(self, other):
         return not (
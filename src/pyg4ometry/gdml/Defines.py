@@ -22,21 +22,29 @@ class BasicExpression:
     """
 
     def __init__(self, name, expressionString, registry):
+        self.owner = None  # define holding this expression, told about changes
         self.name = name
         self.expressionString = expressionString
-        self.parseTree = None
         self.registry = registry
 
+    @property
+    def expressionString(self):
+        return self._expressionString
+
+    @expressionString.setter
+    def expressionString(self, expressionString):
+        self._expressionString = expressionString
+        if self.owner is not None:
+            self.owner._valueChanged()
+
     def eval(self):
         expressionParser = self.registry.getExpressionParser()
-        self.parseTree = expressionParser.parse(self.expressionString)
-        value = expressionParser.evaluate(self.parseTree, self.registry.defineDict)
+        value = expressionParser.evaluateExpression(self.expressionString, self.registry.defineDict)
         return value
 
     def variables(self, allDependents=False):
         expressionParser = self.registry.getExpressionParser()
-        self.parseTree = expressionParser.parse(self.expressionString)
-        variables = expressionParser.get_variables(self.parseTree)
+        variables = expressionParser.variables(self.expressionString)
         if allDependents:
             dependents = []
             for v in variables:
@@ -232,12 +240,29 @@ class DefineBase:
         self.registry = registry
 
 
+def _invalidateDefine(define):
+    """
+    Drop the cached value of a define (and the defines using it) in its registry.
+    """
+    cache = getattr(define.__dict__.get("registry"), "defineCache", None)
+    if cache is not None:
+        cache.invalidate(define)
+
+    owner = define.__dict__.get("owner")
+    if owner is not None:
+        owner._valueChanged()
+
+
 class ScalarBase(DefineBase):
     """
     Base class for all scalars (Constants, Quantity, Variable and 'Expression')
     """
 
+    # setting any of these attributes changes the value of the scalar
+    _valueAttributes = ("name", "registry", "expression")
+
     def __init__(self, typeName, name="", registry=None):
+        self.owner = None  # define holding this scalar (e.g. a Matrix), told about changes
         super().__init__(name, registry)
         self.expression = None
         self._typeName = typeName
@@ -270,20 +295,40 @@ class ScalarBase(DefineBase):
         if self.expression:
             registry.transferDefine(self)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self._valueAttributes:
+            if name == "expression" and isinstance(value, BasicExpression):
+                value.owner = self
+            _invalidateDefine(self)
+
+    def _valueChanged(self):
+        _invalidateDefine(self)
+
+    def variables(self):
+        """
+        Names of the variables used by the expression
+        """
+        return self.expression.variables()
+
     def eval(self):
         """
-        Evaluate the expression
+        Evaluate the expression. The value is cached in the registry until this
+        define or a define it depends on changes.
 
         :return: numerical evaluation of Constant
         :rtype: float
         """
-        return self.expression.eval()
+        cache = getattr(self.registry, "defineCache", None)
+        if cache is None:
+            return self.expression.eval()
+        return cache.value(self, self.expression.eval)
 
     def __repr__(self):
         return self._typeName + f" : {self.name} = {self.expression!s}"
 
     def __float__(self):
-        return self.expression.eval()
+        return self.eval()
 
     def __add__(self, other):
         v1 = upgradeToStringExpression(self.registry, self)
@@ -734,6 +779,9 @@ class Expression(ScalarBase):
 
 
 class VectorBase:
+    # setting any of these attributes changes the value of the vector
+    _valueAttributes = ("name", "registry", "x", "y", "z", "unit")
+
     def __init__(self, typeName, name, registry):
         self._typeName = typeName
         self.name = name
@@ -840,15 +888,41 @@ class VectorBase:
         self.z.name = f"expr_{name}_vec_z"
         self.registry.addDefine(self)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self._valueAttributes:
+            if isinstance(value, BasicExpression):
+                value.owner = self
+            _invalidateDefine(self)
+
+    def _valueChanged(self):
+        _invalidateDefine(self)
+
+    def variables(self):
+        """
+        Names of the variables used by the components
+        """
+        result = []
+        for component in [self.x, self.y, self.z]:
+            result.extend(v for v in component.variables() if v not in result)
+        return result
+
+    def _eval(self):
+        u = _Units.unit(self.unit)
+        return [self.x.eval() * u, self.y.eval() * u, self.z.eval() * u]
+
     def eval(self):
         """
-        Evaluate vector
+        Evaluate vector. The value is cached in the registry until this vector
+        or a define it depends on changes.
 
         :return: numerical evaluation of vector
         :rtype: list of floats
         """
-        u = _Units.unit(self.unit)
-        return [self.x.eval() * u, self.y.eval() * u, self.z.eval() * u]
+        cache = getattr(self.registry, "defineCache", None)
+        if cache is None:
+            return self._eval()
+        return list(cache.value(self, self._eval))
 
     def nonzero(self):
         """
@@ -1038,13 +1112,13 @@ class Matrix:
 
         self.values = []
         for i, v in enumerate(values):
-            self.values.append(
-                Expression(
-                    f"matrix_expr_idx{i}_val_{name}",
-                    upgradeToStringExpression(registry, v),
-                    registry=registry,
-                )
+            e = Expression(
+                f"matrix_expr_idx{i}_val_{name}",
+                upgradeToStringExpression(registry, v),
+                registry=registry,
             )
+            e.owner = self
+            self.values.append(e)
 
         self.values_asarray = _np.array(self.values, dtype=_np.object_)
         if self.coldim > 1:
@@ -1066,6 +1140,10 @@ class Matrix:
         a = a.reshape(self.coldim, int(len(a) / self.coldim))
         return a
 
+    def _valueChanged(self):
+        # an element changed, so drop the values of the defines using this matrix
+        _invalidateDefine(self)
+
     def __repr__(self):
         return f"Matrix : {self.name} = {self.coldim!s} {self.values!s}"
 
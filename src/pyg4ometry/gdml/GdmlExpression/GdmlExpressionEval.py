@@ -8,6 +8,7 @@ from ..Units import units as _units
 
 import math
 import numpy
+import re as _re
 
 # from IPython import embed
 # import traceback
@@ -155,12 +156,223 @@ class GdmlExpressionEvalVisitor(GdmlExpressionVisitor):
                 return getattr(math, constant().getText())
 
 
+class _NotCompilable(Exception):
+    pass
+
+
+class GdmlExpressionCompiler:
+    """
+    Translate a parse tree into a nested Python closure taking the defines dictionary,
+    with the same semantics as GdmlExpressionEvalVisitor but without walking the tree
+    (and dispatching on its nodes) on every evaluation. Raises _NotCompilable for
+    trees the visitor would reject, which are then left to the visitor.
+    """
+
+    def compile(self, ctx):
+        if isinstance(ctx, GdmlExpressionParser.ExpressionContext):
+            return self.compileExpression(ctx)
+        elif isinstance(ctx, GdmlExpressionParser.MultiplyingExpressionContext):
+            return self.compileMultiplyingExpression(ctx)
+        elif isinstance(ctx, GdmlExpressionParser.PowExpressionContext):
+            return self.compilePowExpression(ctx)
+        elif isinstance(ctx, GdmlExpressionParser.SignedAtomContext):
+            return self.compileSignedAtom(ctx)
+        elif isinstance(ctx, GdmlExpressionParser.AtomContext):
+            return self.compileAtom(ctx)
+        elif isinstance(ctx, GdmlExpressionParser.ScientificContext):
+            return self.compileScientific(ctx)
+        elif isinstance(ctx, GdmlExpressionParser.MatrixElementContext):
+            return self.compileMatrixElement(ctx)
+        elif isinstance(ctx, GdmlExpressionParser.ConstantContext):
+            return self.compileConstant(ctx)
+        elif isinstance(ctx, GdmlExpressionParser.VariableContext):
+            return self.compileVariable(ctx)
+        elif isinstance(ctx, GdmlExpressionParser.FuncContext):
+            return self.compileFunc(ctx)
+        raise _NotCompilable(type(ctx).__name__)
+
+    def compileExpression(self, ctx):
+        terms = [self.compile(c) for c in ctx.multiplyingExpression()]
+        plus = [op.PLUS() is not None for op in ctx.operatorAddSub()]
+        first = terms[0]
+        rest = list(zip(plus, terms[1:]))
+
+        if not rest:
+            return lambda defines: float(first(defines))
+
+        def expression(defines):
+            left = float(first(defines))
+            for p, term in rest:
+                right = float(term(defines))
+                if p:
+                    left += right
+                else:
+                    left -= right
+            return left
+
+        return expression
+
+    def compileMultiplyingExpression(self, ctx):
+        factors = [self.compile(c) for c in ctx.powExpression()]
+        times = [op.TIMES() is not None for op in ctx.operatorMulDiv()]
+        first = factors[0]
+        rest = list(zip(times, factors[1:]))
+
+        if not rest:
+            return lambda defines: float(first(defines))
+
+        def multiplyingExpression(defines):
+            left = float(first(defines))
+            for t, factor in rest:
+                right = float(factor(defines))
+                if t:
+                    left *= right
+                else:
+                    left /= right
+            return left
+
+        return multiplyingExpression
+
+    def compilePowExpression(self, ctx):
+        atoms = [self.compile(c) for c in ctx.signedAtom()]
+        first = atoms[0]
+        rest = atoms[1:]
+
+        if not rest:
+            return lambda defines: float(first(defines))
+
+        def powExpression(defines):
+            base = float(first(defines))
+            for atom in rest:
+                base = base ** float(atom(defines))
+            return base
+
+        return powExpression
+
+    def compileSignedAtom(self, ctx):
+        sign = -1 if ctx.MINUS() else 1
+        if ctx.func():
+            value = self.compile(ctx.func())
+        elif ctx.atom():
+            value = self.compile(ctx.atom())
+        elif ctx.signedAtom():
+            value = self.compile(ctx.signedAtom())
+        else:
+            return lambda defines: sign * float(0)
+
+        return lambda defines: sign * float(value(defines))
+
+    def compileAtom(self, ctx):
+        if ctx.constant():
+            value = self.compile(ctx.constant())
+        elif ctx.variable():
+            value = self.compile(ctx.variable())
+        elif ctx.expression():
+            value = self.compile(ctx.expression())
+        elif ctx.scientific():
+            value = self.compile(ctx.scientific())
+        elif ctx.matrixElement():
+            value = self.compile(ctx.matrixElement())
+        else:
+            msg = "Invalid atom."
+            raise _NotCompilable(msg)
+
+        return lambda defines: float(value(defines))
+
+    def compileScientific(self, ctx):
+        value = float(ctx.SCIENTIFIC_NUMBER().getText())
+        return lambda defines: value
+
+    def compileMatrixElement(self, ctx):
+        matrix = self.compile(ctx.variable())
+        indices = [self.compile(c) for c in ctx.expression()]
+
+        def matrixElement(defines):
+            m = matrix(defines)
+            return m.values_asarray[tuple(int(index(defines)) - 1 for index in indices)]
+
+        return matrixElement
+
+    def compileConstant(self, ctx):
+        for c in ["PI", "EULER", "I"]:
+            constant = getattr(ctx, c)()
+            if constant:
+                try:
+                    value = getattr(math, constant.getText())
+                except AttributeError:
+                    raise _NotCompilable(constant.getText())
+                return lambda defines: value
+        return lambda defines: None
+
+    def compileVariable(self, ctx):
+        name = ctx.VARIABLE().getText()
+
+        def variable(defines):
+            try:
+                return defines[name]
+            except KeyError:
+                try:
+                    return _units[name]
+                except KeyError as err:
+                    msg = f"<= Undefined variable : {name}"
+                    if not err.args:
+                        err.args = ("",)
+                    err.args = (*err.args, msg)
+                    raise
+
+        return variable
+
+    def compileFunc(self, ctx):
+        function_name = ctx.funcname().getText()
+        if hasattr(math, function_name):
+            function = getattr(math, function_name)
+        elif hasattr(numpy, function_name):
+            function = getattr(numpy, function_name)
+        else:
+            raise _NotCompilable(function_name)
+
+        arguments = [self.compile(c) for c in ctx.expression()]
+        return lambda defines: function(*[argument(defines) for argument in arguments])
+
+
 class ExpressionParser:
+    """
+    Parse and evaluate GDML expressions. Parse trees are cached by expression string and
+    evaluateExpression additionally caches a compiled closure of each expression, so an
+    expression is only lexed and parsed by ANTLR the first time it is seen.
+    """
+
+    # plain numbers as matched by the SCIENTIFIC_NUMBER token, evaluated without parsing or caching
+    _numberPattern = _re.compile(r"\s*[+-]?[0-9]+\.?[0-9]*([eE][+-]?[0-9]+)?\s*")
+
     def __init__(self):
         self.visitor = GdmlExpressionEvalVisitor()
+        self.compiler = GdmlExpressionCompiler()
         self.defines_dict = {}
 
+        self.parseTreeCache = {}  # expression string -> parse tree
+        self.compiledCache = {}  # expression string -> compiled closure (or None)
+        self.variablesCache = {}  # expression string -> variable names
+
+    def __getstate__(self):
+        # parse trees and closures cannot be pickled, so a copy starts with empty caches
+        state = self.__dict__.copy()
+        state["parseTreeCache"] = {}
+        state["compiledCache"] = {}
+        state["variablesCache"] = {}
+        return state
+
+    def clearCache(self):
+        self.parseTreeCache.clear()
+        self.compiledCache.clear()
+        self.variablesCache.clear()
+
     def parse(self, expression):
+        try:
+            return self.parseTreeCache[expression]
+        except KeyError:
+            pass
+
         # Make a char stream out of the expression
         istream = InputStream(expression)  # Can do directly as a string?
         # tokenise character stream
@@ -171,9 +383,50 @@ class ExpressionParser:
         parser = GdmlExpressionParser(tokens)
 
         parse_tree = parser.expression()
+        parse_tree.syntaxErrors = parser.getNumberOfSyntaxErrors()
 
+        self.parseTreeCache[expression] = parse_tree
         return parse_tree
 
+    def compile(self, expression):
+        """
+        Compiled closure of an expression string taking the defines dictionary,
+        None if the expression can only be evaluated by the visitor (e.g. syntax errors).
+        Plain numbers are not cached, so the caches do not grow with every literal.
+        """
+        if self._numberPattern.fullmatch(expression):
+            value = float(expression)
+            return lambda defines: value
+
+        try:
+            return self.compiledCache[expression]
+        except KeyError:
+            pass
+
+        compiled = None
+        parse_tree = self.parse(expression)
+        if parse_tree.syntaxErrors == 0:
+            try:
+                compiled = self.compiler.compile(parse_tree)
+            except (_NotCompilable, ValueError):
+                pass
+
+        self.compiledCache[expression] = compiled
+        return compiled
+
+    def evaluateExpression(self, expression, define_dict={}):
+        """
+        Evaluate an expression string with the cached compiled closure, falling back to
+        the visitor on the cached parse tree. Plain numbers are converted directly.
+        """
+        if self._numberPattern.fullmatch(expression):
+            return float(expression)
+
+        compiled = self.compile(expression)
+        if compiled is not None:
+            return compiled(define_dict)
+        return self.evaluate(self.parse(expression), define_dict)
+
     def evaluate(self, parse_tree, define_dict={}):
         # Update the defines dict for every evaluation
         self.visitor.defines = define_dict
@@ -181,6 +434,23 @@ class ExpressionParser:
 
         return result
 
+    def variables(self, expression):
+        """
+        Names of the variables used in an expression string.
+        """
+        if self._numberPattern.fullmatch(expression):
+            return []
+
+        try:
+            return list(self.variablesCache[expression])
+        except KeyError:
+            pass
+
+        variables = self.get_variables(self.parse(expression))
+
+        self.variablesCache[expression] = variables
+        return list(variables)
+
     def get_variables(self, parse_tree):
         variables = []
         if hasattr(parse_tree, "children"):
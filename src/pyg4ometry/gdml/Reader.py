@@ -1,12 +1,78 @@
 from collections import defaultdict as _defaultdict
 import re as _re
-from xml.dom import minidom as _minidom
-import xml.parsers.expat as _expat
+import xml.etree.ElementTree as _ElementTree
 from . import Defines as _defines
 import logging as _log
 import pyg4ometry.geant4 as _g4
 
 
+class _Attribute:
+    def __init__(self, value):
+        self.value = value
+
+
+class _Attributes:
+    """
+    Read only view of the attributes of an ElementTree element with the minidom
+    NamedNodeMap interface used by the parse functions.
+    """
+
+    def __init__(self, attrib):
+        self._attrib = attrib
+
+    def __getitem__(self, name):
+        return _Attribute(self._attrib[name])
+
+    def __contains__(self, name):
+        return name in self._attrib
+
+    def __len__(self):
+        return len(self._attrib)
+
+    def keys(self):
+        return list(self._attrib.keys())
+
+    def values(self):
+        return [_Attribute(v) for v in self._attrib.values()]
+
+
+class _TextNode:
+    ELEMENT_NODE = 1
+    TEXT_NODE = 3
+    nodeType = TEXT_NODE
+
+    def __init__(self, text):
+        self.nodeValue = text
+
+
+class _Element:
+    """
+    Wrapper of an ElementTree element providing the subset of the minidom Element
+    interface (tagName, attributes, childNodes, getElementsByTagName) used by the
+    parse functions, so they work on elements of the streaming parser.
+    """
+
+    ELEMENT_NODE = 1
+    TEXT_NODE = 3
+    nodeType = ELEMENT_NODE
+
+    def __init__(self, element):
+        self._element = element
+        self.tagName = element.tag
+        self.attributes = _Attributes(element.attrib)
+
+    @property
+    def childNodes(self):
+        nodes = []
+        if self._element.text and self._element.text.strip():
+            nodes.append(_TextNode(self._element.text.strip()))
+        nodes.extend(_Element(child) for child in self._element)
+        return nodes
+
+    def getElementsByTagName(self, name):
+        return [_Element(e) for e in self._element.iter(name) if e is not self._element]
+
+
 class Reader:
     """
     Read a GDML file.
@@ -47,85 +113,109 @@ class Reader:
         self._physVolumeNameCount.clear()
 
         # open file
-        data = open(self.filename)
-
-        # Render out the ENTITY includes
-        # Only look at the starting block - no need to iterate over the whole file
-        start_block = ""
-        for line in data:
-            if line.startswith("<gdml"):
-                break
-            start_block += line
-        data.seek(0)  # Reset the file iterator
-
-        # Extract the information from entities and store in a dict
-        entities = {}
-        en_block = _re.search("<!DOCTYPE(\\s+)gdml([\\s\\S]*)>", start_block)
-
-        try:
-            ents = en_block.group(0).split("<")
-        except AttributeError:  # No entities
-            ents = []
-
-        for en in ents:
-            if "ENTITY" in en:
-                name = en.split()[1]
-                filename = _re.search(r"[^\"]+", " ".join(en.split()[3:])).group(0)
-                with open(filename) as content_file:
-                    # ensure the contents are properly prepared for parsing
-                    contents = ""
-                    for l in content_file:
-                        l = l.strip()
-                        if l.endswith(">"):
-                            end = ""
-                        else:
-                            end = " "
-                        if len(l) != 0:
-                            contents += l + end
-                entities[name] = (filename, contents)
-
-        # remove all newline charecters and whitespaces outside tags
-        fs = ""
-        for l in data:
-            l = l.strip()
-            # Render out entities in those lines
-            if l.startswith("&"):
-                name = _re.search(r"&([\s\S]+)\;", l).group(1)
-                fs += entities[name][1]
-                continue
+        with open(self.filename) as data:
+            # Render out the ENTITY includes
+            # Only look at the starting block - no need to iterate over the whole file
+            start_block = ""
+            for line in data:
+                if line.startswith("<gdml"):
+                    break
+                start_block += line
+            data.seek(0)  # Reset the file iterator
+
+            # Extract the information from entities and store in a dict
+            entities = {}
+            en_block = _re.search("<!DOCTYPE(\\s+)gdml([\\s\\S]*)>", start_block)
 
-            if l.endswith(">"):
-                end = ""
-            else:
-                end = " "
-            if len(l) != 0:
-                fs += l + end
-
-        # parse xml
-        _log.info("Reader.load> minidom parse")
-        try:
-            xmldoc = _minidom.parseString(fs)
-        except _expat.ExpatError as ee:
-            print(ee.args)
-            print(ee.args[0])
-            column = int(ee.args[0].split()[-1])
-            print(column, fs[column - 10 : min(len(fs), column + 100)])
-            print("        ^^^^ ")
-            raise _expat.ExpatError()
+            try:
+                ents = en_block.group(0).split("<")
+            except AttributeError:  # No entities
+                ents = []
+
+            for en in ents:
+                if "ENTITY" in en:
+                    name = en.split()[1]
+                    filename = _re.search(r"[^\"]+", " ".join(en.split()[3:])).group(0)
+                    entities[name] = filename
+
+            # parse xml, each child of the define, materials, solids, structure and userinfo
+            # sections is processed (and freed) as soon as it is complete
+            _log.info("Reader.load> streaming parse")
+            self._streamParse(data, entities)
         _log.info("Reader.load> parse")
 
-        # parse xml for defines, materials, solids and structure (#TODO optical surfaces?)
-        self.parseDefines(xmldoc)
-        if self._skipMaterials:
-            materialSubstitutionNames = None
-        else:
-            materialSubstitutionNames = self.parseMaterials(xmldoc)
-        self.parseSolids(xmldoc)
-        self.parseStructure(xmldoc, materialSubstitutionNames)
+    def _streamParse(self, data, entities):
+        parser = _ElementTree.XMLPullParser(events=("start", "end"))
 
-        self.parseUserInfo(xmldoc)
+        sections = ["define", "materials", "solids", "structure", "userinfo", "setup"]
+        seen = set()  # sections already encountered, only the first of each is parsed
+        stack = []  # open elements
+        current = [None]  # section being parsed
 
-        data.close()
+        materials = []
+        elements = []
+        isotopes = []
+        materialSubstitutionNames = [None]
+
+        def handleNode(section, node):
+            if section == "define":
+                self.parseDefine(node)
+            elif section == "materials":
+                if not self._skipMaterials:
+                    self.parseMaterial(node, materials, elements, isotopes)
+            elif section == "solids":
+                self.parseSolid(node)
+            elif section == "structure":
+                self.extractStructureNodeData(node, materialSubstitutionNames[0])
+            elif section == "userinfo":
+                self.parseUserInfoNode(node)
+
+        def handleEvents():
+            for event, elem in parser.read_events():
+                if event == "start":
+                    stack.append(elem)
+                    if len(stack) == 2 and elem.tag in sections and elem.tag not in seen:
+                        seen.add(elem.tag)
+                        current[0] = elem.tag
+                    continue
+
+                stack.pop()
+                if len(stack) == 2 and current[0] not in (None, "setup"):
+                    # complete child node of a section
+                    handleNode(current[0], _Element(elem))
+                    elem.clear()
+                    stack[-1].remove(elem)
+                elif len(stack) == 1:
+                    # end of a section
+                    if current[0] == "materials" and not self._skipMaterials:
+                        materialSubstitutionNames[0] = self._makeMaterials(
+                            materials, elements, isotopes
+                        )
+                    elif current[0] == "setup":
+                        self.parseSetup(_Element(elem))
+                    current[0] = None
+                    elem.clear()
+                    stack[-1].remove(elem)
+
+        try:
+            for line in data:
+                # Render out entities in those lines
+                if line.strip().startswith("&"):
+                    name = _re.search(r"&([\s\S]+)\;", line.strip()).group(1)
+                    with open(entities[name]) as content_file:
+                        for l in content_file:
+                            parser.feed(l)
+                            handleEvents()
+                    continue
+
+                parser.feed(line)
+                handleEvents()
+            parser.close()
+            handleEvents()
+        except _ElementTree.ParseError as pe:
+            print(pe.args[0])
+            print("line, column", pe.position)
+            raise
 
     def getRegistry(self):
         return self._registry
@@ -134,67 +224,70 @@ class Reader:
         self.xmldefines = xmldoc.getElementsByTagName("define")[0]
 
         for df in self.xmldefines.childNodes:
-            try:
-                define_type = df.tagName
-            except AttributeError:
-                # comment so continue
-                continue
+            self.parseDefine(df)
 
-            name = df.attributes["name"].value
-            attrs = df.attributes
+    def parseDefine(self, df):
+        try:
+            define_type = df.tagName
+        except AttributeError:
+            # comment so continue
+            return
 
-            keys = attrs.keys()
-            vals = [attr.value for attr in attrs.values()]
-            def_attrs = dict(zip(keys, vals))
+        name = df.attributes["name"].value
+        attrs = df.attributes
 
-            # parse positions and rotations
-            def getXYZ(def_attrs):
-                x = def_attrs.get("x", "0.0")
-                y = def_attrs.get("y", "0.0")
-                z = def_attrs.get("z", "0.0")
-                u = def_attrs.get("unit", None)
-                return (x, y, z, u)
+        keys = attrs.keys()
+        vals = [attr.value for attr in attrs.values()]
+        def_attrs = dict(zip(keys, vals))
 
-            # parse matrices
-            def getMatrix(def_attrs):
-                try:
-                    coldim = def_attrs["coldim"]
-                except KeyError:
-                    coldim = 0
-                values = def_attrs["values"].split()
-                return (coldim, values)
-
-            if define_type == "constant":
-                value = def_attrs["value"]
-                _defines.Constant(name, value, self._registry, True)
-            elif define_type == "quantity":
-                value = def_attrs["value"]
-                unit = def_attrs["unit"]
-                qtype = def_attrs["type"]
-                _defines.Quantity(name, value, unit, qtype, self._registry, True)
-            elif define_type == "variable":
-                value = def_attrs["value"]
-                _defines.Variable(name, value, self._registry, True)
-            elif define_type == "expression":
-                value = df.childNodes[0].nodeValue
-                _defines.Expression(name, value, self._registry, True)
-            elif define_type == "position":
-                (x, y, z, u) = getXYZ(def_attrs)
-                unit = u if u else "mm"
-                _defines.Position(name, x, y, z, unit, self._registry, True)
-            elif define_type == "rotation":
-                (x, y, z, u) = getXYZ(def_attrs)
-                unit = u if u else "rad"
-                _defines.Rotation(name, x, y, z, unit, self._registry, True)
-            elif define_type == "scale":
-                (x, y, z, u) = getXYZ(def_attrs)
-                unit = u if u else "none"
-                _defines.Scale(name, x, y, z, unit, self._registry, True)
-            elif define_type == "matrix":
-                (coldim, values) = getMatrix(def_attrs)
-                _defines.Matrix(name, coldim, values, self._registry, True)
-            else:
-                print("Warning : unrecognised define: ", define_type)
+        # parse positions and rotations
+        def getXYZ(def_attrs):
+            x = def_attrs.get("x", "0.0")
+            y = def_attrs.get("y", "0.0")
+            z = def_attrs.get("z", "0.0")
+            u = def_attrs.get("unit", None)
+            return (x, y, z, u)
+
+        # parse matrices
+        def getMatrix(def_attrs):
+            try:
+                coldim = def_attrs["coldim"]
+            except KeyError:
+                coldim = 0
+            values = def_attrs["values"].split()
+            return (coldim, values)
+
+        if define_type == "constant":
+            value = def_attrs["value"]
+            _defines.Constant(name, value, self._registry, True)
+        elif define_type == "quantity":
+            value = def_attrs["value"]
+            unit = def_attrs["unit"]
+            qtype = def_attrs["type"]
+            _defines.Quantity(name, value, unit, qtype, self._registry, True)
+        elif define_type == "variable":
+            value = def_attrs["value"]
+            _defines.Variable(name, value, self._registry, True)
+        elif define_type == "expression":
+            value = df.childNodes[0].nodeValue
+            _defines.Expression(name, value, self._registry, True)
+        elif define_type == "position":
+            x, y, z, u = getXYZ(def_attrs)
+            unit = u if u else "mm"
+            _defines.Position(name, x, y, z, unit, self._registry, True)
+        elif define_type == "rotation":
+            x, y, z, u = getXYZ(def_attrs)
+            unit = u if u else "rad"
+            _defines.Rotation(name, x, y, z, unit, self._registry, True)
+        elif define_type == "scale":
+            x, y, z, u = getXYZ(def_attrs)
+            unit = u if u else "none"
+            _defines.Scale(name, x, y, z, unit, self._registry, True)
+        elif define_type == "matrix":
+            coldim, values = getMatrix(def_attrs)
+            _defines.Matrix(name, coldim, values, self._registry, True)
+        else:
+            print("Warning : unrecognised define: ", define_type)
 
     def parseVector(self, node, type="position", addRegistry=True):
         try:
@@ -245,118 +338,123 @@ class Reader:
         self.materialdef = xmldoc.getElementsByTagName("materials")[0]
 
         for node in self.materialdef.childNodes:
-            if node.nodeType != node.ELEMENT_NODE:
-                # probably a comment node, skip
-                continue
+            self.parseMaterial(node, materials, elements, isotopes)
 
-            mat_type = node.tagName
+        materialSubstitutionNames = self._makeMaterials(materials, elements, isotopes)
+        return materialSubstitutionNames
 
-            name = node.attributes["name"].value
-            attrs = node.attributes
+    def parseMaterial(self, node, materials, elements, isotopes):
+        """
+        Collect the attributes of a single isotope, element or material node. They are
+        constructed by _makeMaterials once the whole materials section is read.
+        """
+        if node.nodeType != node.ELEMENT_NODE:
+            # probably a comment node, skip
+            return
 
-            keys = attrs.keys()
-            vals = [attr.value for attr in attrs.values()]
-            def_attrs = dict(zip(keys, vals))
+        mat_type = node.tagName
 
-            if mat_type == "isotope":
-                for chNode in node.childNodes:
-                    if chNode.nodeType != chNode.ELEMENT_NODE:
-                        continue  # comment
+        name = node.attributes["name"].value
+        attrs = node.attributes
 
-                    if chNode.tagName == "atom":
-                        def_attrs["a"] = chNode.attributes["value"].value
+        keys = attrs.keys()
+        vals = [attr.value for attr in attrs.values()]
+        def_attrs = dict(zip(keys, vals))
 
-                isotopes.append(def_attrs)
+        if mat_type == "isotope":
+            for chNode in node.childNodes:
+                if chNode.nodeType != chNode.ELEMENT_NODE:
+                    continue  # comment
 
-            elif mat_type == "element":
-                components = []
-                for chNode in node.childNodes:
-                    if chNode.nodeType != chNode.ELEMENT_NODE:
-                        continue  # comment
+                if chNode.tagName == "atom":
+                    def_attrs["a"] = chNode.attributes["value"].value
 
-                    if chNode.tagName == "atom":
-                        def_attrs["a"] = chNode.attributes["value"].value
+            isotopes.append(def_attrs)
 
-                    elif chNode.tagName == "fraction":
-                        keys = chNode.attributes.keys()
-                        vals = [attr.value for attr in chNode.attributes.values()]
-                        comp = dict(zip(keys, vals))
-                        comp["comp_type"] = "fraction"
-                        components.append(comp)
+        elif mat_type == "element":
+            components = []
+            for chNode in node.childNodes:
+                if chNode.nodeType != chNode.ELEMENT_NODE:
+                    continue  # comment
 
-                def_attrs["components"] = components
-                elements.append(def_attrs)
+                if chNode.tagName == "atom":
+                    def_attrs["a"] = chNode.attributes["value"].value
 
-            elif mat_type == "material":
-                components = []
-                properties = {}
+                elif chNode.tagName == "fraction":
+                    keys = chNode.attributes.keys()
+                    vals = [attr.value for attr in chNode.attributes.values()]
+                    comp = dict(zip(keys, vals))
+                    comp["comp_type"] = "fraction"
+                    components.append(comp)
 
-                try:
-                    state = node.attributes["state"].value
-                except:
-                    state = None
-                for chNode in node.childNodes:
-                    if chNode.nodeType != chNode.ELEMENT_NODE:
-                        continue  # comment
-
-                    if chNode.tagName == "D":
-                        def_attrs["density"] = chNode.attributes["value"].value
-
-                    elif chNode.tagName == "T":
-                        def_attrs["temperature"] = chNode.attributes["value"].value
-                        try:
-                            def_attrs["temperature_unit"] = chNode.attributes["unit"].value
-                        except KeyError:
-                            def_attrs["temperature_unit"] = "K"
+            def_attrs["components"] = components
+            elements.append(def_attrs)
 
-                    elif chNode.tagName == "P":
-                        def_attrs["pressure"] = chNode.attributes["value"].value
-                        try:
-                            def_attrs["pressure_unit"] = chNode.attributes["unit"].value
-                        except KeyError:
-                            def_attrs["pressure_unit"] = "pascal"
-
-                    elif chNode.tagName == "atom":
-                        def_attrs["a"] = chNode.attributes["value"].value
-
-                    elif chNode.tagName == "composite":
-                        keys = chNode.attributes.keys()
-                        vals = [attr.value for attr in chNode.attributes.values()]
-                        comp = dict(zip(keys, vals))
-                        comp["comp_type"] = "composite"
-                        components.append(comp)
-
-                    elif chNode.tagName == "fraction":
-                        keys = chNode.attributes.keys()
-                        vals = [attr.value for attr in chNode.attributes.values()]
-                        comp = dict(zip(keys, vals))
-                        comp["comp_type"] = "fraction"
-                        components.append(comp)
-
-                    elif chNode.tagName == "property":
-                        try:
-                            properties[chNode.attributes["name"].value] = chNode.attributes[
-                                "value"
-                            ].value
-                        except KeyError:
-                            pass
+        elif mat_type == "material":
+            components = []
+            properties = {}
 
-                        try:
-                            properties[chNode.attributes["name"].value] = chNode.attributes[
-                                "ref"
-                            ].value
-                        except KeyError:
-                            pass
+            try:
+                state = node.attributes["state"].value
+            except:
+                state = None
+            for chNode in node.childNodes:
+                if chNode.nodeType != chNode.ELEMENT_NODE:
+                    continue  # comment
+
+                if chNode.tagName == "D":
+                    def_attrs["density"] = chNode.attributes["value"].value
+
+                elif chNode.tagName == "T":
+                    def_attrs["temperature"] = chNode.attributes["value"].value
+                    try:
+                        def_attrs["temperature_unit"] = chNode.attributes["unit"].value
+                    except KeyError:
+                        def_attrs["temperature_unit"] = "K"
 
-                def_attrs["components"] = components
-                def_attrs["properties"] = properties
-                materials.append(def_attrs)
+                elif chNode.tagName == "P":
+                    def_attrs["pressure"] = chNode.attributes["value"].value
+                    try:
+                        def_attrs["pressure_unit"] = chNode.attributes["unit"].value
+                    except KeyError:
+                        def_attrs["pressure_unit"] = "pascal"
+
+                elif chNode.tagName == "atom":
+                    def_attrs["a"] = chNode.attributes["value"].value
+
+                elif chNode.tagName == "composite":
+                    keys = chNode.attributes.keys()
+                    vals = [attr.value for attr in chNode.attributes.values()]
+                    comp = dict(zip(keys, vals))
+                    comp["comp_type"] = "composite"
+                    components.append(comp)
+
+                elif chNode.tagName == "fraction":
+                    keys = chNode.attributes.keys()
+                    vals = [attr.value for attr in chNode.attributes.values()]
+                    comp = dict(zip(keys, vals))
+                    comp["comp_type"] = "fraction"
+                    components.append(comp)
+
+                elif chNode.tagName == "property":
+                    try:
+                        properties[chNode.attributes["name"].value] = chNode.attributes[
+                            "value"
+                        ].value
+                    except KeyError:
+                        pass
 
-            else:
-                print("Unrecognised define: ", mat_type)
+                    try:
+                        properties[chNode.attributes["name"].value] = chNode.attributes["ref"].value
+                    except KeyError:
+                        pass
 
-        materialSubstitutionNames = self._makeMaterials(materials, elements, isotopes)
-        return materialSubstitutionNames
+            def_attrs["components"] = components
+            def_attrs["properties"] = properties
+            materials.append(def_attrs)
+
+        else:
+            print("Unrecognised define: ", mat_type)
 
     def _makeMaterials(self, materials, elements, isotopes):
         """
@@ -495,10 +593,13 @@ class Reader:
             return
 
         for chnode in self.userinfo.childNodes:
-            if chnode.nodeType != chnode.ELEMENT_NODE:
-                # probably a comment node, skip
-                continue
-            self._parseAuxiliary(chnode)
+            self.parseUserInfoNode(chnode)
+
+    def parseUserInfoNode(self, chnode):
+        if chnode.nodeType != chnode.ELEMENT_NODE:
+            # probably a comment node, skip
+            return
+        self._parseAuxiliary(chnode)
 
     def _parseAuxiliary(self, xmlnode, register=True):
         aux_list = []
@@ -527,82 +628,85 @@ class Reader:
         self.xmlsolids = xmldoc.getElementsByTagName("solids")[0]
 
         for node in self.xmlsolids.childNodes:
-            try:
-                solid_type = node.tagName
-            except AttributeError:
-                continue  # node is probably a comment so continue
-
-            if solid_type == "box":  # solid test 001
-                self.parseBox(node)
-            elif solid_type == "tube":  # solid test 002
-                self.parseTube(node)
-            elif solid_type == "cutTube":  # solid test 003
-                self.parseCutTube(node)
-            elif solid_type == "cone":  # solid test 004 (problem when rmin1 == rmin2 != 0)
-                self.parseCone(node)
-            elif solid_type == "para":  # solid test 005
-                self.parsePara(node)
-            elif solid_type == "trd":  # solid test 006
-                self.parseTrd(node)
-            elif solid_type == "trap":  # solid test 007
-                self.parseTrap(node)
-            elif solid_type == "sphere":  # solid test 008
-                self.parseSphere(node)
-            elif solid_type == "orb":  # solid test 009
-                self.parseOrb(node)
-            elif solid_type == "torus":  # solid test 010
-                self.parseTorus(node)
-            elif solid_type == "polycone":  # solid test 011
-                self.parsePolycone(node)
-            elif solid_type == "genericPolycone":  # solid test 012
-                self.parseGenericPolycone(node)
-            elif solid_type == "polyhedra":  # solid test 013
-                self.parsePolyhedra(node)
-            elif solid_type == "genericPolyhedra":  # solid test 014
-                self.parseGenericPolyhedra(node)
-            elif solid_type == "eltube":  # solid test 015
-                self.parseEllipticalTube(node)
-            elif solid_type == "ellipsoid":  # solid test 016
-                self.parseEllipsoid(node)
-            elif solid_type == "elcone":  # solid test 017
-                self.parseEllipticalCone(node)
-            elif solid_type == "paraboloid":  # solid test 018
-                self.parseParaboloid(node)
-            elif solid_type == "hype":  # solid test 019
-                self.parseHype(node)
-            elif solid_type == "tet":  # solid test 020
-                self.parseTet(node)
-            elif solid_type == "xtru":  # solid test 021
-                self.parseExtrudedSolid(node)
-            elif solid_type == "twistedbox":  # solid test 022
-                self.parseTwistedBox(node)
-            elif solid_type == "twistedtrap":  # solid test 023
-                self.parseTwistedTrap(node)
-            elif solid_type == "twistedtrd":  # solid test 024
-                self.parseTwistedTrd(node)
-            elif solid_type == "twistedtubs":  # solid test 025
-                self.parseTwistedTubs(node)
-            elif solid_type == "arb8":  # solid test 026
-                self.parseGenericTrap(node)
-            elif solid_type == "tessellated":  # solid test 027
-                self.parseTessellatedSolid(node)
-            elif solid_type == "union":  # solid test 028
-                self.parseUnion(node)
-            elif solid_type == "subtraction":  # solid test 029
-                self.parseSubtraction(node)
-            elif solid_type == "intersection":  # solid test 030
-                self.parseIntersection(node)
-            elif solid_type == "multiUnion":  # solid test 031
-                self.parseMultiUnion(node)
-            elif solid_type == "opticalsurface":
-                self.parseOpticalSurface(node)
-            elif solid_type == "scaledSolid":
-                self.parseScaledSolid(node)
-            elif solid_type == "loop":
-                pass
-                # self.parseSolidLoop(node)
-            else:
-                print(solid_type, node.attributes["name"].value)
+            self.parseSolid(node)
+
+    def parseSolid(self, node):
+        try:
+            solid_type = node.tagName
+        except AttributeError:
+            return  # node is probably a comment so continue
+
+        if solid_type == "box":  # solid test 001
+            self.parseBox(node)
+        elif solid_type == "tube":  # solid test 002
+            self.parseTube(node)
+        elif solid_type == "cutTube":  # solid test 003
+            self.parseCutTube(node)
+        elif solid_type == "cone":  # solid test 004 (problem when rmin1 == rmin2 != 0)
+            self.parseCone(node)
+        elif solid_type == "para":  # solid test 005
+            self.parsePara(node)
+        elif solid_type == "trd":  # solid test 006
+            self.parseTrd(node)
+        elif solid_type == "trap":  # solid test 007
+            self.parseTrap(node)
+        elif solid_type == "sphere":  # solid test 008
+            self.parseSphere(node)
+        elif solid_type == "orb":  # solid test 009
+            self.parseOrb(node)
+        elif solid_type == "torus":  # solid test 010
+            self.parseTorus(node)
+        elif solid_type == "polycone":  # solid test 011
+            self.parsePolycone(node)
+        elif solid_type == "genericPolycone":  # solid test 012
+            self.parseGenericPolycone(node)
+        elif solid_type == "polyhedra":  # solid test 013
+            self.parsePolyhedra(node)
+        elif solid_type == "genericPolyhedra":  # solid test 014
+            self.parseGenericPolyhedra(node)
+        elif solid_type == "eltube":  # solid test 015
+            self.parseEllipticalTube(node)
+        elif solid_type == "ellipsoid":  # solid test 016
+            self.parseEllipsoid(node)
+        elif solid_type == "elcone":  # solid test 017
+            self.parseEllipticalCone(node)
+        elif solid_type == "paraboloid":  # solid test 018
+            self.parseParaboloid(node)
+        elif solid_type == "hype":  # solid test 019
+            self.parseHype(node)
+        elif solid_type == "tet":  # solid test 020
+            self.parseTet(node)
+        elif solid_type == "xtru":  # solid test 021
+            self.parseExtrudedSolid(node)
+        elif solid_type == "twistedbox":  # solid test 022
+            self.parseTwistedBox(node)
+        elif solid_type == "twistedtrap":  # solid test 023
+            self.parseTwistedTrap(node)
+        elif solid_type == "twistedtrd":  # solid test 024
+            self.parseTwistedTrd(node)
+        elif solid_type == "twistedtubs":  # solid test 025
+            self.parseTwistedTubs(node)
+        elif solid_type == "arb8":  # solid test 026
+            self.parseGenericTrap(node)
+        elif solid_type == "tessellated":  # solid test 027
+            self.parseTessellatedSolid(node)
+        elif solid_type == "union":  # solid test 028
+            self.parseUnion(node)
+        elif solid_type == "subtraction":  # solid test 029
+            self.parseSubtraction(node)
+        elif solid_type == "intersection":  # solid test 030
+            self.parseIntersection(node)
+        elif solid_type == "multiUnion":  # solid test 031
+            self.parseMultiUnion(node)
+        elif solid_type == "opticalsurface":
+            self.parseOpticalSurface(node)
+        elif solid_type == "scaledSolid":
+            self.parseScaledSolid(node)
+        elif solid_type == "loop":
+            pass
+            # self.parseSolidLoop(node)
+        else:
+            print(solid_type, node.attributes["name"].value)
 
     def parseBox(self, node):
         solid_name = node.attributes["name"].value
@@ -1811,7 +1915,10 @@ class Reader:
             self.extractStructureNodeData(node, materialSubstitutionNames)
 
         # find world logical volume
-        self.xmlsetup = xmldoc.getElementsByTagName("setup")[0]
+        self.parseSetup(xmldoc.getElementsByTagName("setup")[0])
+
+    def parseSetup(self, node):
+        self.xmlsetup = node
         worldLvName = self.xmlsetup.childNodes[0].attributes["ref"].value
         self._registry.orderLogicalVolumes(worldLvName)
         self._registry.setWorld(worldLvName)
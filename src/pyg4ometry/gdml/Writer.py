@@ -1,19 +1,190 @@
-from xml.dom import getDOMImplementation
 from ..geant4._Material import Material as _Material
 from ..geant4._Material import Element as _Element
 from ..geant4._Material import Isotope as _Isotope
 from ..gdml import Defines as _Defines
 import pyg4ometry.geant4 as _g4
+import gzip as _gzip
 import logging as _log
+import shutil as _shutil
+import tempfile as _tempfile
+
+
+def _writeData(writer, data):
+    # escaping as xml.dom.minidom
+    if data:
+        data = (
+            data.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace('"', "&quot;")
+            .replace(">", "&gt;")
+        )
+        writer.write(data)
+
+
+class _XmlText:
+    nodeType = 3
+
+    def __init__(self, data):
+        self.data = data
+
+    def writexml(self, writer, indent="", addindent="", newl=""):
+        _writeData(writer, f"{indent}{self.data}{newl}")
+
+
+class _XmlElement:
+    """
+    Lightweight XML element with the subset of the xml.dom.minidom Element interface
+    used by the Writer. It is written out exactly as minidom's toprettyxml would.
+    """
+
+    __slots__ = ("tagName", "attributes", "childNodes")
+    nodeType = 1
+
+    def __init__(self, tagName):
+        self.tagName = tagName
+        self.attributes = {}
+        self.childNodes = []
+
+    def setAttribute(self, name, value):
+        self.attributes[name] = value
+
+    def appendChild(self, node):
+        self.childNodes.append(node)
+        return node
+
+    def removeChild(self, node):
+        self.childNodes.remove(node)
+        return node
+
+    def _writeStart(self, writer, indent):
+        writer.write(indent + "<" + self.tagName)
+        for name, value in self.attributes.items():
+            writer.write(f' {name}="')
+            _writeData(writer, value)
+            writer.write('"')
+
+    def writexml(self, writer, indent="", addindent="", newl=""):
+        self._writeStart(writer, indent)
+        if self.childNodes:
+            writer.write(">")
+            if len(self.childNodes) == 1 and self.childNodes[0].nodeType == _XmlText.nodeType:
+                self.childNodes[0].writexml(writer, "", "", "")
+            else:
+                writer.write(newl)
+                for node in self.childNodes:
+                    node.writexml(writer, indent + addindent, addindent, newl)
+                writer.write(indent)
+            writer.write(f"</{self.tagName}>{newl}")
+        else:
+            writer.write(f"/>{newl}")
+
+
+class _XmlStreamedElement(_XmlElement):
+    """
+    Element whose children are written to a temporary file as soon as they are complete
+    (when the next child is appended or the element is written) rather than kept in
+    memory, so memory use does not grow with the number of children.
+
+    :param tagName: tag of the element
+    :type tagName: str
+    :param depth: depth of the element in the document (the root is 0)
+    :type depth: int
+    """
+
+    __slots__ = ("_childIndent", "_spool", "_pending", "_nChildren")
+
+    indent = "\t"
+    newl = "\n"
+
+    def __init__(self, tagName, depth):
+        super().__init__(tagName)
+        self._childIndent = self.indent * (depth + 1)
+        self._spool = None
+        self._pending = None
+        self._nChildren = 0
+
+    def appendChild(self, node):
+        self._flush()
+        self._pending = node
+        self._nChildren += 1
+        return node
+
+    def _flush(self):
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+        if self._spool is None:
+            self._spool = _tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+        try:
+            pending.writexml(self._spool, self._childIndent, self.indent, self.newl)
+        finally:
+            # a streamed child is complete once in this spool
+            if isinstance(pending, _XmlStreamedElement):
+                pending.close()
+
+    def close(self):
+        """
+        Close the spool file (and that of a pending streamed child), after which the
+        element cannot be written.
+        """
+        if isinstance(self._pending, _XmlStreamedElement):
+            self._pending.close()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    def writexml(self, writer, indent="", addindent="", newl=""):
+        self._flush()
+        if self._nChildren and self._spool is None:
+            msg = f"Streamed element {self.tagName} is closed and cannot be written again"
+            raise ValueError(msg)
+        self._writeStart(writer, indent)
+        if self._nChildren:
+            writer.write(">" + newl)
+            self._spool.seek(0)
+            _shutil.copyfileobj(self._spool, writer)
+            self._spool.seek(0, 2)
+            writer.write(f"{indent}</{self.tagName}>{newl}")
+        else:
+            writer.write(f"/>{newl}")
+
+
+class _XmlDocument:
+    def __init__(self, tagName):
+        self.documentElement = _XmlElement(tagName)
+
+    def createElement(self, tagName):
+        return _XmlElement(tagName)
+
+    def createStreamedElement(self, tagName, depth):
+        return _XmlStreamedElement(tagName, depth)
+
+    def createTextNode(self, data):
+        return _XmlText(data)
+
+    def writexml(self, writer, indent="", addindent="", newl=""):
+        writer.write(f'<?xml version="1.0" ?>{newl}')
+        self.documentElement.writexml(writer, indent, addindent, newl)
+
+    def close(self):
+        for node in self.documentElement.childNodes:
+            if isinstance(node, _XmlStreamedElement):
+                node.close()
 
 
 class Writer:
+    """
+    Write a registry to a GDML file. Elements are serialised as soon as they are
+    complete and each section (define, materials, solids, ...) is kept in a temporary
+    file until write() assembles them, so memory use stays flat for large geometries.
+    """
+
     def __init__(self, prepend=""):
         super().__init__()
         self.prepend = prepend
 
-        self.imp = getDOMImplementation()
-        self.doc = self.imp.createDocument(None, "gdml", None)
+        self.doc = _XmlDocument("gdml")
         self.top = self.doc.documentElement
         self.top.setAttribute("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
         self.top.setAttribute(
@@ -21,15 +192,15 @@ class Writer:
             "http://service-spi.web.cern.ch/service-spi/app/releases/GDML/schema/gdml.xsd",
         )
 
-        self.defines = self.top.appendChild(self.doc.createElement("define"))
-        self.materials = self.top.appendChild(self.doc.createElement("materials"))
-        self.solids = self.top.appendChild(self.doc.createElement("solids"))
-        self.structure = self.top.appendChild(self.doc.createElement("structure"))
-        self.userinfo = self.top.appendChild(self.doc.createElement("userinfo"))
+        self.defines = self.top.appendChild(self.doc.createStreamedElement("define", 1))
+        self.materials = self.top.appendChild(self.doc.createStreamedElement("materials", 1))
+        self.solids = self.top.appendChild(self.doc.createStreamedElement("solids", 1))
+        self.structure = self.top.appendChild(self.doc.createStreamedElement("structure", 1))
+        self.userinfo = self.top.appendChild(self.doc.createStreamedElement("userinfo", 1))
         self.setup = self.top.appendChild(self.doc.createElement("setup"))
 
-        self.materials_written = []
-        self.solids_written = []
+        self.materials_written = set()
+        self.solids_written = set()
 
         self.defineList = []
         self.materialList = []
@@ -98,10 +269,28 @@ class Writer:
         self.setup.appendChild(we)
 
     def write(self, filename):
-        f = open(filename, "w")
-        xmlString = self.doc.toprettyxml()
-        f.write(xmlString)
-        f.close()
+        """
+        Write the GDML document.
+
+        The temporary files of the sections are closed afterwards, so a Writer writes
+        one document.
+
+        :param filename: output file name, compressed with gzip if it ends with .gz, or an open text file
+        :type filename: str or file
+        """
+        try:
+            if hasattr(filename, "write"):
+                self.doc.writexml(filename, "", "\t", "\n")
+                return
+
+            if str(filename).endswith(".gz"):
+                f = _gzip.open(filename, "wt")
+            else:
+                f = open(filename, "w")
+            with f:
+                self.doc.writexml(f, "", "\t", "\n")
+        finally:
+            self.doc.close()
 
     def writeGMADTesterNoBeamline(self, gmad, gdml):
         text = f"""test: placement, geometryFile="gdml:{gdml}";
@@ -355,8 +544,7 @@ option, preprocessGDML=0;
             oe.appendChild(se)
             self.materials.appendChild(oe)
 
-        if material.name not in self.materials_written:
-            self.materials_written.append(material.name)
+        self.materials_written.add(material.name)
 
     def writeLogicalVolume(self, lv):
         we = self.doc.createElement("volume")
@@ -684,7 +872,7 @@ option, preprocessGDML=0;
         if hasattr(self, "write" + solid.type):
             func = getattr(self, "write" + solid.type)  # get the member function
             func(solid)  # call it with the solid instance as an argument
-            self.solids_written.append(solid.name)
+            self.solids_written.add(solid.name)
         else:
             raise ValueError("No such solid " + solid.type)
 
@@ -885,37 +1073,31 @@ option, preprocessGDML=0;
         return qf
 
     def writeTessellatedSolid(self, instance):
-        oe = self.doc.createElement("tessellated")
+        # facets are streamed as the number of them can be very large
+        oe = self.doc.createStreamedElement("tessellated", 2)
         name = instance.name
         oe.setAttribute("name", self.prepend + name)
 
         facet_makers = {3: self.createTriangularFacet, 4: self.createQuadrangularFacet}
         if instance.meshtype == instance.MeshType.Gdml:
-            for f in instance.meshtess:
-                oe.appendChild(facet_makers[len(f)](*f))
-
+            vert_names = instance.vertexNames
         elif instance.meshtype == instance.MeshType.Freecad:
-            verts = instance.meshtess[0]
-            facet = instance.meshtess[1]
-
             vert_names = []
-            for vertex_id, v in enumerate(verts):
+            for vertex_id, v in enumerate(instance.vertices.tolist()):
                 defname = f"{name}_{vertex_id}"
                 vert_names.append(defname)
 
                 self.writeDefine(_Defines.Position(defname, v[0], v[1], v[2]))
 
-            for f in facet:
+        if instance.meshtype in (instance.MeshType.Gdml, instance.MeshType.Freecad):
+            for f in instance.facets():
                 oe.appendChild(facet_makers[len(f)](*[vert_names[fi] for fi in f]))
-                # oe.appendChild(self.createTriangularFacet(vert_names[f[0]],
-                #                                           vert_names[f[1]],
-                #                                           vert_names[f[2]]))
         else:
-            facet = instance.meshtess
-
-            for facet_id, f in enumerate(facet):
+            # STL facets each with their own vertices
+            triangles = instance.vertices[instance.faces[:, :3]].tolist()
+            for facet_id, f in enumerate(triangles):
                 vertex_names = []
-                for vertex_id, v in enumerate(f[0]):
+                for vertex_id, v in enumerate(f):
                     defname = f"{name}_f{facet_id}_v{vertex_id}"
                     vertex_names.append(defname)
                     self.writeDefine(_Defines.Position(defname, v[0], v[1], v[2]))
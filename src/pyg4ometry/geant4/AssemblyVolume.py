@@ -1,6 +1,7 @@
 import pyg4ometry as _pyg4ometry
 import pyg4ometry.transformation as _trans
 import pyg4ometry.geant4.solid as _solid
+from .PlacementTree import _cachedPlacementTree
 from pyg4ometry.visualisation import Mesh as _Mesh
 
 import numpy as _np
@@ -256,27 +257,8 @@ class AssemblyVolume:
     def extent(self, includeBoundingSolid=True):
         _log.info("AssemblyVolume.extent> %s " % (self.name))
 
-        vMin = [1e99, 1e99, 1e99]
-        vMax = [-1e99, -1e99, -1e99]
-
-        for dv in self.daughterVolumes:
-            [vMinDaughter, vMaxDaughter] = dv.extent()
-
-            if vMaxDaughter[0] > vMax[0]:
-                vMax[0] = vMaxDaughter[0]
-            if vMaxDaughter[1] > vMax[1]:
-                vMax[1] = vMaxDaughter[1]
-            if vMaxDaughter[2] > vMax[2]:
-                vMax[2] = vMaxDaughter[2]
-
-            if vMinDaughter[0] < vMin[0]:
-                vMin[0] = vMinDaughter[0]
-            if vMinDaughter[1] < vMin[1]:
-                vMin[1] = vMinDaughter[1]
-            if vMinDaughter[2] < vMin[2]:
-                vMin[2] = vMinDaughter[2]
-
-        return [vMin, vMax]
+        [vMin, vMax] = self.placementTree().extent(includeRoot=False)
+        return [vMin.tolist(), vMax.tolist()]
 
     def depth(self, depth=0):
         """
@@ -291,6 +273,13 @@ class AssemblyVolume:
 
         return max(depthList)
 
+    def placementTree(self):
+        """
+        Return the PlacementTree of this volume, built on first use and refreshed
+        (only changed placements are recomputed) on each subsequent call.
+        """
+        return _cachedPlacementTree(self)
+
     def getAABBMesh(self):
         """return CSG.core (symmetric around the origin) axis aligned bounding box mesh"""
         extent = self.extent()
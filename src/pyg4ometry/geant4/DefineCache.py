@@ -0,0 +1,99 @@
+import weakref as _weakref
+
+
+class DefineCache:
+    """
+    Evaluated values of defines (scalars and vectors) with the dependency graph
+    between them, owned by a Registry. A value is stored on the define itself, so
+    re-evaluating an unchanged define is a single attribute lookup. When a define
+    changes (its expression, components, unit, name or registry is set) its value is
+    dropped along with the values of all defines that use it by name, recursively.
+    Defines are only referenced weakly by the graph.
+    """
+
+    def __init__(self):
+        self.nHits = 0
+        self.nMisses = 0
+
+        self._token = object()  # values stored with another token are stale
+        self._dependents = {}  # define name -> {id(define) : weakref(define)}
+
+    def __repr__(self):
+        return f"DefineCache : {len(self._dependents)} names with dependents"
+
+    def __getstate__(self):
+        # weak references cannot be pickled (or deep copied), so a copy starts empty
+        state = self.__dict__.copy()
+        del state["_token"]
+        state["_dependents"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._token = object()
+
+    def clear(self):
+        self._token = object()
+        self._dependents.clear()
+        self.nHits = 0
+        self.nMisses = 0
+
+    def value(self, define, evaluate):
+        """
+        Return the cached value of a define or compute it with evaluate and cache it.
+
+        :param define: define the value belongs to
+        :type define: ScalarBase or VectorBase
+        :param evaluate: callable computing the value when it is not cached
+        :type evaluate: function
+        """
+        cached = define.__dict__.get("_cachedValue")
+        if cached is not None and cached[0] is self._token:
+            self.nHits += 1
+            return cached[1]
+
+        self.nMisses += 1
+        value = evaluate()
+
+        ref = _weakref.ref(define)
+        for name in define.variables():
+            self._dependents.setdefault(name, {})[id(define)] = ref
+        define.__dict__["_cachedValue"] = (self._token, value)
+
+        return value
+
+    def invalidate(self, define):
+        """
+        Drop the cached value of a define and of all defines that depend on it.
+        """
+        visited = set()
+        stack = [define]
+        while stack:
+            d = stack.pop()
+            if id(d) in visited:
+                continue
+            visited.add(id(d))
+
+            d.__dict__.pop("_cachedValue", None)
+            stack.extend(self._liveDependents(d.__dict__.get("name")))
+
+    def invalidateName(self, name):
+        """
+        Drop the cached values of all defines that use a define name.
+        """
+        for d in self._liveDependents(name):
+            self.invalidate(d)
+
+    def _liveDependents(self, name):
+        refs = self._dependents.get(name)
+        if not refs:
+            return []
+
+        dependents = []
+        for key, ref in list(refs.items()):
+            d = ref()
+            if d is None:
+                del refs[key]
+            else:
+                dependents.append(d)
+        return dependents
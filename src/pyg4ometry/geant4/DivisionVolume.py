@@ -1,4 +1,5 @@
 from .PhysicalVolume import PhysicalVolume as _PhysicalVolume
+from .PlacementTree import _copiesBoundingBox
 import pyg4ometry.geant4.solid as _solid
 from pyg4ometry.visualisation import Mesh as _Mesh
 from pyg4ometry.visualisation import VisualisationOptions as _VisOptions
@@ -727,31 +728,5 @@ class DivisionVolume(_PhysicalVolume):
     def extent(self, includeBoundingSolid=True):
         _log.info("ReplicaVolume.extent> %s" % (self.name))
 
-        vMin = [1e99, 1e99, 1e99]
-        vMax = [-1e99, -1e99, -1e99]
-
-        for trans, mesh in zip(self.transforms, self.meshes):
-            # transform daughter meshes to parent coordinates
-            dvmrot = _trans.tbxyz2matrix(trans[0])
-            dvtra = _np.array(trans[1])
-
-            [vMinDaughter, vMaxDaughter] = mesh.getBoundingBox()
-
-            vMinDaughter = _np.array(dvmrot.dot(vMinDaughter) + dvtra).flatten()
-            vMaxDaughter = _np.array(dvmrot.dot(vMaxDaughter) + dvtra).flatten()
-
-            if vMaxDaughter[0] > vMax[0]:
-                vMax[0] = vMaxDaughter[0]
-            if vMaxDaughter[1] > vMax[1]:
-                vMax[1] = vMaxDaughter[1]
-            if vMaxDaughter[2] > vMax[2]:
-                vMax[2] = vMaxDaughter[2]
-
-            if vMinDaughter[0] < vMin[0]:
-                vMin[0] = vMinDaughter[0]
-            if vMinDaughter[1] < vMin[1]:
-                vMin[1] = vMinDaughter[1]
-            if vMinDaughter[2] < vMin[2]:
-                vMin[2] = vMinDaughter[2]
-
-        return [vMin, vMax]
+        vMin, vMax = _copiesBoundingBox(self)
+        return [vMin.tolist(), vMax.tolist()]
@@ -8,7 +8,10 @@ from pyg4ometry import config as _config
 from pyg4ometry.visualisation import Mesh as _Mesh
 from pyg4ometry.visualisation import Convert as _Convert
 from pyg4ometry.visualisation import OverlapType as _OverlapType
+from pyg4ometry.visualisation import _meshFromVerticesAndPolygons
+from pyg4ometry.meshutils import sweepAndPrune as _sweepAndPrune
 from . import solid as _solid
+from .PlacementTree import _cachedPlacementTree
 from . import _Material as _mat
 import pyg4ometry.transformation as _trans
 import vtk as _vtk
@@ -17,6 +20,7 @@ from collections import defaultdict as _defaultdict
 import numpy as _np
 import logging as _log
 import copy as _copy
+import multiprocessing as _mp
 
 
 def _solid2tessellated(solid):
@@ -47,6 +51,118 @@ def _solid2tessellated(solid):
     return tesselated_solid
 
 
+def _boundingMeshExtents(boundingMeshes):
+    """
+    Axis aligned extents of a list of (possibly transformed) bounding meshes.
+
+    :returns: lower and upper corners of each mesh
+    :rtype: array(N,3), array(N,3)
+    """
+    aabbMin = _np.empty((len(boundingMeshes), 3))
+    aabbMax = _np.empty((len(boundingMeshes), 3))
+    for i, boundingMesh in enumerate(boundingMeshes):
+        vertices, _ = boundingMesh.toVerticesAndFaces()
+        aabbMin[i] = vertices.min(axis=0)
+        aabbMax[i] = vertices.max(axis=0)
+    return aabbMin, aabbMax
+
+
+def _printOverlapTest(test, transformedMeshesNames):
+    kind, i, j = test
+    if kind == "daughter":
+        print(
+            f"LogicalVolume.checkOverlaps> daughter-daughter bounding mesh intersection test: {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
+        )
+    elif kind == "daughterCoplanar":
+        print(
+            f"LogicalVolume.checkOverlaps> full coplanar test between daughters {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
+        )
+    elif kind == "mother":
+        print(
+            f"LogicalVolume.checkOverlaps> full daughter-mother intersection test {transformedMeshesNames[i]}"
+        )
+    elif kind == "motherCoplanar":
+        print(
+            f"LogicalVolume.checkOverlaps> full daughter-mother coplanar test {transformedMeshesNames[i]}"
+        )
+
+
+def _overlapTest(test, transformedMeshes, transformedBoundingMeshes, motherMesh, debugIO=False):
+    """
+    Run a single overlap test (kind, i, j) from LogicalVolume._getOverlapTests.
+
+    :returns: overlap mesh or None if there is no overlap
+    """
+    kind, i, j = test
+
+    if kind == "daughter":
+        # first check if bounding mesh intersects
+        cullIntersection = transformedBoundingMeshes[i].intersect(transformedBoundingMeshes[j])
+        if cullIntersection.vertexCount() == 0:
+            return None
+
+        # bounding meshes collide, so check full mesh properly
+        interMesh = transformedMeshes[i].intersect(transformedMeshes[j])
+        _log.info(
+            "LogicalVolume.checkOverlaps> full daughter-daughter intersection test: %d %d %d %d"
+            % (i, j, interMesh.vertexCount(), interMesh.polygonCount())
+        )
+        if interMesh.vertexCount() != 0:
+            return interMesh
+
+    elif kind == "daughterCoplanar":
+        # first check if bounding mesh intersects
+        cullIntersection = transformedBoundingMeshes[i].intersect(transformedBoundingMeshes[j])
+        cullCoplanar = transformedBoundingMeshes[i].coplanarIntersection(
+            transformedBoundingMeshes[j]
+        )
+        if debugIO:
+            print(cullIntersection.vertexCount(), cullCoplanar.vertexCount())
+        if cullIntersection.vertexCount() == 0 and cullCoplanar.vertexCount() == 0:
+            return None
+
+        coplanarMesh = transformedMeshes[i].coplanarIntersection(transformedMeshes[j])
+        if coplanarMesh.vertexCount() != 0:
+            return coplanarMesh
+
+    elif kind == "mother":
+        cullIntersection = transformedBoundingMeshes[i].subtract(motherMesh.localboundingmesh)
+        if cullIntersection.vertexCount() == 0:
+            return None
+
+        interMesh = transformedMeshes[i].subtract(motherMesh.localmesh)
+        _log.info(
+            "LogicalVolume.checkOverlaps> daughter container %d %d %d"
+            % (i, interMesh.vertexCount(), interMesh.polygonCount())
+        )
+        if interMesh.vertexCount() != 0:
+            return interMesh
+
+    elif kind == "motherCoplanar":
+        # Need mother.coplanar(daughter) as typically mother is larger
+        coplanarMesh = motherMesh.localmesh.coplanarIntersection(transformedMeshes[i])
+        if coplanarMesh.vertexCount() != 0:
+            return coplanarMesh
+
+    return None
+
+
+# overlap checks shared with the worker processes of LogicalVolume._checkOverlapsParallel
+_overlapJobs = []
+
+
+def _overlapWorker(task):
+    iJob, test = task
+    transformedMeshes, transformedBoundingMeshes, motherMesh, debugIO = _overlapJobs[iJob]
+    overlapMesh = _overlapTest(
+        test, transformedMeshes, transformedBoundingMeshes, motherMesh, debugIO
+    )
+    if overlapMesh is None:
+        return None
+    vertices, polygons, _ = overlapMesh.toVerticesAndPolygons()
+    return vertices, polygons
+
+
 class LogicalVolume:
     """
     LogicalVolume : G4LogicalVolume
@@ -94,7 +210,7 @@ class LogicalVolume:
         self.daughterVolumes = []
         self._daughterVolumesDict = {}
         self.bdsimObjects = []
-        if _config.doMeshing:
+        if _config.doMeshing and not _config.lazyMeshing:
             self.reMesh()
         self.auxiliary = []
         self.addAuxiliaryInfo(kwargs.get("auxiliary", None))
@@ -110,6 +226,26 @@ class LogicalVolume:
     def __repr__(self):
         return "Logical volume : " + self.name + " " + str(self.solid) + " " + str(self.material)
 
+    @property
+    def mesh(self):
+        """
+        Mesh (visualisation.Mesh) of the solid, generated on first use and kept until
+        the volume is remeshed. None if the solid cannot be meshed.
+        """
+        if "_mesh" not in self.__dict__:
+            self.reMesh()
+        return self._mesh
+
+    @mesh.setter
+    def mesh(self, mesh):
+        self._mesh = mesh
+
+    def isMeshed(self):
+        """
+        Whether the mesh has been generated (or set), without generating it.
+        """
+        return "_mesh" in self.__dict__
+
     def reMesh(self, recursive=False):
         """
         Regenerate the visualisation for this logical volume. Required if the geometry is modified
@@ -619,6 +755,9 @@ class LogicalVolume:
         debugIO=False,
         printOut=True,
         nOverlapsDetected=[0],
+        parallel=0,
+        cache=None,
+        topLevel=True,
     ):
         """
         Check based on the meshes in each logical volume if there are any geometrical overlaps. By
@@ -633,27 +772,140 @@ class LogicalVolume:
         :param debugIO: bool - Print out for every check made
         :param printOut: bool - (internal) Whether to print out a summary of N overlaps detected
         :param nOverlapsDetected: [int] - (internal) counter for recursion - ignore
+        :param parallel: int - Number of processes to distribute the mesh tests over (0 or 1 is serial)
+        :param cache: OverlapCache - Reuse the results of tests whose meshes and placements are unchanged. Volumes already checked are checked again (against the cache)
+        :param topLevel: bool - (internal) Whether this call started the check, False for recursion
         """
         from pyg4ometry.geant4 import IsAReplica as _IsAReplica
 
         if printOut:
             print("LogicalVolume.checkOverlaps> ", self.name)
 
+        # with a cache everything is rechecked as placements may have changed since
+        if cache is not None and topLevel:
+            self._resetOverlapChecked(recursive, set())
+
         # return if overlaps already checked
         if self.overlapChecked:
             if debugIO:
                 print("Overlaps already checked - skipping")
             return
 
+        if parallel > 1:
+            self._checkOverlapsParallel(
+                recursive, coplanar, debugIO, nOverlapsDetected, parallel, cache
+            )
+            self._overlapCheckSummary(nOverlapsDetected, cache, printOut, topLevel)
+            return
+
         if _IsAReplica(self):
             self.daughterVolumes[0]._checkInternalOverlaps(debugIO, nOverlapsDetected)
             self.overlapChecked = True
             return
 
+        (
+            transformedMeshes,
+            transformedBoundingMeshes,
+            transformedMeshesNames,
+            tests,
+            placementKeys,
+        ) = self._getOverlapTests(coplanar, printOut or debugIO, cache)
+
+        if cache is not None:
+            motherKey = cache.meshHash(self.mesh.localmesh)
+
+        for test in tests:
+            if debugIO:
+                _printOverlapTest(test, transformedMeshesNames)
+
+            if cache is not None:
+                key = cache.testKey(test, placementKeys, motherKey)
+                found, result = cache.lookup(key)
+                if not found:
+                    overlapMesh = _overlapTest(
+                        test, transformedMeshes, transformedBoundingMeshes, self.mesh, debugIO
+                    )
+                    if overlapMesh is not None:
+                        result = overlapMesh.toVerticesAndPolygons()[0:2]
+                    cache.store(key, result)
+                elif result is not None:
+                    overlapMesh = _meshFromVerticesAndPolygons(*result)
+                else:
+                    overlapMesh = None
+            else:
+                overlapMesh = _overlapTest(
+                    test, transformedMeshes, transformedBoundingMeshes, self.mesh, debugIO
+                )
+
+            if overlapMesh is not None:
+                self._addOverlap(test, overlapMesh, transformedMeshesNames, nOverlapsDetected)
+
+        # recursively check entire tree
+        if recursive:
+            for d in self.daughterVolumes:
+                if type(d.logicalVolume) is _pyg4ometry.geant4.AssemblyVolume:
+                    continue  # no specific overlap check - handled by the PV of an assembly
+                # don't make any summary print out for a recursive call
+                d.logicalVolume.checkOverlaps(
+                    recursive=recursive,
+                    coplanar=coplanar,
+                    debugIO=debugIO,
+                    printOut=False,
+                    nOverlapsDetected=nOverlapsDetected,
+                    cache=cache,
+                    topLevel=False,
+                )
+
+        # ok this logical has been checked
+        self.overlapChecked = True
+
+        self._overlapCheckSummary(nOverlapsDetected, cache, printOut, topLevel)
+
+    def _overlapCheckSummary(self, nOverlapsDetected, cache, printOut, topLevel):
+        if printOut:
+            print(nOverlapsDetected[0], " overlaps detected")
+            if cache is not None:
+                print(
+                    f"LogicalVolume.checkOverlaps> overlap cache {cache.nHits} tests reused {cache.nMisses} tests run"
+                )
+        if cache is not None and topLevel and cache.fileName is not None:
+            cache.save()
+
+    def _resetOverlapChecked(self, recursive, visited):
+        """
+        Mark this logical volume (and if recursive its daughters) as requiring an
+        overlap check and remove any existing overlap meshes.
+        """
+        if id(self) in visited:
+            return
+        visited.add(id(self))
+
+        self.overlapChecked = False
+        if self.mesh is not None:
+            self.mesh.overlapmeshes = []
+
+        if recursive:
+            for d in self.daughterVolumes:
+                if type(d.logicalVolume) is _pyg4ometry.geant4.AssemblyVolume:
+                    continue
+                d.logicalVolume._resetOverlapChecked(recursive, visited)
+
+    def _getOverlapTests(self, coplanar=False, printBroadPhase=False, cache=None):
+        """
+        Transform the daughter meshes (and bounding meshes) into the frame of this logical
+        volume and form the list of mesh tests required to check them for overlaps. Pairs
+        of daughters are first pruned by comparing their axis aligned extents.
+
+        :param coplanar: bool - Whether to include coplanar tests
+        :param printBroadPhase: bool - Print the number of daughter pairs pruned by the broad phase
+        :param cache: OverlapCache - If given also compute a content key for each transformed mesh
+        :returns: [transformedMeshes, transformedBoundingMeshes, transformedMeshesNames, tests, placementKeys]
+        """
         # local meshes
         transformedMeshes = []
         transformedBoundingMeshes = []
         transformedMeshesNames = []
+        placementKeys = []
 
         # transform meshes (and bounding meshes) into logical volume frame
         for pv in self.daughterVolumes:
@@ -711,130 +963,192 @@ class LogicalVolume:
                 transformedBoundingMeshes.append(boundingmesh)
                 transformedMeshesNames.append(name)
 
-        # overlap daughter pv checks
-        for i in range(len(transformedMeshes)):
-            for j in range(i + 1, len(transformedMeshes)):
-                if debugIO:
-                    print(
-                        f"LogicalVolume.checkOverlaps> daughter-daughter bounding mesh intersection test: {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
-                    )
+                if cache is not None:
+                    if pv.logicalVolume.type == "assembly":
+                        placementKeys.append(cache.meshHash(mesh, memoise=False))
+                    else:
+                        placementKeys.append(
+                            cache.placementHash(pv.logicalVolume.mesh.localmesh, pv)
+                        )
 
-                # first check if bounding mesh intersects
-                cullIntersection = transformedBoundingMeshes[i].intersect(
-                    transformedBoundingMeshes[j]
-                )
-                if cullIntersection.vertexCount() == 0:
-                    continue
+        # broad phase - axis aligned extents of the transformed bounding meshes
+        nMeshes = len(transformedMeshes)
+        aabbMin, aabbMax = _boundingMeshExtents(transformedBoundingMeshes)
+        candidatePairs = [(int(i), int(j)) for i, j in _sweepAndPrune(aabbMin, aabbMax)]
 
-                # bounding meshes collide, so check full mesh properly
-                interMesh = transformedMeshes[i].intersect(transformedMeshes[j])
-                _log.info(
-                    "LogicalVolume.checkOverlaps> full daughter-daughter intersection test: %d %d %d %d"
-                    % (i, j, interMesh.vertexCount(), interMesh.polygonCount())
-                )
-                if interMesh.vertexCount() != 0:
-                    nOverlapsDetected[0] += 1
-                    print(
-                        f"\033[1mOVERLAP DETECTED> overlap between daughters of {self.name} \033[0m {transformedMeshesNames[i]} {transformedMeshesNames[j]} {interMesh.vertexCount()}"
-                    )
-                    self.mesh.addOverlapMesh([interMesh, _OverlapType.overlap])
+        nPairs = nMeshes * (nMeshes - 1) // 2
+        nPruned = nPairs - len(candidatePairs)
+        _log.info(
+            "LogicalVolume.checkOverlaps> broad phase pruned %d of %d daughter pairs"
+            % (nPruned, nPairs)
+        )
+        if printBroadPhase:
+            print(
+                f"LogicalVolume.checkOverlaps> broad phase pruned {nPruned} of {nPairs} daughter pairs"
+            )
 
-        # coplanar daughter pv checks
-        # print 'coplanar with pvs'
-        # print "LogicalVolume.checkOverlaps> daughter coplanar overlaps"
-        if coplanar:
-            for i in range(len(transformedMeshes)):
-                for j in range(i + 1, len(transformedMeshes)):
-                    if debugIO:
-                        print(
-                            f"LogicalVolume.checkOverlaps> full coplanar test between daughters {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
-                        )
+        # daughters whose extent lies inside the mother bounding box cannot protrude
+        motherMin, motherMax = _boundingMeshExtents([self.mesh.localboundingmesh])
+        contained = _np.all((aabbMin >= motherMin) & (aabbMax <= motherMax), axis=1)
 
-                    # first check if bounding mesh intersects
-                    cullIntersection = transformedBoundingMeshes[i].intersect(
-                        transformedBoundingMeshes[j]
-                    )
-                    cullCoplanar = transformedBoundingMeshes[i].coplanarIntersection(
-                        transformedBoundingMeshes[j]
-                    )
-                    print(cullIntersection.vertexCount(), cullCoplanar.vertexCount())
-                    if cullIntersection.vertexCount() == 0 and cullCoplanar.vertexCount() == 0:
-                        continue
+        # overlap daughter pv checks
+        tests = [("daughter", i, j) for i, j in candidatePairs]
 
-                    coplanarMesh = transformedMeshes[i].coplanarIntersection(transformedMeshes[j])
-                    if coplanarMesh.vertexCount() != 0:
-                        nOverlapsDetected[0] += 1
-                        print(
-                            f"\033[1mOVERLAP DETECTED> coplanar overlap between daughters \033[0m {transformedMeshesNames[i]} {transformedMeshesNames[j]} {coplanarMesh.vertexCount()}"
-                        )
-                        self.mesh.addOverlapMesh([coplanarMesh, _OverlapType.coplanar])
+        # coplanar daughter pv checks
+        if coplanar:
+            tests.extend(("daughterCoplanar", i, j) for i, j in candidatePairs)
 
         # protrusion from mother solid
-        for i in range(len(transformedMeshes)):
-            if debugIO:
-                print(
-                    f"LogicalVolume.checkOverlaps> full daughter-mother intersection test {transformedMeshesNames[i]}"
-                )
+        tests.extend(("mother", i, None) for i in range(nMeshes) if not contained[i])
 
-            cullIntersection = transformedBoundingMeshes[i].subtract(self.mesh.localboundingmesh)
-            if cullIntersection.vertexCount() == 0:
-                continue
+        # coplanar with solid
+        if coplanar:
+            tests.extend(("motherCoplanar", i, None) for i in range(nMeshes))
+
+        return (
+            transformedMeshes,
+            transformedBoundingMeshes,
+            transformedMeshesNames,
+            tests,
+            placementKeys,
+        )
+
+    def _addOverlap(self, test, overlapMesh, transformedMeshesNames, nOverlapsDetected):
+        """
+        Print out and record (on the mesh of this logical volume) an overlap found by
+        one of the tests from _getOverlapTests.
+        """
+        kind, i, j = test
+        nOverlapsDetected[0] += 1
 
-            interMesh = transformedMeshes[i].subtract(self.mesh.localmesh)
-            _log.info(
-                "LogicalVolume.checkOverlaps> daughter container %d %d %d"
-                % (i, interMesh.vertexCount(), interMesh.polygonCount())
+        if kind == "daughter":
+            print(
+                f"\033[1mOVERLAP DETECTED> overlap between daughters of {self.name} \033[0m {transformedMeshesNames[i]} {transformedMeshesNames[j]} {overlapMesh.vertexCount()}"
+            )
+            self.mesh.addOverlapMesh([overlapMesh, _OverlapType.overlap])
+        elif kind == "daughterCoplanar":
+            print(
+                f"\033[1mOVERLAP DETECTED> coplanar overlap between daughters \033[0m {transformedMeshesNames[i]} {transformedMeshesNames[j]} {overlapMesh.vertexCount()}"
+            )
+            self.mesh.addOverlapMesh([overlapMesh, _OverlapType.coplanar])
+        elif kind == "mother":
+            print(
+                f"\033[1mOVERLAP DETECTED> overlap with mother \033[0m {transformedMeshesNames[i]} {overlapMesh.vertexCount()}"
             )
+            self.mesh.addOverlapMesh([overlapMesh, _OverlapType.protrusion])
+        elif kind == "motherCoplanar":
+            print(
+                f"\033[1mOVERLAP DETECTED> coplanar overlap between daughter and mother\033[0m {transformedMeshesNames[i]} {overlapMesh.vertexCount()}"
+            )
+            self.mesh.addOverlapMesh([overlapMesh, _OverlapType.coplanar])
 
-            if interMesh.vertexCount() != 0:
-                nOverlapsDetected[0] += 1
-                print(
-                    f"\033[1mOVERLAP DETECTED> overlap with mother \033[0m {transformedMeshesNames[i]} {interMesh.vertexCount()}"
-                )
-                self.mesh.addOverlapMesh([interMesh, _OverlapType.protrusion])
+    def _checkOverlapsParallel(
+        self, recursive, coplanar, debugIO, nOverlapsDetected, parallel, cache=None
+    ):
+        """
+        Process pool version of checkOverlaps. The logical volumes to check are collected
+        in the same order as the serial recursion and all of their mesh tests (that are not
+        already in the cache) are shared out over the pool. Overlaps are gathered back and
+        reported in the serial order.
+        """
+        from pyg4ometry.geant4 import IsAReplica as _IsAReplica
 
-        # coplanar with solid
-        # print 'coplanar with solid'
-        if coplanar:
-            for i in range(len(transformedMeshes)):
-                if debugIO:
-                    print(
-                        f"LogicalVolume.checkOverlaps> full daughter-mother coplanar test {transformedMeshesNames[i]}"
-                    ),
-
-                # cullCoplanar = self.mesh.localboundingmesh.coplanarIntersection(transformedBoundingMeshes[i])
-                # if cullCoplanar.vertexCount() == 0 :
-                #    continue
-                # print(self.mesh.localboundingmesh,transformedBoundingMeshes[i])
-                coplanarMesh = self.mesh.localmesh.coplanarIntersection(
-                    transformedMeshes[i]
-                )  # Need mother.coplanar(daughter) as typically mother is larger
-                if coplanarMesh.vertexCount() != 0:
-                    nOverlapsDetected[0] += 1
-                    print(
-                        f"\033[1mOVERLAP DETECTED> coplanar overlap between daughter and mother\033[0m {transformedMeshesNames[i]} {coplanarMesh.vertexCount()}"
-                    )
-                    self.mesh.addOverlapMesh([coplanarMesh, _OverlapType.coplanar])
+        global _overlapJobs
 
-        # recursively check entire tree
-        if recursive:
-            for d in self.daughterVolumes:
-                if type(d.logicalVolume) is _pyg4ometry.geant4.AssemblyVolume:
-                    continue  # no specific overlap check - handled by the PV of an assembly
-                # don't make any summary print out for a recursive call
-                d.logicalVolume.checkOverlaps(
-                    recursive=recursive,
-                    coplanar=coplanar,
-                    debugIO=debugIO,
-                    printOut=False,
-                    nOverlapsDetected=nOverlapsDetected,
+        logicalVolumes = []
+        self._collectOverlapCheckVolumes(recursive, logicalVolumes, set())
+
+        jobs = []
+        tasks = []
+        for lv in logicalVolumes:
+            if _IsAReplica(lv):
+                jobs.append(None)
+                continue
+            (
+                transformedMeshes,
+                transformedBoundingMeshes,
+                transformedMeshesNames,
+                tests,
+                placementKeys,
+            ) = lv._getOverlapTests(coplanar, debugIO or (lv is self), cache)
+
+            # results already known from the cache
+            cached = {}
+            if cache is not None:
+                motherKey = cache.meshHash(lv.mesh.localmesh)
+                for test in tests:
+                    key = cache.testKey(test, placementKeys, motherKey)
+                    found, result = cache.lookup(key)
+                    cached[test] = (key, found, result)
+
+            jobs.append(
+                (
+                    transformedMeshes,
+                    transformedBoundingMeshes,
+                    transformedMeshesNames,
+                    tests,
+                    cached,
                 )
+            )
+            tasks.extend(
+                (len(jobs) - 1, test) for test in tests if test not in cached or not cached[test][1]
+            )
 
-        # ok this logical has been checked
-        self.overlapChecked = True
+        # meshes are not picklable so the workers inherit them from this process
+        _overlapJobs = [
+            None if job is None else (job[0], job[1], lv.mesh, debugIO)
+            for job, lv in zip(jobs, logicalVolumes)
+        ]
+        try:
+            ctx = _mp.get_context("fork")
+            with ctx.Pool(parallel) as pool:
+                chunksize = max(1, len(tasks) // (4 * parallel))
+                results = pool.imap(_overlapWorker, tasks, chunksize)
+
+                for job, lv in zip(jobs, logicalVolumes):
+                    if job is None:
+                        lv.daughterVolumes[0]._checkInternalOverlaps(debugIO, nOverlapsDetected)
+                        lv.overlapChecked = True
+                        continue
 
-        if printOut:
-            print(nOverlapsDetected[0], " overlaps detected")
+                    transformedMeshesNames, tests, cached = job[2], job[3], job[4]
+                    for test in tests:
+                        if debugIO:
+                            _printOverlapTest(test, transformedMeshesNames)
+                        if test in cached and cached[test][1]:
+                            result = cached[test][2]
+                        else:
+                            result = next(results)
+                            if test in cached:
+                                cache.store(cached[test][0], result)
+                        if result is not None:
+                            overlapMesh = _meshFromVerticesAndPolygons(*result)
+                            lv._addOverlap(
+                                test, overlapMesh, transformedMeshesNames, nOverlapsDetected
+                            )
+                    lv.overlapChecked = True
+        finally:
+            _overlapJobs = []
+
+    def _collectOverlapCheckVolumes(self, recursive, logicalVolumes, visited):
+        """
+        Append this logical volume (and if recursive its daughters) that still require
+        an overlap check to logicalVolumes, in the order checkOverlaps would visit them.
+        """
+        from pyg4ometry.geant4 import IsAReplica as _IsAReplica
+
+        if self.overlapChecked or id(self) in visited:
+            return
+        visited.add(id(self))
+        logicalVolumes.append(self)
+
+        if _IsAReplica(self) or not recursive:
+            return
+
+        for d in self.daughterVolumes:
+            if type(d.logicalVolume) is _pyg4ometry.geant4.AssemblyVolume:
+                continue
+            d.logicalVolume._collectOverlapCheckVolumes(recursive, logicalVolumes, visited)
 
     def setSolid(self, solid):
         """
@@ -842,7 +1156,10 @@ class LogicalVolume:
         transformation then use replaceSolid
         """
         self.solid = solid
-        self.mesh = _Mesh(self.solid)
+        if _config.lazyMeshing:
+            self.__dict__.pop("_mesh", None)  # generated again on next use
+        else:
+            self.mesh = _Mesh(self.solid)
 
     def makeSolidTessellated(self):
         """
@@ -873,7 +1190,10 @@ class LogicalVolume:
 
     def extent(self, includeBoundingSolid=False):
         """
-        Compute the axis aligned extent of the logical volume.
+        Compute the axis aligned extent of the logical volume. Without the bounding
+        solid this is the extent of the daughters (through any assemblies), computed
+        from the (cached and incrementally refreshed) bounding boxes of its
+        placementTree. Only the meshes of the daughters are used.
 
         :param includeBoundingSolid: Include the bounding solid or not
         :type includeBoundingSolid: bool
@@ -883,30 +1203,9 @@ class LogicalVolume:
         if includeBoundingSolid:
             [vMin, vMax] = self.mesh.getBoundingBox()
             return [vMin, vMax]
-        else:
-            vMin = [1e99, 1e99, 1e99]
-            vMax = [-1e99, -1e99, -1e99]
-
-        # transform logical solid BB
-
-        for dv in self.daughterVolumes:
-            [vMinDaughter, vMaxDaughter] = dv.extent(True)
 
-            if vMaxDaughter[0] > vMax[0]:
-                vMax[0] = vMaxDaughter[0]
-            if vMaxDaughter[1] > vMax[1]:
-                vMax[1] = vMaxDaughter[1]
-            if vMaxDaughter[2] > vMax[2]:
-                vMax[2] = vMaxDaughter[2]
-
-            if vMinDaughter[0] < vMin[0]:
-                vMin[0] = vMinDaughter[0]
-            if vMinDaughter[1] < vMin[1]:
-                vMin[1] = vMinDaughter[1]
-            if vMinDaughter[2] < vMin[2]:
-                vMin[2] = vMinDaughter[2]
-
-        return [vMin, vMax]
+        [vMin, vMax] = self.placementTree().extent(includeRoot=False)
+        return [vMin.tolist(), vMax.tolist()]
 
     def depth(self, depth=0):
         """
@@ -921,6 +1220,13 @@ class LogicalVolume:
 
         return max(depthList)
 
+    def placementTree(self):
+        """
+        Return the PlacementTree of this volume, built on first use and refreshed
+        (only changed placements are recomputed) on each subsequent call.
+        """
+        return _cachedPlacementTree(self)
+
     def clipSolid(self, lengthSafety=1e-6):
         """
         Assuming the solid of this LV is a Box, reduce its dimensions and re-placement all daughters
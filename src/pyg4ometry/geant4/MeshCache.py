@@ -0,0 +1,131 @@
+from pyg4ometry import config as _config
+
+import collections as _collections
+import logging as _log
+
+
+class MeshCache:
+    """
+    Least recently used cache of solid meshes, owned by a Registry. Entries are keyed
+    on the solid identity and its evaluated parameter, unit and nslice/nstack state
+    (see SolidBase.meshCacheKey), so a changed define or mesh setting simply misses
+    the cache. Edits registered through Registry.registerSolidEdit drop the entries of
+    the solid and of all solids depending on it. Meshes are returned as clones so the
+    cached copy is never modified by the caller.
+
+    :param maxMemory: approximate memory cap in bytes, 0 disables the cache (default config.meshCacheMemory)
+    :type maxMemory: int
+    """
+
+    # approximate size of a mesh vertex and a mesh polygon in bytes
+    vertexBytes = 200
+    polygonBytes = 100
+
+    def __init__(self, maxMemory=None):
+        self.maxMemory = _config.meshCacheMemory if maxMemory is None else maxMemory
+        self.memory = 0
+        self.nHits = 0
+        self.nMisses = 0
+
+        self._entries = _collections.OrderedDict()  # key -> [mesh, size, id(solid)]
+        self._solidKeys = {}  # id(solid) -> set of keys
+
+    def __repr__(self):
+        return f"MeshCache : {len(self._entries)} meshes {self.memory} bytes"
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # meshes cannot be pickled (or deep copied), so a copy starts empty
+        state = self.__dict__.copy()
+        state["_entries"] = _collections.OrderedDict()
+        state["_solidKeys"] = {}
+        state["memory"] = 0
+        return state
+
+    def clear(self):
+        self._entries.clear()
+        self._solidKeys.clear()
+        self.memory = 0
+        self.nHits = 0
+        self.nMisses = 0
+
+    def meshSize(self, mesh):
+        """
+        Approximate memory used by a mesh in bytes.
+        """
+        return mesh.vertexCount() * self.vertexBytes + mesh.polygonCount() * self.polygonBytes
+
+    def mesh(self, solid, meshFunction):
+        """
+        Return the cached mesh of a solid or compute it with meshFunction and cache it.
+
+        :param solid: solid the mesh belongs to
+        :type solid: SolidBase
+        :param meshFunction: callable computing the mesh when it is not cached
+        :type meshFunction: function
+        """
+        if self.maxMemory <= 0:
+            return meshFunction()
+
+        key = solid.meshCacheKey()
+        if key in self._entries:
+            self.nHits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0].clone()
+
+        self.nMisses += 1
+        mesh = meshFunction()
+        self._store(solid, key, mesh.clone())
+        return mesh
+
+    def add(self, solid, mesh):
+        """
+        Cache a mesh of a solid computed elsewhere, e.g. in another process.
+
+        :param solid: solid the mesh belongs to
+        :type solid: SolidBase
+        :param mesh: mesh of the solid (stored, so not to be modified afterwards)
+        :type mesh: CSG
+        """
+        if self.maxMemory <= 0:
+            return
+        self._store(solid, solid.meshCacheKey(), mesh)
+
+    def _store(self, solid, key, mesh):
+        size = self.meshSize(mesh)
+        if size > self.maxMemory:
+            _log.info(f"MeshCache._store> {solid.name} too large to cache ({size} bytes)")
+            return
+
+        self._entries[key] = [mesh, size, id(solid)]
+        self._solidKeys.setdefault(id(solid), set()).add(key)
+        self.memory += size
+
+        while self.memory > self.maxMemory:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        mesh, size, solidId = self._entries.pop(key)
+        self.memory -= size
+        keys = self._solidKeys[solidId]
+        keys.discard(key)
+        if not keys:
+            del self._solidKeys[solidId]
+
+    def invalidate(self, solid, visited=None):
+        """
+        Remove the cached meshes of a solid and of all solids that depend on it.
+        """
+        if visited is None:
+            visited = set()
+        if id(solid) in visited:
+            return
+        visited.add(id(solid))
+
+        for key in list(self._solidKeys.get(id(solid), ())):
+            self._remove(key)
+
+        for dependent in getattr(solid, "dependents", []):
+            self.invalidate(dependent, visited)
@@ -0,0 +1,140 @@
+from pyg4ometry.utils import _load_pickle, _write_pickle
+
+import collections as _collections
+import hashlib as _hashlib
+import logging as _log
+import os as _os
+
+import numpy as _np
+
+
+class OverlapCache:
+    """
+    Persistent cache of overlap test results for LogicalVolume.checkOverlaps. Each
+    test is keyed by a content hash of the meshes involved and of the placement
+    transforms (rotation, position and scale) of the daughters, so only the tests
+    involving a changed solid, mesh setting or placement are rerun. The mesh
+    content reflects both the solid parameters and its nslice/nstack settings.
+
+    Results and memoised mesh hashes are both bounded, the least recently used
+    are evicted beyond maxResults and maxMeshHashes.
+
+    :param fileName: file the cache is loaded from (if it exists) and saved to
+    :type fileName: str
+    :param maxResults: maximum number of test results kept
+    :type maxResults: int
+    :param maxMeshHashes: maximum number of mesh hashes memoised (each holds a reference to its mesh)
+    :type maxMeshHashes: int
+    """
+
+    def __init__(self, fileName=None, maxResults=1000000, maxMeshHashes=10000):
+        self.fileName = fileName
+        self.maxResults = maxResults
+        self.maxMeshHashes = maxMeshHashes
+        self.results = _collections.OrderedDict()
+        self.nHits = 0
+        self.nMisses = 0
+
+        # id(mesh) -> (mesh, hash), the mesh is kept so its id cannot be reused
+        self._meshHashes = _collections.OrderedDict()
+
+        if fileName is not None and _os.path.exists(fileName):
+            self.load(fileName)
+
+    def __repr__(self):
+        return f"OverlapCache : {self.fileName} {len(self.results)} results"
+
+    def __len__(self):
+        return len(self.results)
+
+    def load(self, fileName=None):
+        """
+        Load (and merge) results from a cache file.
+        """
+        fileName = fileName or self.fileName
+        self.results.update(_load_pickle(fileName))
+        self._prune()
+        _log.info("OverlapCache.load> %s %d results" % (fileName, len(self.results)))
+
+    def save(self, fileName=None):
+        """
+        Write all results to a cache file.
+        """
+        fileName = fileName or self.fileName
+        if fileName is None:
+            msg = "No file name given to save the overlap cache to"
+            raise ValueError(msg)
+        _write_pickle(dict(self.results), fileName)
+
+    def clear(self):
+        self.results = _collections.OrderedDict()
+        self._meshHashes = _collections.OrderedDict()
+        self.nHits = 0
+        self.nMisses = 0
+
+    def _prune(self):
+        while len(self.results) > self.maxResults:
+            self.results.popitem(last=False)
+        while len(self._meshHashes) > self.maxMeshHashes:
+            self._meshHashes.popitem(last=False)
+
+    def meshHash(self, mesh, memoise=True):
+        """
+        Content hash of a mesh (vertices and faces).
+
+        :param memoise: remember the hash for this mesh instance (holds a reference to it)
+        :type memoise: bool
+        """
+        if id(mesh) in self._meshHashes:
+            self._meshHashes.move_to_end(id(mesh))
+            return self._meshHashes[id(mesh)][1]
+
+        vertices, faces = mesh.toVerticesAndFaces()
+        h = _hashlib.sha1()
+        h.update(_np.ascontiguousarray(vertices, dtype=_np.float64).tobytes())
+        h.update(_np.ascontiguousarray(faces, dtype=_np.int32).tobytes())
+        meshHash = h.hexdigest()
+
+        if memoise:
+            self._meshHashes[id(mesh)] = (mesh, meshHash)
+            self._prune()
+        return meshHash
+
+    def placementHash(self, mesh, pv):
+        """
+        Content hash of a mesh placed by a physical volume.
+        """
+        h = _hashlib.sha1(self.meshHash(mesh).encode())
+        h.update(_np.array(pv.rotation.eval(), dtype=_np.float64).tobytes())
+        h.update(_np.array(pv.position.eval(), dtype=_np.float64).tobytes())
+        if pv.scale:
+            h.update(_np.array(pv.scale.eval(), dtype=_np.float64).tobytes())
+        return h.hexdigest()
+
+    def testKey(self, test, placementKeys, motherKey):
+        """
+        Key of a single overlap test (kind, i, j) from LogicalVolume._getOverlapTests.
+        """
+        kind, i, j = test
+        other = placementKeys[j] if j is not None else motherKey
+        return _hashlib.sha1(f"{kind} {placementKeys[i]} {other}".encode()).hexdigest()
+
+    def lookup(self, key):
+        """
+        :returns: [found, result] where result is None (no overlap) or the overlap mesh
+                  as [vertices, polygons]
+        """
+        if key in self.results:
+            self.nHits += 1
+            self.results.move_to_end(key)
+            return True, self.results[key]
+        self.nMisses += 1
+        return False, None
+
+    def store(self, key, result):
+        """
+        :param result: None (no overlap) or the overlap mesh as [vertices, polygons]
+        """
+        self.results[key] = result
+        self.results.move_to_end(key)
+        self._prune()
@@ -1,4 +1,7 @@
 from .ReplicaVolume import ReplicaVolume as _ReplicaVolume
+from .ReplicaVolume import _CopyMeshes
+from .PlacementTree import _copiesBoundingBox
+from pyg4ometry import config as _config
 import pyg4ometry.geant4.solid as _solid
 from pyg4ometry.visualisation import Mesh as _Mesh
 from pyg4ometry.visualisation import VisualisationOptions as _VisOptions
@@ -187,6 +190,22 @@ class ParameterisedVolume(_ReplicaVolume):
             self.pzTopCut = pzTopCut
             self.lunit = lunit
 
+    _dimensionsTypes = {
+        "Box": BoxDimensions,
+        "Tubs": TubeDimensions,
+        "Cons": ConeDimensions,
+        "Orb": OrbDimensions,
+        "Sphere": SphereDimensions,
+        "Torus": TorusDimensions,
+        "Hype": HypeDimensions,
+        "Para": ParaDimensions,
+        "Trd": TrdDimensions,
+        "Trap": TrapDimensions,
+        "Polycone": PolyconeDimensions,
+        "Polyhedra": PolyhedraDimensions,
+        "Ellipsoid": EllipsoidDimensions,
+    }
+
     def __init__(
         self,
         name,
@@ -215,268 +234,247 @@ class ParameterisedVolume(_ReplicaVolume):
         # physical visualisation options
         self.visOptions = _VisOptions()
 
-        # Create parameterised meshes
+        # Create parameterised meshes, made on first use of each copy unless meshing eagerly
         self.meshes = self.createParameterisedMeshes()
+        if not _config.lazyMeshing:
+            self.meshes.meshAll()
 
     def createParameterisedMeshes(self):
-        meshes = []
+        """
+        Return the meshes of the copies as a sequence that makes the mesh of a copy on
+        first access. Copies with the same dimensions share a mesh. Copies whose
+        dimensions do not match the type of the solid are skipped.
+        """
+        meshes = _CopyMeshes()
+        dimensionsType = self._dimensionsTypes.get(self.logicalVolume.solid.type, ())
 
         for paramData, i in zip(self.paramData, range(0, int(self.ncopies), 1)):
-            # box
-            if self.logicalVolume.solid.type == "Box" and isinstance(paramData, self.BoxDimensions):
-                solid = _solid.Box(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pX,
-                    paramData.pY,
-                    paramData.pZ,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    False,
-                )
-
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Tubs" and isinstance(
-                paramData, self.TubeDimensions
-            ):
-                solid = _solid.Tubs(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    paramData.pDz,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    False,
-                )
-
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Cons" and isinstance(
-                paramData, self.ConeDimensions
-            ):
-                solid = _solid.Cons(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin1,
-                    paramData.pRMax1,
-                    paramData.pRMin2,
-                    paramData.pRMax2,
-                    paramData.pDz,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Orb" and isinstance(
-                paramData, self.OrbDimensions
-            ):
-                solid = _solid.Orb(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMax,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Sphere" and isinstance(
-                paramData, self.SphereDimensions
-            ):
-                solid = _solid.Sphere(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    paramData.pSTheta,
-                    paramData.pDTheta,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Torus" and isinstance(
-                paramData, self.TorusDimensions
-            ):
-                solid = _solid.Torus(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    paramData.pRTor,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Hype" and isinstance(
-                paramData, self.HypeDimensions
-            ):
-                solid = _solid.Hype(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.innerRadius,
-                    paramData.outerRadius,
-                    paramData.innerStereo,
-                    paramData.outerStereo,
-                    paramData.lenZ,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Para" and isinstance(
-                paramData, self.ParaDimensions
-            ):
-                solid = _solid.Para(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pX,
-                    paramData.pY,
-                    paramData.pZ,
-                    paramData.pAlpha,
-                    paramData.pTheta,
-                    paramData.pPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Trd" and isinstance(
-                paramData, self.TrdDimensions
-            ):
-                solid = _solid.Trd(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pX1,
-                    paramData.pX2,
-                    paramData.pY1,
-                    paramData.pY2,
-                    paramData.pZ,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Trap" and isinstance(
-                paramData, self.TrapDimensions
-            ):
-                solid = _solid.Trap(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pDz,
-                    paramData.pTheta,
-                    paramData.pDPhi,
-                    paramData.pDy1,
-                    paramData.pDx1,
-                    paramData.pDx2,
-                    paramData.pAlp1,
-                    paramData.pDy2,
-                    paramData.pDx3,
-                    paramData.pDx4,
-                    paramData.pAlp2,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Polycone" and isinstance(
-                paramData, self.PolyconeDimensions
-            ):
-                solid = _solid.Polycone(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    paramData.pZpl,
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    False,
+            if isinstance(paramData, dimensionsType):
+                meshes.append(
+                    self._dimensionsKey(paramData), self._createParameterisedMesh, paramData, i
                 )
 
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Polyhedra" and isinstance(
-                paramData, self.PolyhedraDimensions
-            ):
-                solid = _solid.Polyhedra(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    paramData.numSide,
-                    len(paramData.pZpl),
-                    paramData.pZpl,
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Ellipsoid" and isinstance(
-                paramData, self.EllipsoidDimensions
-            ):
-                solid = _solid.Ellipsoid(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pxSemiAxis,
-                    paramData.pySemiAxis,
-                    paramData.pzSemiAxis,
-                    paramData.pzBottomCut,
-                    paramData.pzTopCut,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
+        return meshes
 
+    def _dimensionsKey(self, paramData):
+        """
+        Key of the geometry of a copy: the solid type and mesh granularity with the
+        evaluated dimensions and units.
+        """
+        from pyg4ometry.gdml.Defines import evaluateToFloat
+
+        solid = self.logicalVolume.solid
+        key = [solid.type, getattr(solid, "nslice", None), getattr(solid, "nstack", None)]
+        for name, value in sorted(vars(paramData).items()):
+            if name in ("lunit", "aunit"):
+                key.append((name, value))
             else:
-                pass
-
-        return meshes
+                value = evaluateToFloat(self.logicalVolume.registry, value)
+                key.append((name, tuple(_np.ravel(value).tolist())))
+        return tuple(key)
+
+    def _createParameterisedMesh(self, paramData, i):
+        solidType = self.logicalVolume.solid.type
+
+        # box
+        if solidType == "Box" and isinstance(paramData, self.BoxDimensions):
+            solid = _solid.Box(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pX,
+                paramData.pY,
+                paramData.pZ,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                False,
+            )
+
+        elif solidType == "Tubs" and isinstance(paramData, self.TubeDimensions):
+            solid = _solid.Tubs(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin,
+                paramData.pRMax,
+                paramData.pDz,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                False,
+            )
+
+        elif solidType == "Cons" and isinstance(paramData, self.ConeDimensions):
+            solid = _solid.Cons(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin1,
+                paramData.pRMax1,
+                paramData.pRMin2,
+                paramData.pRMax2,
+                paramData.pDz,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                False,
+            )
+
+        elif solidType == "Orb" and isinstance(paramData, self.OrbDimensions):
+            solid = _solid.Orb(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMax,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif solidType == "Sphere" and isinstance(paramData, self.SphereDimensions):
+            solid = _solid.Sphere(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin,
+                paramData.pRMax,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                paramData.pSTheta,
+                paramData.pDTheta,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif solidType == "Torus" and isinstance(paramData, self.TorusDimensions):
+            solid = _solid.Torus(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin,
+                paramData.pRMax,
+                paramData.pRTor,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif solidType == "Hype" and isinstance(paramData, self.HypeDimensions):
+            solid = _solid.Hype(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.innerRadius,
+                paramData.outerRadius,
+                paramData.innerStereo,
+                paramData.outerStereo,
+                paramData.lenZ,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif solidType == "Para" and isinstance(paramData, self.ParaDimensions):
+            solid = _solid.Para(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pX,
+                paramData.pY,
+                paramData.pZ,
+                paramData.pAlpha,
+                paramData.pTheta,
+                paramData.pPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                False,
+            )
+
+        elif solidType == "Trd" and isinstance(paramData, self.TrdDimensions):
+            solid = _solid.Trd(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pX1,
+                paramData.pX2,
+                paramData.pY1,
+                paramData.pY2,
+                paramData.pZ,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                False,
+            )
+
+        elif solidType == "Trap" and isinstance(paramData, self.TrapDimensions):
+            solid = _solid.Trap(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pDz,
+                paramData.pTheta,
+                paramData.pDPhi,
+                paramData.pDy1,
+                paramData.pDx1,
+                paramData.pDx2,
+                paramData.pAlp1,
+                paramData.pDy2,
+                paramData.pDx3,
+                paramData.pDx4,
+                paramData.pAlp2,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                False,
+            )
+
+        elif solidType == "Polycone" and isinstance(paramData, self.PolyconeDimensions):
+            solid = _solid.Polycone(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pSPhi,
+                paramData.pDPhi,
+                paramData.pZpl,
+                paramData.pRMin,
+                paramData.pRMax,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                False,
+            )
+
+        elif solidType == "Polyhedra" and isinstance(paramData, self.PolyhedraDimensions):
+            solid = _solid.Polyhedra(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pSPhi,
+                paramData.pDPhi,
+                paramData.numSide,
+                len(paramData.pZpl),
+                paramData.pZpl,
+                paramData.pRMin,
+                paramData.pRMax,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                False,
+            )
+
+        elif solidType == "Ellipsoid" and isinstance(paramData, self.EllipsoidDimensions):
+            solid = _solid.Ellipsoid(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pxSemiAxis,
+                paramData.pySemiAxis,
+                paramData.pzSemiAxis,
+                paramData.pzBottomCut,
+                paramData.pzTopCut,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        return _Mesh(solid)
 
     def __repr__(self):
         return ""
@@ -484,32 +482,5 @@ class ParameterisedVolume(_ReplicaVolume):
     def extent(self, includeBoundingSolid=True):
         _log.info("ParametrisedVolume.extent> %s" % (self.name))
 
-        vMin = [1e99, 1e99, 1e99]
-        vMax = [-1e99, -1e99, -1e99]
-
-        for trans, mesh in zip(self.transforms, self.meshes):
-            # transform daughter meshes to parent coordinates
-            dvmrot = _trans.tbxyz2matrix(trans[0].eval())
-            dvtra = _np.array(trans[1].eval())
-
-            [vMinDaughter, vMaxDaughter] = mesh.getBoundingBox()
-
-            # TODO do we need scale here?
-            vMinDaughter = _np.array(dvmrot.dot(vMinDaughter) + dvtra).flatten()
-            vMaxDaughter = _np.array(dvmrot.dot(vMaxDaughter) + dvtra).flatten()
-
-            if vMaxDaughter[0] > vMax[0]:
-                vMax[0] = vMaxDaughter[0]
-            if vMaxDaughter[1] > vMax[1]:
-                vMax[1] = vMaxDaughter[1]
-            if vMaxDaughter[2] > vMax[2]:
-                vMax[2] = vMaxDaughter[2]
-
-            if vMinDaughter[0] < vMin[0]:
-                vMin[0] = vMinDaughter[0]
-            if vMinDaughter[1] < vMin[1]:
-                vMin[1] = vMinDaughter[1]
-            if vMinDaughter[2] < vMin[2]:
-                vMin[2] = vMinDaughter[2]
-
-        return [vMin, vMax]
+        vMin, vMax = _copiesBoundingBox(self)
+        return [vMin.tolist(), vMax.tolist()]
@@ -1,4 +1,5 @@
 import pyg4ometry.transformation as _trans
+from .PlacementTree import _transformBoundingBoxes
 from pyg4ometry.visualisation import VisualisationOptions as _VisOptions
 import pyg4ometry.geant4.solid as _solid
 from pyg4ometry.visualisation import Mesh as _Mesh
@@ -117,20 +118,19 @@ class PhysicalVolume:
     def extent(self, includeBoundingSolid=True):
         _log.info("PhysicalVolume.extent> %s" % (self.name))
 
-        # transform daughter meshes to parent coordinates
-        dvmrot = _trans.tbxyz2matrix(self.rotation.eval())
+        # placed as by Geant4, the inverse rotation with the scale applied first
+        dvmrot = _trans.tbxyz2matrix(self.rotation.eval()).T
+        if self.scale:
+            dvmrot = dvmrot * _np.array(self.scale.eval())
         dvtra = _np.array(self.position.eval())
 
         [vMin, vMax] = self.logicalVolume.extent(includeBoundingSolid)
 
-        # TODO do we need scale here?
-        vMinPrime = _np.array(dvmrot.dot(vMin) + dvtra).flatten()
-        vMaxPrime = _np.array(dvmrot.dot(vMax) + dvtra).flatten()
-
-        vmin = [min(a, b) for a, b in zip(vMinPrime, vMaxPrime)]
-        vmax = [max(a, b) for a, b in zip(vMinPrime, vMaxPrime)]
+        vMinPrime, vMaxPrime = _transformBoundingBoxes(
+            dvmrot[None], dvtra[None], _np.array([vMin]), _np.array([vMax])
+        )
 
-        return [vmin, vmax]
+        return [vMinPrime[0].tolist(), vMaxPrime[0].tolist()]
 
     def getAABBMesh(self):
         """return CSG.core (symmetric around the origin) axis aligned bounding box mesh"""
@@ -0,0 +1,385 @@
+import numpy as _np
+
+
+def _tbxyz2matrices(angles):
+    """
+    Vectorised transformation.tbxyz2matrix of an array(N,3) of angles.
+    """
+    s = _np.sin(angles)
+    c = _np.cos(angles)
+    sx, sy, sz = s[:, 0], s[:, 1], s[:, 2]
+    cx, cy, cz = c[:, 0], c[:, 1], c[:, 2]
+
+    # mz.dot(my.dot(mx))
+    m = _np.empty((len(angles), 3, 3))
+    m[:, 0, 0] = cz * cy
+    m[:, 0, 1] = cz * sy * sx - sz * cx
+    m[:, 0, 2] = cz * sy * cx + sz * sx
+    m[:, 1, 0] = sz * cy
+    m[:, 1, 1] = sz * sy * sx + cz * cx
+    m[:, 1, 2] = sz * sy * cx - cz * sx
+    m[:, 2, 0] = -sy
+    m[:, 2, 1] = cy * sx
+    m[:, 2, 2] = cy * cx
+    return m
+
+
+# the eight corners of a box, True where the corner takes the maximum
+_boxCorners = _np.array([[(k >> j) & 1 for j in range(3)] for k in range(8)], dtype=bool)
+
+
+def _transformBoundingBoxes(rotations, translations, vMin, vMax):
+    """
+    Axis aligned bounding boxes of the boxes vMin to vMax (arrays(N,3)) transformed
+    by rotations (array(N,3,3)) and translations (array(N,3)) in one batch, from all
+    eight corners of each box. Returns the arrays(N,3) of minima and maxima.
+    """
+    corners = _np.where(_boxCorners, vMax[:, None, :], vMin[:, None, :])
+    corners = _np.einsum("nij,nkj->nki", rotations, corners) + translations[:, None, :]
+    return corners.min(axis=1), corners.max(axis=1)
+
+
+def _copiesBoundingBox(physicalVolume, rotation=None, translation=None):
+    """
+    Axis aligned bounding box of all copies of a replica, parameterised or division
+    volume in its mother, optionally with the mother transformed by rotation and
+    translation. Returns [1e99]*3, [-1e99]*3 for no copies.
+    """
+    meshes = physicalVolume.meshes
+    if len(meshes) == 0:
+        return _np.full(3, 1e99), _np.full(3, -1e99)
+
+    if physicalVolume.type == "parametrised":
+        transforms = [(t[0].eval(), t[1].eval()) for t in physicalVolume.transforms]
+    else:
+        transforms = physicalVolume.transforms
+    angles = _np.array([t[0] for t in transforms], dtype=float).reshape(-1, 3)
+    positions = _np.array([t[1] for t in transforms], dtype=float).reshape(-1, 3)
+
+    # copies are drawn with the rotation itself rather than its inverse
+    rotations = _tbxyz2matrices(angles)
+    if rotation is not None:
+        rotations = rotation @ rotations
+        positions = positions @ rotation.T
+    if translation is not None:
+        positions = positions + translation
+
+    boxes = _np.array([mesh.getLocalBoundingBox() for mesh in meshes])
+    vMin, vMax = _transformBoundingBoxes(rotations, positions, boxes[:, 0], boxes[:, 1])
+    return vMin.min(axis=0), vMax.max(axis=0)
+
+
+class PlacementTree:
+    """
+    The placement tree of a logical (or assembly) volume flattened into arrays. There
+    is one node per path through the tree, in depth first order, so the subtree of
+    node i is nodes i to subtreeEnd[i]-1. Node 0 is the volume itself. Replica,
+    parameterised and division volumes are leaf nodes placed at their mother, their
+    copies are in their meshes and transforms.
+
+    The local transform of a placement is rotation @ x + translation, where rotation
+    is the inverse of the placement rotation times the diagonal scale (as placed by
+    Geant4 and drawn by the viewers). The global transform of a node is relative to
+    the volume at the root.
+
+    Use refresh after placements change to recompute only the changed subtrees. A
+    change of the tree structure (daughters added or removed, a different logical
+    volume placed) is found by refresh and rebuilds the tree. The bounding boxes of
+    the nodes are cached in the same way, see boundingBoxes.
+
+    :param logicalVolume: volume at the root of the tree
+    :type logicalVolume: LogicalVolume or AssemblyVolume
+    """
+
+    def __init__(self, logicalVolume):
+        self.root = logicalVolume
+        self.build()
+
+    def __repr__(self):
+        return (
+            f"PlacementTree : {self.root.name} {len(self)} nodes {len(self.logicalVolumes)} volumes"
+        )
+
+    def __len__(self):
+        return len(self.physicalVolumes)
+
+    def _walk(self):
+        """
+        Yield (physicalVolume, logicalVolume, parent, depth) of each node in depth first order.
+        """
+        stack = [(None, self.root, -1, 0)]
+        index = 0
+        while stack:
+            pv, lv, parent, depth = stack.pop()
+            yield pv, lv, parent, depth
+
+            if pv is None or pv.type == "placement":
+                for dv in reversed(lv.daughterVolumes):
+                    stack.append((dv, dv.logicalVolume, index, depth + 1))
+            index += 1
+
+    def build(self):
+        """
+        Flatten the tree and compute all local and global transforms.
+        """
+        self.logicalVolumes = []  # unique volumes, indexed by lvIndex
+        self.physicalVolumes = []  # placement of each node, None for the root
+
+        lvIndices = {}
+        lvIndex = []
+        parentIndex = []
+        depth = []
+        for pv, lv, parent, d in self._walk():
+            i = lvIndices.get(id(lv))
+            if i is None:
+                i = lvIndices[id(lv)] = len(self.logicalVolumes)
+                self.logicalVolumes.append(lv)
+            self.physicalVolumes.append(pv)
+            lvIndex.append(i)
+            parentIndex.append(parent)
+            depth.append(d)
+
+        n = len(self.physicalVolumes)
+        self.lvIndex = _np.array(lvIndex, dtype=int)
+        self.parentIndex = _np.array(parentIndex, dtype=int)
+        self.depth = _np.array(depth, dtype=int)
+
+        # parents come before their children, so one backwards pass finds the ends
+        subtreeEnd = list(range(1, n + 1))
+        for i in range(n - 1, 0, -1):
+            p = parentIndex[i]
+            if subtreeEnd[i] > subtreeEnd[p]:
+                subtreeEnd[p] = subtreeEnd[i]
+        self.subtreeEnd = _np.array(subtreeEnd, dtype=int)
+
+        nodes = _np.arange(n)
+        (
+            self.localRotations,
+            self.localTranslations,
+            self.scales,
+        ) = self._evaluateLocalTransforms(nodes)
+        self.rotations = _np.empty((n, 3, 3))
+        self.translations = _np.empty((n, 3))
+        self._updateGlobalTransforms(nodes)
+
+        # bounding boxes, made on first use by boundingBoxes
+        self._boxMin = _np.full((n, 3), 1e99)
+        self._boxMax = _np.full((n, 3), -1e99)
+        self._staleBoxes = _np.ones(n, dtype=bool)
+        self._localBoxes = [None] * len(self.logicalVolumes)
+
+    def _evaluateLocalTransforms(self, nodes):
+        angles = _np.zeros((len(nodes), 3))
+        translations = _np.zeros((len(nodes), 3))
+        scales = _np.ones((len(nodes), 3))
+        for j, i in enumerate(nodes):
+            pv = self.physicalVolumes[i]
+            if pv is None or pv.type != "placement":
+                continue
+            angles[j] = pv.rotation.eval()
+            translations[j] = pv.position.eval()
+            if pv.scale:
+                scales[j] = pv.scale.eval()
+
+        # inverse of the rotation (its transpose) with the scale applied first
+        rotations = _np.swapaxes(_tbxyz2matrices(angles), 1, 2) * scales[:, None, :]
+        return rotations, translations, scales
+
+    def _updateGlobalTransforms(self, nodes):
+        """
+        Recompute the global transforms of nodes, which must include all of their
+        subtrees, level by level.
+        """
+        depths = self.depth[nodes]
+        for d in _np.unique(depths):
+            level = nodes[depths == d]
+            if d == 0:
+                self.rotations[level] = self.localRotations[level]
+                self.translations[level] = self.localTranslations[level]
+                continue
+
+            parents = self.parentIndex[level]
+            self.rotations[level] = self.rotations[parents] @ self.localRotations[level]
+            self.translations[level] = (
+                _np.einsum("nij,nj->ni", self.rotations[parents], self.localTranslations[level])
+                + self.translations[parents]
+            )
+
+    def _structureChanged(self):
+        n = 0
+        for pv, lv, parent, depth in self._walk():
+            if (
+                n >= len(self.physicalVolumes)
+                or pv is not self.physicalVolumes[n]
+                or lv is not self.logicalVolumes[self.lvIndex[n]]
+            ):
+                return True
+            n += 1
+        return n != len(self.physicalVolumes)
+
+    def refresh(self, physicalVolumes=None):
+        """
+        Recompute the transforms of the nodes whose placement changed and of their
+        subtrees. Returns the indices of the nodes whose global transform was
+        recomputed (all nodes if the structure changed and the tree was rebuilt).
+
+        :param physicalVolumes: placements to check (default all, also checking the structure)
+        :type physicalVolumes: list of PhysicalVolume
+        """
+        if physicalVolumes is None:
+            if self._structureChanged():
+                self.build()
+                return _np.arange(len(self))
+            nodes = _np.arange(1, len(self))
+        else:
+            ids = {id(pv) for pv in physicalVolumes}
+            nodes = _np.array(
+                [i for i, pv in enumerate(self.physicalVolumes) if id(pv) in ids], dtype=int
+            )
+
+        rotations, translations, scales = self._evaluateLocalTransforms(nodes)
+        changed = (
+            (rotations != self.localRotations[nodes]).any(axis=(1, 2))
+            | (translations != self.localTranslations[nodes]).any(axis=1)
+            | (scales != self.scales[nodes]).any(axis=1)
+        )
+        changedNodes = nodes[changed]
+        if len(changedNodes) == 0:
+            return changedNodes
+
+        self.localRotations[changedNodes] = rotations[changed]
+        self.localTranslations[changedNodes] = translations[changed]
+        self.scales[changedNodes] = scales[changed]
+
+        # all nodes in the subtrees of the changed nodes
+        count = _np.zeros(len(self) + 1, dtype=int)
+        _np.add.at(count, changedNodes, 1)
+        _np.add.at(count, self.subtreeEnd[changedNodes], -1)
+        affected = _np.flatnonzero(_np.cumsum(count[:-1]) > 0)
+
+        self._updateGlobalTransforms(affected)
+        self._staleBoxes[affected] = True
+        return affected
+
+    def boundingBoxes(self, nodes=None):
+        """
+        Axis aligned bounding boxes of the mesh of each node relative to the root,
+        as arrays(N,3) of the minima and maxima. The box of a replica, parameterised
+        or division node bounds all its copies. Nodes without a mesh (assemblies)
+        have an empty box of 1e99 to -1e99.
+
+        The boxes are cached and only recomputed for nodes moved since (found by
+        refresh) or whose logical volume has a different mesh. All eight corners of
+        the cached local box of each mesh are transformed in one batch. Only the
+        meshes of the volumes of nodes are used (so made, if meshed lazily), and
+        the boxes of the other nodes are left as they were.
+
+        :param nodes: indices of the nodes to compute the boxes of (default all)
+        :type nodes: list of int
+        """
+        if nodes is None:
+            nodes = _np.arange(len(self))
+        nodes = _np.asarray(nodes, dtype=int)
+
+        # local boxes of the volumes of nodes, marking all their nodes if changed
+        for i in _np.unique(self.lvIndex[nodes]):
+            lv = self.logicalVolumes[i]
+            box = None
+            if lv.type == "logical" and lv.mesh is not None:
+                box = lv.mesh.getLocalBoundingBox()
+            if box is not self._localBoxes[i]:
+                self._localBoxes[i] = box
+                self._staleBoxes[self.lvIndex == i] = True
+
+        nodes = nodes[self._staleBoxes[nodes]]
+        if len(nodes) != 0:
+            copies = []
+            meshed = []
+            for i in nodes:
+                pv = self.physicalVolumes[i]
+                if pv is not None and pv.type != "placement":
+                    copies.append(i)
+                elif self._localBoxes[self.lvIndex[i]] is not None:
+                    meshed.append(i)
+
+            self._boxMin[nodes] = 1e99
+            self._boxMax[nodes] = -1e99
+
+            if meshed:
+                meshed = _np.array(meshed, dtype=int)
+                boxes = _np.array([self._localBoxes[j] for j in self.lvIndex[meshed]])
+                self._boxMin[meshed], self._boxMax[meshed] = _transformBoundingBoxes(
+                    self.rotations[meshed], self.translations[meshed], boxes[:, 0], boxes[:, 1]
+                )
+
+            for i in copies:
+                self._boxMin[i], self._boxMax[i] = _copiesBoundingBox(
+                    self.physicalVolumes[i], self.rotations[i], self.translations[i]
+                )
+
+            self._staleBoxes[nodes] = False
+
+        return self._boxMin, self._boxMax
+
+    def outerNodes(self, index=0):
+        """
+        Indices of the outermost meshed nodes placed in node index, the nodes placed
+        directly in it and, through assemblies (which have no mesh), in those.
+        """
+        nodes = []
+        stack = self.children(index)[::-1]
+        while stack:
+            i = stack.pop()
+            if self.logicalVolume(i).type == "assembly":
+                stack.extend(self.children(i)[::-1])
+            else:
+                nodes.append(i)
+        return nodes
+
+    def extent(self, includeRoot=True):
+        """
+        Axis aligned extent [vMin, vMax] of the root relative to itself, from the
+        boxes of its outerNodes (and its own mesh if includeRoot). Daughters are
+        inside their mothers, so the meshes of the nodes deeper in the tree are not
+        used (nor made, if meshed lazily). Returns [1e99]*3, [-1e99]*3 if there are
+        no meshes.
+
+        :param includeRoot: include the mesh of the root volume
+        :type includeRoot: bool
+        """
+        nodes = self.outerNodes()
+        if includeRoot:
+            nodes = [0, *nodes]
+
+        vMin = _np.full(3, 1e99)
+        vMax = _np.full(3, -1e99)
+        if nodes:
+            boxMin, boxMax = self.boundingBoxes(nodes)
+            vMin = _np.minimum(vMin, boxMin[nodes].min(axis=0))
+            vMax = _np.maximum(vMax, boxMax[nodes].max(axis=0))
+        return [vMin, vMax]
+
+    def children(self, index):
+        """
+        Indices of the nodes placed directly in node index.
+        """
+        children = []
+        i = index + 1
+        end = self.subtreeEnd[index]
+        while i < end:
+            children.append(i)
+            i = self.subtreeEnd[i]
+        return children
+
+    def logicalVolume(self, index):
+        return self.logicalVolumes[self.lvIndex[index]]
+
+
+def _cachedPlacementTree(volume):
+    tree = volume.__dict__.get("_placementTree")
+    if tree is None or tree.root is not volume:
+        tree = PlacementTree(volume)
+        volume._placementTree = tree
+    else:
+        tree.refresh()
+    return tree
@@ -1,7 +1,11 @@
 from collections import defaultdict as _defaultdict
+import multiprocessing as _mp
 import pyg4ometry.exceptions as _exceptions
+from pyg4ometry import config as _config
 from . import _Material as _mat
 from . import solid
+from .DefineCache import DefineCache as _DefineCache
+from .MeshCache import MeshCache as _MeshCache
 
 
 def solidName(var):
@@ -18,6 +22,23 @@ def removeprefix(string: str, prefix: str, /) -> str:
         return string[:]
 
 
+# solids shared with the forked _prefetchMeshWorker processes
+_prefetchJobs = []
+
+
+def _prefetchMeshWorker(iSolid):
+    solid = _prefetchJobs[iSolid]
+
+    # pool workers cannot start pools of their own
+    _config.multiUnionParallel = 0
+
+    try:
+        vertices, polygons, _ = solid.mesh().toVerticesAndPolygons()
+    except (_exceptions.NullMeshError, ValueError):
+        return None  # reported on first use of the volume mesh, as in the serial path
+    return vertices, polygons
+
+
 class Registry:
     """
     Object to store geometry for input and output.
@@ -64,6 +85,8 @@ class Registry:
         self.logicalVolumeUsageCountDict = _defaultdict(int)  # named logical usage in physical
 
         self.editedSolids = []  # Solids changed post-initialisation
+        self.meshCache = _MeshCache()  # Meshes of boolean solids
+        self.defineCache = _DefineCache()  # Evaluated values of defines
 
         self.expressionParser = None
 
@@ -101,6 +124,8 @@ class Registry:
         self.logicalVolumeUsageCountDict.clear()
 
         self.editedSolids = []
+        self.meshCache.clear()
+        self.defineCache.clear()
 
     def getExpressionParser(self):
         if not self.expressionParser:
@@ -113,6 +138,64 @@ class Registry:
     def registerSolidEdit(self, solid):
         if solid.name in self.solidDict:
             self.editedSolids.append(solid.name)
+        self.meshCache.invalidate(solid)
+
+    def prefetchMeshes(self, parallel=0):
+        """
+        Generate the meshes of all logical volumes that are not meshed yet, rather than
+        on first use of each LogicalVolume.mesh. Each unique solid is meshed once, in a
+        (forked) process pool if parallel > 1, and volumes sharing a solid get a copy of
+        its mesh. Volumes whose solid fails to mesh are left to report the error on first
+        use of their mesh.
+
+        :param parallel: number of processes (0 or 1 for serial)
+        :type parallel: int
+        """
+        from pyg4ometry.visualisation import Mesh as _Mesh
+        from pyg4ometry.visualisation import _meshFromVerticesAndPolygons
+
+        global _prefetchJobs
+
+        logicalVolumes = [
+            lv
+            for lv in self.logicalVolumeDict.values()
+            if lv.type == "logical" and not lv.isMeshed()
+        ]
+        solids = list({id(lv.solid): lv.solid for lv in logicalVolumes}.values())
+
+        meshes = {}
+        if parallel <= 1 or len(solids) < 2:
+            for s in solids:
+                try:
+                    meshes[id(s)] = s.mesh()
+                except (_exceptions.NullMeshError, ValueError):
+                    pass  # reported on first use of the volume mesh
+        else:
+            _prefetchJobs = solids
+            try:
+                ctx = _mp.get_context("fork")
+                with ctx.Pool(parallel) as pool:
+                    chunksize = max(1, len(solids) // (4 * parallel))
+                    results = pool.imap(_prefetchMeshWorker, range(len(solids)), chunksize)
+                    for s, result in zip(solids, results):
+                        if result is not None:
+                            meshes[id(s)] = _meshFromVerticesAndPolygons(*result)
+            finally:
+                _prefetchJobs = []
+
+        used = set()
+        for lv in logicalVolumes:
+            mesh = meshes.get(id(lv.solid))
+            if mesh is None:
+                continue
+            if id(lv.solid) in used:
+                mesh = mesh.clone()
+            used.add(id(lv.solid))
+
+            try:
+                lv.mesh = _Mesh(lv.solid, mesh)
+            except (_exceptions.NullMeshError, ValueError):
+                pass
 
     def addMaterial(self, material, dontWarnIfAlreadyAdded=False):
         """
@@ -384,6 +467,7 @@ class Registry:
             raise _exceptions.IdenticalNameError(define.name, "define")
         else:
             self.defineDict[define.name] = define
+            self.defineCache.invalidateName(define.name)
 
         self.defineNameCount[define.name] += 1
 
@@ -410,6 +494,7 @@ class Registry:
             incrementRenameDict[define.name] = define.name
 
         self.defineDict[define.name] = define
+        self.defineCache.invalidateName(define.name)
         define.registry = self
 
         self.defineNameCount[define.name] += 1
@@ -540,14 +625,16 @@ class Registry:
         if first:
             self.logicalVolumeList = []
 
+        self._orderLogicalVolumes(lvName, set(self.logicalVolumeList))
+
+    def _orderLogicalVolumes(self, lvName, ordered):
         lv = self.logicalVolumeDict[lvName]
         for daughter in lv.daughterVolumes:
             dlvName = daughter.logicalVolume.name
-            try:
-                self.logicalVolumeList.index(dlvName)
-            except ValueError:
-                self.orderLogicalVolumes(dlvName, False)
+            if dlvName not in ordered:
+                self._orderLogicalVolumes(dlvName, ordered)
                 self.logicalVolumeList.append(dlvName)
+                ordered.add(dlvName)
 
     def addVolumeRecursive(
         self,
@@ -555,6 +642,7 @@ class Registry:
         collapseAssemblies=False,
         incrementRenameDict=None,
         userRenameDict=None,
+        transferredIds=None,
     ):
         """
         Transfer a volume hierarchy to this registry. Any objects that had a registry set to
@@ -564,6 +652,10 @@ class Registry:
         :param collapseAssemblies: if True, daughters of AssemblyVolume's will be attached directly to the mother of the assembly and the AssemblyVolume itself will be eliminated from the geometry tree
         :param incrementRenameDict: ignore - dictionary used internally for potentially incrementing names
         :param userRenameDict: a dictionary of find/replace regex strings to be used to rename volumes/materials/etc.
+        :param transferredIds: ignore - set used internally of the ids of volumes, solids and materials already transferred
+
+        A logical volume placed many times is only descended into and transferred once, along with
+        its solid and material.
 
         In the case where some object or variable has a name (e.g. 'X') that already exists
         in this registry, it will be incremented to 'X_1'.
@@ -582,6 +674,8 @@ class Registry:
 
         if incrementRenameDict is None:
             incrementRenameDict = {}
+        if transferredIds is None:
+            transferredIds = set()
 
         if isinstance(volume, _PhysicalVolume) and volume.type == "placement":
             self.addVolumeRecursive(
@@ -589,6 +683,7 @@ class Registry:
                 collapseAssemblies,
                 incrementRenameDict,
                 userRenameDict,
+                transferredIds,
             )
 
             # add members from physical volume
@@ -605,6 +700,10 @@ class Registry:
             self.transferPhysicalVolume(volume, incrementRenameDict, userRenameDict)
 
         elif isinstance(volume, _LogicalVolume):
+            if id(volume) in transferredIds:
+                return incrementRenameDict  # already transferred with all its members
+            transferredIds.add(id(volume))
+
             # loop over all daughters
             assembliesToRemove = []
             for dv in volume.daughterVolumes:
@@ -622,11 +721,12 @@ class Registry:
                         names,
                         incrementRenameDict,
                         userRenameDict,
+                        transferredIds,
                     )
                     assembliesToRemove.append(dv.name)
                 else:
                     self.addVolumeRecursive(
-                        dv, collapseAssemblies, incrementRenameDict, userRenameDict
+                        dv, collapseAssemblies, incrementRenameDict, userRenameDict, transferredIds
                     )
 
             # if we're collapsing assembly volumes, prune any assembly daughters
@@ -634,16 +734,26 @@ class Registry:
                 assembly = volume._daughterVolumesDict.pop(assemblyName)
                 volume.daughterVolumes.remove(assembly)
 
-            # add members from logical volume
-            self.transferSolidDefines(volume.solid, incrementRenameDict, userRenameDict)
-            self.transferSolid(volume.solid, incrementRenameDict, userRenameDict)
-            self.transferMaterial(volume.material, incrementRenameDict, userRenameDict)
+            # add members from logical volume, which may be shared with other volumes
+            if id(volume.solid) not in transferredIds:
+                transferredIds.add(id(volume.solid))
+                self.transferSolidDefines(volume.solid, incrementRenameDict, userRenameDict)
+                self.transferSolid(volume.solid, incrementRenameDict, userRenameDict)
+            if id(volume.material) not in transferredIds:
+                transferredIds.add(id(volume.material))
+                self.transferMaterial(volume.material, incrementRenameDict, userRenameDict)
             self.transferLogicalVolume(volume, incrementRenameDict, userRenameDict)
 
         elif isinstance(volume, _AssemblyVolume):
+            if id(volume) in transferredIds:
+                return incrementRenameDict
+            transferredIds.add(id(volume))
+
             # loop over all daughters
             for dv in volume.daughterVolumes:
-                self.addVolumeRecursive(dv, collapseAssemblies, incrementRenameDict, userRenameDict)
+                self.addVolumeRecursive(
+                    dv, collapseAssemblies, incrementRenameDict, userRenameDict, transferredIds
+                )
 
             # add members from logical volume
             self.transferLogicalVolume(volume, incrementRenameDict, userRenameDict)
@@ -662,6 +772,7 @@ class Registry:
         names,
         incrementRenameDict,
         userRenameDict,
+        transferredIds=None,
     ):
         """
         Transfer and collapse an AssemblyVolume hierarchy to this registry.
@@ -677,6 +788,7 @@ class Registry:
         :param names: a list (initially empty) to hold the names of each AssemblyVolume in a hierarchy of nested assemblies (used to set unique names for the daughters within the motherVol)
         :param incrementRenameDict: ignore - dictionary used internally for potentially incrementing names
         :param userRenameDict: a dictionary of find/replace regex strings to be used to rename volumes/materials/etc.
+        :param transferredIds: ignore - set used internally of the ids of volumes, solids and materials already transferred
         """
         import numpy as _np
         import pyg4ometry.geant4.PhysicalVolume as _PhysicalVolume
@@ -722,6 +834,7 @@ class Registry:
                     list(names),
                     incrementRenameDict,
                     userRenameDict,
+                    transferredIds,
                 )
             else:
                 # we need to copy and rename the volume since we could
@@ -793,7 +906,9 @@ class Registry:
                 )
 
                 # add this volume recursively to the registry
-                self.addVolumeRecursive(dv_copy, True, incrementRenameDict, userRenameDict)
+                self.addVolumeRecursive(
+                    dv_copy, True, incrementRenameDict, userRenameDict, transferredIds
+                )
 
     def transferSolidDefines(self, solid, incrementRenameDict={}, userRenameDict=None):
         """
@@ -1,4 +1,6 @@
 from .PhysicalVolume import PhysicalVolume as _PhysicalVolume
+from .PlacementTree import _copiesBoundingBox
+from pyg4ometry import config as _config
 import pyg4ometry.geant4.solid as _solid
 from pyg4ometry.visualisation import Mesh as _Mesh
 from pyg4ometry.visualisation import OverlapType as _OverlapType
@@ -10,6 +12,78 @@ import copy as _copy
 import logging as _log
 
 
+class _CopyMeshes:
+    """
+    Sequence of the meshes of each copy of a replicated volume. A copy is added with
+    a key describing its geometry and a function with arguments making its mesh. The
+    mesh is only made when a copy is first accessed and copies with equal keys share
+    one mesh, so keys must fully determine the geometry (e.g. solid type, mesh
+    granularity and evaluated dimensions).
+    """
+
+    def __init__(self):
+        self._keys = []  # key of each copy
+        self._makers = {}  # key -> (function, args)
+        self._meshes = {}  # key -> mesh
+
+    def __repr__(self):
+        return (
+            f"CopyMeshes : {len(self._keys)} copies, {len(self._makers)} unique,"
+            f" {len(self._meshes)} meshed"
+        )
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._mesh(key) for key in self._keys[index]]
+        return self._mesh(self._keys[index])
+
+    def __iter__(self):
+        for key in self._keys:
+            yield self._mesh(key)
+
+    def _mesh(self, key):
+        mesh = self._meshes.get(key)
+        if mesh is None:
+            function, args = self._makers[key]
+            mesh = function(*args)
+            self._meshes[key] = mesh
+        return mesh
+
+    def append(self, key, function, *args):
+        """
+        Add a copy whose mesh is function(*args), unless a copy with the same key exists.
+        """
+        self._keys.append(key)
+        self._makers.setdefault(key, (function, args))
+
+    def extend(self, other):
+        """
+        Add all copies of another CopyMeshes, sharing its meshes made so far.
+        """
+        self._keys.extend(other._keys)
+        for key, maker in other._makers.items():
+            self._makers.setdefault(key, maker)
+        for key, mesh in other._meshes.items():
+            self._meshes.setdefault(key, mesh)
+
+    def isMeshed(self, index):
+        return self._keys[index] in self._meshes
+
+    def uniqueCount(self):
+        return len(self._makers)
+
+    def meshAll(self):
+        for key in self._makers:
+            self._mesh(key)
+
+
+def _logicalVolumeMesh(logicalVolume):
+    return logicalVolume.mesh
+
+
 class ReplicaVolume(_PhysicalVolume):
     """
     ReplicaVolume: G4PVReplica
@@ -68,8 +142,10 @@ class ReplicaVolume(_PhysicalVolume):
         # physical visualisation options
         self.visOptions = _VisOptions()
 
-        # Create replica meshes
+        # Create replica meshes, made on first use of each copy unless meshing eagerly
         [self.meshes, self.transforms] = self.createReplicaMeshes()
+        if not _config.lazyMeshing:
+            self.meshes.meshAll()
 
     def GetAxisName(self):
         names = {1: "kXAxis", 2: "kYAxis", 3: "kZAxis", 4: "kRho", 5: "kPhi"}
@@ -143,7 +219,8 @@ class ReplicaVolume(_PhysicalVolume):
         width = evaluateToFloat(self.registry, self.width) * _Units.unit(self.wunit)
 
         transforms = []
-        meshes = []
+        meshes = _CopyMeshes()
+        lvKey = ("LogicalVolume", id(self.logicalVolume))
 
         if self.axis in [self.Axis.kXAxis, self.Axis.kYAxis, self.Axis.kZAxis]:
             for v, i in zip(
@@ -157,7 +234,7 @@ class ReplicaVolume(_PhysicalVolume):
                     trans[self.axis - 1] = v
 
                 transforms.append([rot, trans])
-                meshes.append(self.logicalVolume.mesh)
+                meshes.append(lvKey, _logicalVolumeMesh, self.logicalVolume)
 
                 # if daughter contains a replica
                 if len(self.logicalVolume.daughterVolumes) == 1:
@@ -166,8 +243,8 @@ class ReplicaVolume(_PhysicalVolume):
                             daughter_meshes,
                             daughter_transforms,
                         ] = self.logicalVolume.daughterVolumes[0].createReplicaMeshes()
-                        for m, t in zip(daughter_meshes, daughter_transforms):
-                            meshes.append(m)
+                        meshes.extend(daughter_meshes)
+                        for t in daughter_transforms:
                             transforms.append(
                                 [rot, _np.array(trans) + _np.array(t[1])]
                             )  # TBC - t[0] ie daughter rotation is unused / not compounded
@@ -178,29 +255,32 @@ class ReplicaVolume(_PhysicalVolume):
                 range(0, nreplicas, 1),
             ):
                 if self.axis == self.Axis.kRho:
-                    solid = _solid.Tubs(
-                        self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                        v,
-                        v + width,
-                        self.logicalVolume.solid.pDz,
-                        self.logicalVolume.solid.pSPhi,
-                        self.logicalVolume.solid.pDPhi,
-                        self.logicalVolume.registry,
-                        self.logicalVolume.solid.lunit,
-                        self.logicalVolume.solid.aunit,
-                        self.logicalVolume.solid.nslice,
-                        False,
-                    )
-                    mesh = _Mesh(solid)
-                    meshes.append(mesh)
+                    key = ("Tubs", id(self.logicalVolume.solid), float(v), float(v + width))
+                    meshes.append(key, self._createRhoSliceMesh, v, width, i)
                     transforms.append([[0, 0, 0], [0, 0, 0]])
 
                 elif self.axis == self.Axis.kPhi:
-                    meshes.append(self.logicalVolume.mesh)
+                    meshes.append(lvKey, _logicalVolumeMesh, self.logicalVolume)
                     transforms.append([[0, 0, v], [0, 0, 0]])
 
         return [meshes, transforms]
 
+    def _createRhoSliceMesh(self, rMin, width, i):
+        solid = _solid.Tubs(
+            self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+            rMin,
+            rMin + width,
+            self.logicalVolume.solid.pDz,
+            self.logicalVolume.solid.pSPhi,
+            self.logicalVolume.solid.pDPhi,
+            self.logicalVolume.registry,
+            self.logicalVolume.solid.lunit,
+            self.logicalVolume.solid.aunit,
+            self.logicalVolume.solid.nslice,
+            False,
+        )
+        return _Mesh(solid)
+
     def getPhysicalVolumes(self):
         """
         return a list of temporary (ie not added to the relevant registry) PhysicalVolume instances
@@ -336,31 +416,5 @@ class ReplicaVolume(_PhysicalVolume):
     def extent(self, includeBoundingSolid=True):
         _log.info("ReplicaVolume.extent> %s" % (self.name))
 
-        vMin = [1e99, 1e99, 1e99]
-        vMax = [-1e99, -1e99, -1e99]
-
-        for trans, mesh in zip(self.transforms, self.meshes):
-            # transform daughter meshes to parent coordinates
-            dvmrot = _trans.tbxyz2matrix(trans[0])
-            dvtra = _np.array(trans[1])
-
-            [vMinDaughter, vMaxDaughter] = mesh.getBoundingBox()
-
-            vMinDaughter = dvmrot.dot(vMinDaughter) + dvtra
-            vMaxDaughter = dvmrot.dot(vMaxDaughter) + dvtra
-
-            if vMaxDaughter[0] > vMax[0]:
-                vMax[0] = vMaxDaughter[0]
-            if vMaxDaughter[1] > vMax[1]:
-                vMax[1] = vMaxDaughter[1]
-            if vMaxDaughter[2] > vMax[2]:
-                vMax[2] = vMaxDaughter[2]
-
-            if vMinDaughter[0] < vMin[0]:
-                vMin[0] = vMinDaughter[0]
-            if vMinDaughter[1] < vMin[1]:
-                vMin[1] = vMinDaughter[1]
-            if vMinDaughter[2] < vMin[2]:
-                vMin[2] = vMinDaughter[2]
-
-        return [vMin, vMax]
+        vMin, vMax = _copiesBoundingBox(self)
+        return [vMin.tolist(), vMax.tolist()]
@@ -26,5 +26,7 @@ from .DivisionVolume import *
 from .SkinSurface import *
 from .BorderSurface import *
 from .Registry import *
+from .OverlapCache import *
+from .PlacementTree import *
 from ._Material import *
 from . import solid
@@ -119,76 +119,50 @@ class GenericPolyhedra(_SolidBase):
 
         # plotConvex()
 
-        polygons = []
-
-        for i in range(0, len(pZ), 1):
-            i1 = i
-            i2 = (i + 1) % len(pZ)
-
-            zMin = pZ[i1]
-            zMax = pZ[i2]
-
-            for j in range(0, numSide, 1):
-                j1 = j
-                j2 = j + 1
-
-                phi1 = dPhi * j1 + pSPhi
-                phi2 = dPhi * j2 + pSPhi
-
-                xZMinP1 = pR[i1] * _np.cos(phi1)
-                yZMinP1 = pR[i1] * _np.sin(phi1)
-
-                xZMaxP1 = pR[i2] * _np.cos(phi1)
-                yZMaxP1 = pR[i2] * _np.sin(phi1)
-
-                xZMinP2 = pR[i1] * _np.cos(phi2)
-                yZMinP2 = pR[i1] * _np.sin(phi2)
-
-                xZMaxP2 = pR[i2] * _np.cos(phi2)
-                yZMaxP2 = pR[i2] * _np.sin(phi2)
-
-                vFace = []
-                if pR[i1] != 0:
-                    vFace.append(_Vertex([xZMinP1, yZMinP1, zMin]))
-                vFace.append(_Vertex([xZMaxP1, yZMaxP1, zMax]))
-                if pR[i2] != 0:
-                    vFace.append(_Vertex([xZMaxP2, yZMaxP2, zMax]))
-                vFace.append(_Vertex([xZMinP2, yZMinP2, zMin]))
-
-                vFace.reverse()
-                if pR[i1] == 0 and pR[i2] == 0:
-                    pass
-                else:
-                    polygons.append(_Polygon(vFace))
+        # rings of vertices for each (z, r) point, len(pZ) x (numSide + 1)
+        phi = pSPhi + dPhi * _np.arange(numSide + 1)
+        r = _np.array(pR, dtype=float)
+        z = _np.array(pZ, dtype=float)
+        vertices = [
+            _np.stack(
+                [
+                    _np.outer(r, _np.cos(phi)),
+                    _np.outer(r, _np.sin(phi)),
+                    _np.outer(z, _np.ones(numSide + 1)),
+                ],
+                axis=2,
+            ).reshape(-1, 3)
+        ]
+
+        # side faces between consecutive points, points on the axis are merged so those
+        # quads reduce to triangles (or vanish)
+        v = _np.arange(len(pZ) * (numSide + 1)).reshape(len(pZ), numSide + 1)
+        v2 = _np.roll(v, -1, axis=0)
+        faces = [
+            _np.stack(
+                [v[:, 1:].ravel(), v2[:, 1:].ravel(), v2[:, :-1].ravel(), v[:, :-1].ravel()],
+                axis=1,
+            )
+        ]
 
         if pDPhi != 2 * _np.pi:
+            nVertices = v.size
             for cvPolygon in zrListConvex:
-                vPhi1 = []
-                for cvPolygonPoint in cvPolygon:
-                    z = cvPolygonPoint[0]
-                    r = cvPolygonPoint[1]
-
-                    xP1 = r * _np.cos(pSPhi)
-                    yP1 = r * _np.sin(pSPhi)
-
-                    vPhi1.append(_Vertex([xP1, yP1, z]))
-
-                vPhi1.reverse()
-                polygons.append(_Polygon(vPhi1))
-
-                vPhi2 = []
-                for cvPolygonPoint in reversed(cvPolygon):
-                    z = cvPolygonPoint[0]
-                    r = cvPolygonPoint[1]
-
-                    xP2 = r * _np.cos(pSPhi + pDPhi)
-                    yP2 = r * _np.sin(pSPhi + pDPhi)
-
-                    vPhi2.append(_Vertex([xP2, yP2, z]))
-
-                vPhi2.reverse()
-                polygons.append(_Polygon(vPhi2))
-
-        mesh = _CSG.fromPolygons(polygons)
+                cvPolygon = _np.asarray(cvPolygon, dtype=float)
+                for cvPhi, cvZR in [(pSPhi, cvPolygon[::-1]), (pSPhi + pDPhi, cvPolygon)]:
+                    vertices.append(
+                        _np.stack(
+                            [
+                                cvZR[:, 1] * _np.cos(cvPhi),
+                                cvZR[:, 1] * _np.sin(cvPhi),
+                                cvZR[:, 0],
+                            ],
+                            axis=1,
+                        )
+                    )
+                    faces.append(nVertices + _np.arange(len(cvZR))[None, :])
+                    nVertices += len(cvZR)
+
+        mesh = _CSG.fromArrays(_np.concatenate(vertices), faces)
 
         return mesh
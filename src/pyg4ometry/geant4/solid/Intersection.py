@@ -59,6 +59,12 @@ class Intersection(_SolidBase):
         return f"Intersection {self.name} {self.obj1.name!s} {self.obj2.name!s}"
 
     def mesh(self):
+        return self._cachedMesh(self._mesh)
+
+    def _meshCacheOperands(self):
+        return [self.object1(), self.object2()]
+
+    def _mesh(self):
         import pyg4ometry.geant4 as _g4
 
         _log.info("Intersection.pycsgmesh>>")
@@ -1,9 +1,119 @@
 from .SolidBase import SolidBase as _SolidBase
 import pyg4ometry.exceptions
+from pyg4ometry import config as _config
 from pyg4ometry.transformation import *
 
 import copy as _copy
 import logging as _log
+import multiprocessing as _mp
+
+import numpy as _np
+
+
+def _meshExtent(mesh):
+    """
+    Axis aligned bounding box [min, max] of a mesh.
+    """
+    vertices, _ = mesh.toVerticesAndFaces()
+    return [vertices.min(axis=0), vertices.max(axis=0)]
+
+
+def _concatenateMeshes(mesh1, mesh2):
+    """
+    Single mesh containing both (disjoint) meshes, without a boolean operation.
+    """
+    from pyg4ometry.visualisation import _meshFromVerticesAndPolygons
+
+    vertices1, polygons1, _ = mesh1.toVerticesAndPolygons()
+    vertices2, polygons2, _ = mesh2.toVerticesAndPolygons()
+
+    offset = len(vertices1)
+    vertices = list(vertices1) + list(vertices2)
+    polygons = list(polygons1) + [[i + offset for i in polygon] for polygon in polygons2]
+    return _meshFromVerticesAndPolygons(vertices, polygons)
+
+
+def _unionMeshes(meshes, extents=None):
+    """
+    Union of meshes as a pairwise balanced tree, so each union is between meshes
+    of similar size rather than adding each mesh to an ever growing result. If the
+    extents of the meshes are given, pairs with disjoint bounding boxes are
+    concatenated instead of unioned.
+
+    :param meshes: meshes to union (modified)
+    :type meshes: list
+    :param extents: [min, max] bounding box for each mesh or None
+    :type extents: list
+    :returns: [mesh, extent]
+    """
+    while len(meshes) > 1:
+        pairedMeshes = []
+        pairedExtents = []
+        for i in range(0, len(meshes) - 1, 2):
+            if extents is None:
+                pairedMeshes.append(meshes[i].union(meshes[i + 1]))
+                continue
+
+            (min1, max1), (min2, max2) = extents[i], extents[i + 1]
+            if _np.any(max1 < min2) or _np.any(max2 < min1):
+                pairedMeshes.append(_concatenateMeshes(meshes[i], meshes[i + 1]))
+            else:
+                pairedMeshes.append(meshes[i].union(meshes[i + 1]))
+            pairedExtents.append([_np.minimum(min1, min2), _np.maximum(max1, max2)])
+
+        if len(meshes) % 2 == 1:
+            pairedMeshes.append(meshes[-1])
+            if extents is not None:
+                pairedExtents.append(extents[-1])
+
+        meshes = pairedMeshes
+        extents = pairedExtents if extents is not None else None
+
+    return meshes[0], extents[0] if extents is not None else None
+
+
+# meshes and extents shared with the forked _unionWorker processes
+_unionJobs = []
+
+
+def _unionWorker(task):
+    start, stop = task
+    meshes, extents = _unionJobs
+    mesh, extent = _unionMeshes(
+        meshes[start:stop], extents[start:stop] if extents is not None else None
+    )
+    vertices, polygons, _ = mesh.toVerticesAndPolygons()
+    return vertices, polygons, extent
+
+
+def _unionMeshesParallel(meshes, extents, parallel):
+    """
+    Balanced tree union where the independent subtrees of contiguous blocks of
+    meshes are reduced in a process pool and the results unioned in this process.
+    The meshes are shared with forked workers as they cannot be pickled.
+    """
+    from pyg4ometry.visualisation import _meshFromVerticesAndPolygons
+
+    global _unionJobs
+
+    # smallest power of two blocks so that every worker has a subtree
+    nBlocks = 1
+    while nBlocks < parallel:
+        nBlocks *= 2
+    bounds = _np.linspace(0, len(meshes), nBlocks + 1).astype(int)
+    tasks = list(zip(bounds[:-1], bounds[1:]))
+
+    _unionJobs = [meshes, extents]
+    try:
+        ctx = _mp.get_context("fork")
+        with ctx.Pool(parallel) as pool:
+            results = pool.map(_unionWorker, tasks)
+    finally:
+        _unionJobs = []
+
+    meshes = [_meshFromVerticesAndPolygons(vertices, polygons) for vertices, polygons, _ in results]
+    extents = None if extents is None else [extent for _, _, extent in results]
+    return _unionMeshes(meshes, extents)[0]
 
 
 class MultiUnion(_SolidBase):
@@ -49,32 +159,33 @@ class MultiUnion(_SolidBase):
         return f"Multi Union {self.name}"
 
     def mesh(self):
+        return self._cachedMesh(self._mesh)
+
+    def _meshCacheOperands(self):
+        return self.objects
+
+    def _mesh(self):
         _log.info("MultiUnion.pycsgmesh>")
 
-        result = self.objects[0].mesh()
-        tra2 = self.transformations[0]
-        rot = tbxyz2axisangle(tra2[0].eval())
-        tlate = tra2[1].eval()
-        result.rotate(rot[0], -rad2deg(rot[1]))
-        result.translate(tlate)
-
-        for idx, (solid, tra2) in enumerate(
-            zip(self.objects[1:], self.transformations[1:]), start=1
-        ):
-            # tranformation
+        # transformed constituent meshes
+        meshes = []
+        for idx, (solid, tra2) in enumerate(zip(self.objects, self.transformations)):
             rot = tbxyz2axisangle(tra2[0].eval())
             tlate = tra2[1].eval()
             _log.info(f"MulUnion.mesh> rot={rot!s} tlate={tlate!s}")
 
-            # get meshes
             _log.info("union.mesh> mesh %s" % str(idx))
             mesh = solid.mesh()
-
-            # apply transform to second mesh
             mesh.rotate(rot[0], -rad2deg(rot[1]))
             mesh.translate(tlate)
+            meshes.append(mesh)
+
+        concatenateDisjoint = _config.multiUnionConcatenateDisjoint
+        extents = [_meshExtent(mesh) for mesh in meshes] if concatenateDisjoint else None
 
-            _log.info("MultiUnion.mesh> union")
-            result = result.union(mesh)
+        parallel = _config.multiUnionParallel
+        if parallel > 1 and len(meshes) > 2 * parallel:
+            return _unionMeshesParallel(meshes, extents, parallel)
 
-        return result
+        _log.info("MultiUnion.mesh> union")
+        return _unionMeshes(meshes, extents)[0]
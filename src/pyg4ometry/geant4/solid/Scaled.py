@@ -45,6 +45,9 @@ class Scaled(_SolidBase):
             self.name, self.solid, float(self.pX), float(self.pY), float(self.pZ)
         )
 
+    def _meshCacheOperands(self):
+        return [self.solid]
+
     def mesh(self):
         import pyg4ometry.gdml.Units as _Units  # TODO move circular import
 
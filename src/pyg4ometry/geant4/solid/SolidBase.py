@@ -2,6 +2,15 @@ import numpy as _np
 from pyg4ometry import config as _config
 
 
+def _freeze(value):
+    """
+    Convert (nested) lists of evaluated parameters to hashable tuples.
+    """
+    if isinstance(value, (list, tuple, _np.ndarray)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class SolidBase:
     """
     Base class for all solids
@@ -86,6 +95,43 @@ class SolidBase:
         if (v - 2 * _np.pi) > _config.twoPiComparisonTolerance:
             raise ValueError('pDPhi is strictly greater than 2 x pi in solid "' + self.name + '"')
 
+    def meshCacheKey(self):
+        """
+        Hashable description of everything the mesh of this solid depends on: the solid
+        identity, its evaluated parameters, units and nslice/nstack and the keys of any
+        solids it is built from.
+        """
+        params = []
+        for varName in getattr(self, "varNames", []):
+            value = getattr(self, varName)
+            try:
+                value = _freeze(self.evaluateParameter(value))
+                hash(value)
+            except Exception:
+                value = repr(value)
+            params.append(value)
+
+        settings = tuple(
+            getattr(self, setting, None) for setting in ["lunit", "aunit", "nslice", "nstack"]
+        )
+        operands = tuple(operand.meshCacheKey() for operand in self._meshCacheOperands())
+
+        return (self.type, self.name, id(self), tuple(params), settings, operands)
+
+    def _meshCacheOperands(self):
+        """
+        Solids the mesh of this solid is built from, overridden by boolean solids.
+        """
+        return []
+
+    def _cachedMesh(self, meshFunction):
+        """
+        Mesh from the registry mesh cache, computed with meshFunction if not cached.
+        """
+        if self.registry is None:
+            return meshFunction()
+        return self.registry.meshCache.mesh(self, meshFunction)
+
     @property
     def name(self):
         return self._name
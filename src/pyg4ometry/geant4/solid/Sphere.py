@@ -150,170 +150,55 @@ class Sphere(_SolidBase):
 
         _log.info("Sphere.pycsgmesh>")
 
-        polygons = []
-
-        # changed from d - s/ st
-
-        dPhi = (pDPhi) / self.nslice
-        dTheta = (pDTheta) / self.nstack
-
-        for i in range(0, self.nslice, 1):
-            i1 = i
-            i2 = i + 1
-
-            p1 = dPhi * i1 + pSPhi
-            p2 = dPhi * i2 + pSPhi
-
-            for j in range(0, self.nstack, 1):
-                j1 = j
-                j2 = j + 1
-
-                t1 = dTheta * j1 + pSTheta
-                t2 = dTheta * j2 + pSTheta
-
-                if pRmin != 0:
-                    xRMinP1T1 = pRmin * _np.sin(t1) * _np.cos(p1)
-                    yRMinP1T1 = pRmin * _np.sin(t1) * _np.sin(p1)
-                    zRMinP1T1 = pRmin * _np.cos(t1)
-
-                    xRMinP2T1 = pRmin * _np.sin(t1) * _np.cos(p2)
-                    yRMinP2T1 = pRmin * _np.sin(t1) * _np.sin(p2)
-                    zRMinP2T1 = pRmin * _np.cos(t1)
-
-                    xRMinP1T2 = pRmin * _np.sin(t2) * _np.cos(p1)
-                    yRMinP1T2 = pRmin * _np.sin(t2) * _np.sin(p1)
-                    zRMinP1T2 = pRmin * _np.cos(t2)
-
-                    xRMinP2T2 = pRmin * _np.sin(t2) * _np.cos(p2)
-                    yRMinP2T2 = pRmin * _np.sin(t2) * _np.sin(p2)
-                    zRMinP2T2 = pRmin * _np.cos(t2)
-                else:
-                    xRMinP1T1 = 0.0
-                    yRMinP1T1 = 0.0
-                    zRMinP1T1 = 0.0
-
-                    xRMinP2T1 = 0.0
-                    yRMinP2T1 = 0.0
-                    zRMinP2T1 = 0.0
-
-                    xRMinP1T2 = 0.0
-                    yRMinP1T2 = 0.0
-                    zRMinP1T2 = 0.0
-
-                    xRMinP2T2 = 0.0
-                    yRMinP2T2 = 0.0
-                    zRMinP2T2 = 0.0
-
-                xRMaxP1T1 = pRmax * _np.sin(t1) * _np.cos(p1)
-                yRMaxP1T1 = pRmax * _np.sin(t1) * _np.sin(p1)
-                zRMaxP1T1 = pRmax * _np.cos(t1)
-
-                xRMaxP2T1 = pRmax * _np.sin(t1) * _np.cos(p2)
-                yRMaxP2T1 = pRmax * _np.sin(t1) * _np.sin(p2)
-                zRMaxP2T1 = pRmax * _np.cos(t1)
-
-                xRMaxP1T2 = pRmax * _np.sin(t2) * _np.cos(p1)
-                yRMaxP1T2 = pRmax * _np.sin(t2) * _np.sin(p1)
-                zRMaxP1T2 = pRmax * _np.cos(t2)
-
-                xRMaxP2T2 = pRmax * _np.sin(t2) * _np.cos(p2)
-                yRMaxP2T2 = pRmax * _np.sin(t2) * _np.sin(p2)
-                zRMaxP2T2 = pRmax * _np.cos(t2)
-
-                ###########################
-                # Curved sphere faces
-                ###########################
-                if t1 == 0:  # if north pole (triangles)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    # print "outer  north pole",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-                elif t2 == _np.pi:  # if south pole (triangleS)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    # print "outer south pole",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-                else:  # normal curved quad
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    # print "outer normal quad",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-
-                if pRmin != 0:
-                    if t1 == 0:  # if north pole (triangles)
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner north pole", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                    elif t2 == _np.pi:  # if south pole
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner south pole", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                    else:  # normal curved quad
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner quad ", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                if pDPhi != 2 * _np.pi:
-                    if i == 0 and pSPhi != 0:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        vEnd.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vEnd.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        vEnd.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                    if i == self.nslice - 1 and pSPhi + pDPhi != 2 * _np.pi:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vEnd.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        vEnd.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        vEnd.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                if pDTheta != _np.pi:
-                    if j == 0 and pSTheta != 0:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        vEnd.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        vEnd.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        vEnd.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                    if j == self.nstack - 1 and pSTheta + pDTheta != _np.pi:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vEnd.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vEnd.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        vEnd.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
+        # grids of vertices on the outer and inner spheres, (nslice + 1) x (nstack + 1)
+        nslice = self.nslice
+        nstack = self.nstack
+        phi = pSPhi + pDPhi / nslice * _np.arange(nslice + 1)
+        theta = pSTheta + pDTheta / nstack * _np.arange(nstack + 1)
+
+        sinTheta = _np.sin(theta)
+        unit = _np.stack(
+            [
+                _np.outer(_np.cos(phi), sinTheta),
+                _np.outer(_np.sin(phi), sinTheta),
+                _np.outer(_np.ones(nslice + 1), _np.cos(theta)),
+            ],
+            axis=2,
+        ).reshape(-1, 3)
+        vertices = _np.concatenate([pRmax * unit, pRmin * unit])
+
+        o = _np.arange((nslice + 1) * (nstack + 1)).reshape(nslice + 1, nstack + 1)
+        n = o + o.size
+
+        # quads between slices i1, i2 and stacks j1, j2. At the poles (and for the inner
+        # sphere when pRmin = 0) vertices coincide, so the quads reduce to triangles (or
+        # vanish) when the vertices are merged
+        def quads(corners):
+            return _np.stack([c.ravel() for c in corners], axis=1)
+
+        o11, o12, o21, o22 = o[:-1, :-1], o[:-1, 1:], o[1:, :-1], o[1:, 1:]
+        n11, n12, n21, n22 = n[:-1, :-1], n[:-1, 1:], n[1:, :-1], n[1:, 1:]
+
+        faces = [quads([o11, o12, o22, o21])]
+        if pRmin != 0:
+            faces.append(quads([n21, n22, n12, n11]))
+
+        if pDPhi != 2 * _np.pi:
+            if pSPhi != 0:
+                faces.append(quads([n[0, :-1], n[0, 1:], o[0, 1:], o[0, :-1]]))
+            if pSPhi + pDPhi != 2 * _np.pi:
+                faces.append(quads([n[-1, :-1], o[-1, :-1], o[-1, 1:], n[-1, 1:]]))
+
+        if pDTheta != _np.pi:
+            if pSTheta != 0:
+                faces.append(quads([n[:-1, 0], o[:-1, 0], o[1:, 0], n[1:, 0]]))
+            if pSTheta + pDTheta != _np.pi:
+                faces.append(quads([n[:-1, -1], n[1:, -1], o[1:, -1], o[:-1, -1]]))
+
         tAfter = _time.process_time()
 
         mBefore = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
-        mesh = _CSG.fromPolygons(polygons)
+        mesh = _CSG.fromArrays(vertices, faces)
         mAfter = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
         _log.info(
             "Sphere.pycsgmesh> profile {} {} {} {} {}".format(
@@ -48,6 +48,12 @@ class Subtraction(_SolidBase):
         return f"Intersection {self.name} {self.obj1.name!s} {self.obj2.name!s}"
 
     def mesh(self):
+        return self._cachedMesh(self._mesh)
+
+    def _meshCacheOperands(self):
+        return [self.object1(), self.object2()]
+
+    def _mesh(self):
         _log.info("subtraction.pycsgmesh>")
 
         # look up solids in registry
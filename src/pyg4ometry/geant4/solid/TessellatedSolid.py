@@ -4,22 +4,23 @@ from .SolidBase import SolidBase as _SolidBase
 
 if _config.meshing == _config.meshingType.pycsg:
     from pyg4ometry.pycsg.core import CSG as _CSG
-    from pyg4ometry.pycsg.geom import Vector as _Vector
-    from pyg4ometry.pycsg.geom import Vertex as _Vertex
-    from pyg4ometry.pycsg.geom import Polygon as _Polygon
 elif _config.meshing == _config.meshingType.cgal_sm:
     from pyg4ometry.pycgal.core import CSG as _CSG
-    from pyg4ometry.pycgal.geom import Vector as _Vector
-    from pyg4ometry.pycgal.geom import Vertex as _Vertex
-    from pyg4ometry.pycgal.geom import Polygon as _Polygon
 
 import numpy as _np
 
+from pyg4ometry.meshutils import weldVertices as _weldVertices
+
 
 class TessellatedSolid(_SolidBase):
     """
     Constructs a tessellated solid
 
+    The mesh is stored as a float64 vertex array(N,3) and a uint32 face array(F,4)
+    of vertex indices with a quadrangle flag array(F) (the last index of a triangle
+    is not used), whatever the mesh type. For GDML the vertices are position defines
+    referred to by name (vertexNames) and the vertex array is evaluated from them.
+
     :param name:     of solid
     :type name:      str
     :param mesh:     mesh
@@ -29,6 +30,11 @@ class TessellatedSolid(_SolidBase):
     :param meshtype: type of mesh
     :type meshtype:  MeshType.Freecad
 
+    Mesh formats:
+
+    - Freecad: [vertices, facets] with facets of 3 or 4 vertex indices
+    - Gdml: list of facets of 3 or 4 position define names
+    - Stl: list of (vertices, normal) facets or [vertices array(N,3), faces array(F,3)]
     """
 
     class MeshType:
@@ -39,13 +45,8 @@ class TessellatedSolid(_SolidBase):
     def __init__(self, name, meshTess, registry, meshtype=MeshType.Freecad, addRegistry=True):
         super().__init__(name, "TessellatedSolid", registry)
 
-        if meshTess is None:
-            self.meshtess = []
-            self.meshtess.append([])
-            self.meshtess.append([])
-        else:
-            self.meshtess = meshTess
         self.meshtype = meshtype
+        self.meshtess = meshTess
 
         self.dependents = []
         self.varNames = []
@@ -57,10 +58,136 @@ class TessellatedSolid(_SolidBase):
         if self.type == TessellatedSolid.MeshType.Gdml:
             # In GDML, vertices are defines that are referred to by name.
             # When merging registries, the vertx defines need to be carried over
-            for f in self.meshtess:
-                for facet_vertex in f:
-                    if facet_vertex not in self.varNames:
-                        self.varNames.append(facet_vertex)
+            for facet_vertex in self.vertexNames:
+                if facet_vertex not in self.varNames:
+                    self.varNames.append(facet_vertex)
+
+    @property
+    def vertices(self):
+        if self.meshtype == self.MeshType.Gdml:
+            if not self.vertexNames:
+                return _np.empty((0, 3))
+            return _np.array(
+                [self.registry.defineDict[n].eval() for n in self.vertexNames], dtype=float
+            )
+        self._flushAdded()
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices):
+        self._vertices = _np.asarray(vertices, dtype=float).reshape(-1, 3)
+
+    @property
+    def faces(self):
+        self._flushAdded()
+        return self._faces
+
+    @property
+    def quads(self):
+        self._flushAdded()
+        return self._quads
+
+    def setFaces(self, faces):
+        """
+        Set the faces from a list (or array(F,K)) of polygons of 3 or 4 vertex indices.
+        """
+        self._faces, self._quads = self._faceArrays(faces)
+
+    def facets(self):
+        """
+        Faces as lists of 3 or 4 vertex indices.
+        """
+        faces = self.faces.tolist()
+        return [f if q else f[:3] for f, q in zip(faces, self.quads.tolist())]
+
+    @staticmethod
+    def _faceArrays(faces):
+        """
+        uint32 face array(F,4) and quadrangle flag array(F) from polygons of 3 or 4
+        vertex indices. The last index of a triangle repeats its third.
+        """
+        if len(faces) == 0:
+            return _np.empty((0, 4), dtype=_np.uint32), _np.empty(0, dtype=bool)
+
+        if not (isinstance(faces, _np.ndarray) and faces.ndim == 2):
+            sizes = _np.fromiter(map(len, faces), dtype=_np.int64, count=len(faces))
+            if (sizes == sizes[0]).all():
+                faces = _np.array(faces, dtype=_np.int64)
+            else:
+                faces = _np.array([[*f, f[-1]] if len(f) == 3 else f for f in faces])
+
+        faces = _np.asarray(faces, dtype=_np.int64)
+        if faces.ndim == 2 and faces.shape[1] == 3:
+            faces = _np.concatenate([faces, faces[:, 2:]], axis=1)
+
+        if faces.ndim != 2 or faces.shape[1] != 4 or faces.min() < 0 or faces.max() >= 2**32:
+            msg = "TessellatedSolid facets must have 3 or 4 (non negative) vertex indices"
+            raise ValueError(msg)
+
+        quads = faces[:, 3] != faces[:, 2]
+        return faces.astype(_np.uint32), quads
+
+    @property
+    def meshtess(self):
+        """
+        Mesh in the input format of the mesh type (see class docstring), made from the
+        vertex and face arrays. This is a copy, so changing it does not change the solid.
+        """
+        if self.meshtype == self.MeshType.Gdml:
+            names = _np.array([*self.vertexNames, ""], dtype=object)
+            return [names[f].tolist() for f in self.facets()]
+        elif self.meshtype == self.MeshType.Stl:
+            return [
+                (triangle, (None, None, None))
+                for triangle in self.vertices[self.faces[:, :3]].tolist()
+            ]
+        return [self.vertices.tolist(), self.facets()]
+
+    @meshtess.setter
+    def meshtess(self, meshTess):
+        self._addedVertices = []
+        self._addedFaces = []
+        self.vertexNames = None
+
+        if meshTess is None or len(meshTess) == 0:
+            meshTess = [] if self.meshtype == self.MeshType.Gdml else [[], []]
+
+        if self.meshtype == self.MeshType.Gdml:
+            # vertex define names in order of first use
+            index = {}
+            faces = [[index.setdefault(n, len(index)) for n in f] for f in meshTess]
+            self.vertexNames = list(index)
+            self._vertices = None
+            self.setFaces(faces)
+        elif self.meshtype == self.MeshType.Stl:
+            self.vertices, faces = self._stlArrays(meshTess)
+            self.setFaces(faces)
+        else:
+            self.vertices = meshTess[0]
+            self.setFaces(meshTess[1])
+
+    @staticmethod
+    def _stlArrays(meshTess):
+        """
+        Vertex array(N,3) and triangle array(F,3) from STL facets, given either as a
+        list of (vertices, normal) or as a [vertices, faces] pair of arrays. Exactly
+        coincident vertices of the facets are welded.
+        """
+        if (
+            len(meshTess) == 2
+            and isinstance(meshTess[0], _np.ndarray)
+            and meshTess[0].ndim == 2
+            and isinstance(meshTess[1], _np.ndarray)
+        ):
+            vertices = _np.asarray(meshTess[0], dtype=float).reshape(-1, 3)
+            return vertices, _np.asarray(meshTess[1], dtype=_np.int64).reshape(-1, 3)
+
+        if len(meshTess) == 0 or len(meshTess) == 2 and not any(len(f) for f in meshTess):
+            return _np.empty((0, 3)), _np.empty((0, 3), dtype=_np.int64)
+
+        triangles = _np.array([f[0][:3] for f in meshTess], dtype=float)
+        vertices, index = _weldVertices(triangles.reshape(-1, 3))
+        return vertices, index.reshape(-1, 3)
 
     def __repr__(self):
         return self.type
@@ -69,123 +196,46 @@ class TessellatedSolid(_SolidBase):
         return f"TessellatedSolid {self.type}"
 
     def addVertex(self, vertex):
-        self.meshtess[0].append(vertex)
+        self._addedVertices.append(vertex)
 
     def addTriangle(self, triangle):
-        self.meshtess[1].append(triangle)
+        self._addedFaces.append(triangle)
+
+    def _flushAdded(self):
+        # vertices and faces added one by one are appended to the arrays in bulk
+        if self._addedVertices:
+            added = _np.array(self._addedVertices, dtype=float).reshape(-1, 3)
+            self._vertices = _np.concatenate([self._vertices, added])
+            self._addedVertices = []
+        if self._addedFaces:
+            faces, quads = self._faceArrays(self._addedFaces)
+            self._faces = _np.concatenate([self._faces, faces])
+            self._quads = _np.concatenate([self._quads, quads])
+            self._addedFaces = []
 
     def removeDuplicateVertices(self):
-        # print("removeDuplicateVertices")
-
         if self.meshtype != TessellatedSolid.MeshType.Freecad:
             print("Cannot run on this mesh type")
             return
 
-        vertexmap = {}
-
-        meshtess0 = []
-        meshtess1 = []
-
-        # Loop over triangles (polygons) in mesh
-        ivertexmap = 0
-        for t in self.meshtess[1]:
-            vinew_list = []
-            for vi in t:
-                v = self.meshtess[0][vi]
-                vr = (
-                    round(v[0] + 1.23456789, 10),
-                    round(v[1] + 1.23456789, 10),
-                    round(v[2] + 1.23456789, 10),
-                )
-                vrhash = hash(vr)
+        vertices = self.vertices
+        faces = self.faces
 
-                try:
-                    vinew = vertexmap[vrhash]
-                except KeyError:
-                    vertexmap[vrhash] = ivertexmap
-                    meshtess0.append(v)
-                    vinew = ivertexmap
-                    ivertexmap += 1
+        # vertex indices in order of use by the faces
+        used = faces.ravel()
 
-                vinew_list.append(vinew)
+        # vertices are the same if equal to 10 decimals, keeping the first of them
+        keys = _np.round(vertices[used] + 1.23456789, 10)
+        _, newIndex = _weldVertices(keys)
+        _, first = _np.unique(newIndex, return_index=True)
 
-            meshtess1.append(vinew_list)
-
-        self.meshtess[0] = meshtess0
-        self.meshtess[1] = meshtess1
-
-        # print(vertexmap)
-        # print(meshtess0)
-        # print(meshtess1)
+        self.vertices = vertices[used[first]]
+        self._faces = newIndex.reshape(-1, 4).astype(_np.uint32)
 
     def mesh(self):
-        #############################################
-        # render GDML mesh
-        #############################################
-        if self.meshtype == self.MeshType.Gdml:
-            # vertex name - integer dict
-            vdict = {}
-
-            i = 0
-            for f in self.meshtess:
-                for facet_vertex in f:
-                    try:
-                        vdict[facet_vertex]
-                    except KeyError:
-                        vdict[facet_vertex] = i
-                        i += 1
-
-            verts = [0 for dummy in range(0, len(vdict.keys()), 1)]
-            facet = []
-            for vdi in vdict.items():
-                p = self.registry.defineDict[vdi[0]]
-                verts[vdi[1]] = p.eval()
-
-            for f in self.meshtess:
-                facet.append([vdict[fi] for fi in f])
-
-        #############################################
-        # Mesh from CAD
-        #############################################
-        elif self.meshtype == self.MeshType.Freecad:
-            verts = self.meshtess[0]
-            facet = self.meshtess[1]
-
-        #############################################
-        # Mesh from STL
-        #############################################
-        elif self.meshtype == self.MeshType.Stl:
-            verts = []
-            facet = []
-
-            i = 0
-            for f in self.meshtess:
-                v1 = f[0][0]
-                v2 = f[0][1]
-                v3 = f[0][2]
-
-                verts.append(v1)
-                verts.append(v2)
-                verts.append(v3)
-
-                facet.append((3 * i + 0, 3 * i + 1, 3 * i + 2))
-                i += 1
-
-        else:
-            msg = f"Urecognised mesh type: {self.meshtype}"
-            raise ValueError(msg)
-
-        #############################################
-        # Convert verts and facets to polygons
-        #############################################
-        polygon_list = []
-
-        for f in facet:
-            # This allows for both triangular and quadrilateral facets
-            polygon = _Polygon([_Vertex(verts[facet_vertex]) for facet_vertex in f])
-            polygon_list.append(polygon)
-
-        return _CSG.fromPolygons(polygon_list, cgalTest=False)
+        faces = self.faces
+        quads = self.quads
+        return _CSG.fromArrays(self.vertices, [faces[~quads, :3], faces[quads]])
 
 
 def createTessellatedSolid(name, polygons, reg):
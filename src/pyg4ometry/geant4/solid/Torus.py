@@ -121,92 +121,45 @@ class Torus(_SolidBase):
         pDPhi = self.evaluateParameter(self.pDPhi) * auval
 
         _log.info("torus.pycsgmesh>")
-        polygons = []
 
         nstack = self.nstack
         nslice = self.nslice
 
-        dTheta = 2 * _np.pi / nstack
-        dPhi = pDPhi / nslice
-
-        for j0 in range(nslice):
-            j1 = j0
-            j2 = j0 + 1
-
-            for i0 in range(nstack):
-                i1 = i0
-                i2 = i0 + 1
-
-                xRMaxP1T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j1)
-                yRMaxP1T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j1)
-                zRMaxP1T1 = pRmax * _np.sin(dTheta * i1)
-
-                xRMaxP1T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j1)
-                yRMaxP1T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j1)
-                zRMaxP1T2 = pRmax * _np.sin(dTheta * i2)
-
-                xRMaxP2T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j2)
-                yRMaxP2T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j2)
-                zRMaxP2T2 = pRmax * _np.sin(dTheta * i2)
-
-                xRMaxP2T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j2)
-                yRMaxP2T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j2)
-                zRMaxP2T1 = pRmax * _np.sin(dTheta * i1)
-
-                vertices_outer = []
-                vertices_outer.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                vertices_outer.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                vertices_outer.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                vertices_outer.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                vertices_outer.reverse()
-                polygons.append(_Polygon(vertices_outer))
-
-                xRMinP1T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j1)
-                yRMinP1T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j1)
-                zRMinP1T1 = pRmin * _np.sin(dTheta * i1)
-
-                xRMinP1T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j1)
-                yRMinP1T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j1)
-                zRMinP1T2 = pRmin * _np.sin(dTheta * i2)
-
-                xRMinP2T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j2)
-                yRMinP2T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j2)
-                zRMinP2T2 = pRmin * _np.sin(dTheta * i2)
-
-                xRMinP2T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j2)
-                yRMinP2T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j2)
-                zRMinP2T1 = pRmin * _np.sin(dTheta * i1)
-
-                if 0 < pRmin < pRmax:
-                    vertices_inner = []
-                    vertices_inner.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                    vertices_inner.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                    vertices_inner.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                    vertices_inner.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                    # vertices_inner.reverse()
-                    polygons.append(_Polygon(vertices_inner))
-
-                if pDPhi != 2 * _np.pi:
-                    if j1 == 0:
-                        end = []
-                        if pRmin != 0:
-                            end.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        end.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        end.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        end.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        end.reverse()
-                        polygons.append(_Polygon(end))
-
-                    if j1 == nslice - 1:
-                        end = []
-                        if pRmin != 0:
-                            end.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        end.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        end.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        end.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        # end.reverse()
-                        polygons.append(_Polygon(end))
-
-        mesh = _CSG.fromPolygons(polygons)
+        # grids of vertices on the outer and inner tori, (nslice + 1) x (nstack + 1)
+        phi = pSPhi + pDPhi / nslice * _np.arange(nslice + 1)
+        theta = 2 * _np.pi / nstack * _np.arange(nstack + 1)
+
+        def grid(r):
+            rho = pRtor + r * _np.cos(theta)
+            return _np.stack(
+                [
+                    _np.outer(_np.cos(phi), rho),
+                    _np.outer(_np.sin(phi), rho),
+                    _np.outer(_np.ones(nslice + 1), r * _np.sin(theta)),
+                ],
+                axis=2,
+            ).reshape(-1, 3)
+
+        vertices = _np.concatenate([grid(pRmax), grid(pRmin)])
+
+        o = _np.arange((nslice + 1) * (nstack + 1)).reshape(nslice + 1, nstack + 1)
+        n = o + o.size
+
+        def quads(corners):
+            return _np.stack([c.ravel() for c in corners], axis=1)
+
+        o11, o12, o21, o22 = o[:-1, :-1], o[:-1, 1:], o[1:, :-1], o[1:, 1:]
+        n11, n12, n21, n22 = n[:-1, :-1], n[:-1, 1:], n[1:, :-1], n[1:, 1:]
+
+        faces = [quads([o21, o22, o12, o11])]
+        if 0 < pRmin < pRmax:
+            faces.append(quads([n11, n12, n22, n21]))
+
+        # for pRmin = 0 the inner vertices coincide and the ends reduce to triangles
+        if pDPhi != 2 * _np.pi:
+            faces.append(quads([o[0, :-1], o[0, 1:], n[0, 1:], n[0, :-1]]))
+            faces.append(quads([n[-1, :-1], n[-1, 1:], o[-1, 1:], o[-1, :-1]]))
+
+        mesh = _CSG.fromArrays(vertices, faces)
 
         return mesh
@@ -111,97 +111,39 @@ class Tubs(_SolidBase):
 
         _log.info("tubs.pycsgmesh> mesh")
 
-        polygons = []
-
-        dPhi = pDPhi / self.nslice
-
-        for i in range(0, self.nslice, 1):
-            i1 = i
-            i2 = i + 1
-
-            p1 = dPhi * i1 + pSPhi
-            p2 = dPhi * i2 + pSPhi
-
-            xRMinP1 = pRMin * _np.cos(p1)
-            yRMinP1 = pRMin * _np.sin(p1)
-            xRMinP2 = pRMin * _np.cos(p2)
-            yRMinP2 = pRMin * _np.sin(p2)
-
-            xRMaxP1 = pRMax * _np.cos(p1)
-            yRMaxP1 = pRMax * _np.sin(p1)
-            xRMaxP2 = pRMax * _np.cos(p2)
-            yRMaxP2 = pRMax * _np.sin(p2)
-
-            ###########################
-            # wedge ends
-            ###########################
-            if pDPhi != 2 * _np.pi and i == 0:
-                vWedg = []
-                vWedg.append(_Vertex([xRMinP1, yRMinP1, -pDz]))
-                vWedg.append(_Vertex([xRMinP1, yRMinP1, pDz]))
-                vWedg.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-                vWedg.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-                vWedg.reverse()
-                polygons.append(_Polygon(vWedg))
-
-            if pDPhi != 2 * _np.pi and i == self.nslice - 1:
-                vWedg = []
-                vWedg.append(_Vertex([xRMinP2, yRMinP2, -pDz]))
-                vWedg.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-                vWedg.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-                vWedg.append(_Vertex([xRMinP2, yRMinP2, pDz]))
-                vWedg.reverse()
-                polygons.append(_Polygon(vWedg))
-
-            ###########################
-            # tube ends
-            ###########################
-            if pRMin == 0:
-                vEnd = []
-                vEnd.append(_Vertex([0, 0, -pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-                polygons.append(_Polygon(vEnd))
-
-                vEnd = []
-                vEnd.append(_Vertex([0, 0, pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-                polygons.append(_Polygon(vEnd))
-
-            else:
-                vEnd = []
-                vEnd.append(_Vertex([xRMinP1, yRMinP1, -pDz]))
-                vEnd.append(_Vertex([xRMinP2, yRMinP2, -pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-                polygons.append(_Polygon(vEnd))
-
-                vEnd = []
-                vEnd.append(_Vertex([xRMinP1, yRMinP1, pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-                vEnd.append(_Vertex([xRMinP2, yRMinP2, pDz]))
-                polygons.append(_Polygon(vEnd))
-
-            ###########################
-            # Curved cylinder faces
-            ###########################
-            vCurv = []
-            vCurv.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-            vCurv.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-            vCurv.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-            vCurv.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-            polygons.append(_Polygon(vCurv))
-
-            if pRMin != 0:
-                vCurv = []
-                vCurv.append(_Vertex([xRMinP1, yRMinP1, -pDz]))
-                vCurv.append(_Vertex([xRMinP1, yRMinP1, pDz]))
-                vCurv.append(_Vertex([xRMinP2, yRMinP2, pDz]))
-                vCurv.append(_Vertex([xRMinP2, yRMinP2, -pDz]))
-                polygons.append(_Polygon(vCurv))
-
-        mesh = _CSG.fromPolygons(polygons)
+        # rings of vertices, inner bottom, inner top, outer bottom and outer top
+        nslice = self.nslice
+        phi = pSPhi + pDPhi / nslice * _np.arange(nslice + 1)
+        cosPhi = _np.cos(phi)
+        sinPhi = _np.sin(phi)
+
+        vertices = _np.concatenate(
+            [
+                _np.stack([r * cosPhi, r * sinPhi, _np.full(nslice + 1, z)], axis=1)
+                for r, z in [(pRMin, -pDz), (pRMin, pDz), (pRMax, -pDz), (pRMax, pDz)]
+            ]
+        )
+        iB = _np.arange(nslice + 1)
+        iT = iB + (nslice + 1)
+        oB = iB + 2 * (nslice + 1)
+        oT = iB + 3 * (nslice + 1)
+
+        # the inner ring collapses onto the axis for pRMin = 0 so those quads
+        # reduce to triangles (or vanish) when the vertices are merged
+        p1 = _np.arange(nslice)
+        p2 = p1 + 1
+        quads = [
+            _np.stack([iB[p1], iB[p2], oB[p2], oB[p1]], axis=1),  # tube ends
+            _np.stack([iT[p1], oT[p1], oT[p2], iT[p2]], axis=1),
+            _np.stack([oB[p1], oB[p2], oT[p2], oT[p1]], axis=1),  # curved faces
+            _np.stack([iB[p1], iT[p1], iT[p2], iB[p2]], axis=1),
+        ]
+
+        # wedge ends
+        if pDPhi != 2 * _np.pi:
+            quads.append(_np.array([[oB[0], oT[0], iT[0], iB[0]]]))
+            quads.append(_np.array([[iT[-1], oT[-1], oB[-1], iB[-1]]]))
+
+        mesh = _CSG.fromArrays(vertices, [_np.concatenate(quads)])
 
         return mesh
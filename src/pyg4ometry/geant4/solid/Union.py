@@ -51,6 +51,12 @@ class Union(_SolidBase):
         return f"Union {self.name} {self.obj1.name} {self.obj2.name}"
 
     def mesh(self):
+        return self._cachedMesh(self._mesh)
+
+    def _meshCacheOperands(self):
+        return [self.object1(), self.object2()]
+
+    def _mesh(self):
         _log.info("union.pycsgmesh>")
 
         # look up solids in registry
@@ -61,3 +61,186 @@ def MeshShrink(m, shrinkFactor=1e-5):
     m.append(vertnormals)
 
     return vertnormals
+
+
+def sweepAndPrune(aabbMin, aabbMax):
+    """
+    Broad phase collision detection between axis aligned bounding boxes. The
+    boxes are sorted along the axis with the largest spread and swept to find
+    candidates, which are then tested on the remaining two axes. Touching boxes
+    are considered to overlap.
+
+    :param aabbMin: lower corners of the boxes
+    :type aabbMin: array(N,3)
+    :param aabbMax: upper corners of the boxes
+    :type aabbMax: array(N,3)
+    :returns: index pairs (i < j) of overlapping boxes in lexicographic order
+    :rtype: array(K,2)
+    """
+    aabbMin = _np.asarray(aabbMin, dtype=float).reshape(-1, 3)
+    aabbMax = _np.asarray(aabbMax, dtype=float).reshape(-1, 3)
+
+    n = len(aabbMin)
+    if n < 2:
+        return _np.empty((0, 2), dtype=_np.int64)
+
+    # sweep axis
+    axis = int(_np.argmax((aabbMin + aabbMax).var(axis=0)))
+    order = _np.argsort(aabbMin[:, axis], kind="stable")
+    sortedMin = aabbMin[order, axis]
+    sortedMax = aabbMax[order, axis]
+
+    # every box after i in the sorted list starting before box i ends is a candidate
+    end = _np.searchsorted(sortedMin, sortedMax, side="right")
+    counts = _np.maximum(end - _np.arange(1, n + 1), 0)
+    first = _np.repeat(_np.arange(n), counts)
+    offsets = _np.arange(counts.sum()) - _np.repeat(_np.cumsum(counts) - counts, counts)
+    a = order[first]
+    b = order[first + 1 + offsets]
+
+    # full test on all three axes
+    keep = _np.all((aabbMin[a] <= aabbMax[b]) & (aabbMin[b] <= aabbMax[a]), axis=1)
+    a = a[keep]
+    b = b[keep]
+
+    pairs = _np.stack([_np.minimum(a, b), _np.maximum(a, b)], axis=1)
+    return pairs[_np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def pointsInsideMesh(points, vertices, triangles):
+    """
+    Test if points are inside a closed triangle mesh, by the parity of the number
+    of mesh triangles crossed by a ray from each point. The ray direction is
+    fixed and not aligned with the axes, so it rarely grazes an edge of the
+    axis aligned faces that are common in meshed solids.
+
+    :param points: points to test
+    :type points: array(P,3)
+    :param vertices: vertex positions of the mesh
+    :type vertices: array(N,3)
+    :param triangles: triangles of the mesh as vertex indices
+    :type triangles: array(T,3)
+    :returns: True for each point inside the mesh
+    :rtype: array(P) of bool
+    """
+    points = _np.asarray(points, dtype=float).reshape(-1, 3)
+    vertices = _np.asarray(vertices, dtype=float).reshape(-1, 3)
+    triangles = _np.asarray(triangles, dtype=_np.int64).reshape(-1, 3)
+
+    direction = _np.array([0.5773, 0.5775, 0.5774])
+    direction /= _np.linalg.norm(direction)
+
+    # Moller-Trumbore ray triangle intersection, vectorised over the triangles
+    v0 = vertices[triangles[:, 0]]
+    e1 = vertices[triangles[:, 1]] - v0
+    e2 = vertices[triangles[:, 2]] - v0
+    p = _np.cross(direction, e2)
+    det = _np.einsum("ij,ij->i", e1, p)
+    valid = _np.abs(det) > 1e-12
+    v0, e1, e2, p, invDet = v0[valid], e1[valid], e2[valid], p[valid], 1.0 / det[valid]
+
+    inside = _np.zeros(len(points), dtype=bool)
+    for i, point in enumerate(points):
+        t = point - v0
+        u = _np.einsum("ij,ij->i", t, p) * invDet
+        q = _np.cross(t, e1)
+        v = (q @ direction) * invDet
+        dist = _np.einsum("ij,ij->i", e2, q) * invDet
+        crossed = (u >= 0) & (v >= 0) & (u + v <= 1) & (dist > 0)
+        inside[i] = crossed.sum() % 2 == 1
+
+    return inside
+
+
+def mergeVertices(vertices, faces, decimals=11):
+    """
+    Merge coincident vertices (after rounding) of a mesh given as arrays and
+    renumber the faces accordingly.
+
+    :param vertices: vertex positions
+    :type vertices: array(N,3)
+    :param faces: polygons as vertex indices, one array per polygon size
+    :type faces: list of array(F,K)
+    :param decimals: number of decimals vertices are rounded to for comparison
+    :type decimals: int
+    :returns: [unique vertices, faces]
+    """
+    vertices = _np.asarray(vertices, dtype=float).reshape(-1, 3)
+
+    # + 0.0 so that -0 and 0 compare equal
+    rounded = _np.round(vertices, decimals) + 0.0
+    _, index, inverse = _np.unique(rounded, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    return vertices[index], [inverse[_np.asarray(f, dtype=_np.int64)] for f in faces]
+
+
+def weldVertices(vertices):
+    """
+    Weld exactly coincident vertices, e.g. the corners of the triangles of an STL
+    file. The welded vertices are in order of first occurrence.
+
+    :param vertices: vertex positions
+    :type vertices: array(N,3)
+    :returns: [unique vertices array(M,3), index of each input vertex in them array(N)]
+    """
+    vertices = _np.asarray(vertices, dtype=float).reshape(-1, 3)
+    if len(vertices) == 0:
+        return vertices, _np.empty(0, dtype=_np.int64)
+
+    # rows compared as raw bytes (+ 0.0 so that -0 and 0 compare equal)
+    rows = _np.ascontiguousarray(vertices + 0.0).view(_np.dtype((_np.void, 24))).ravel()
+    _, index, inverse = _np.unique(rows, return_index=True, return_inverse=True)
+
+    # renumber from sorted to first occurrence order
+    order = _np.argsort(index, kind="stable")
+    rank = _np.empty_like(order)
+    rank[order] = _np.arange(len(order))
+
+    return vertices[index[order]], rank[inverse.reshape(-1)]
+
+
+def triangulateFaces(faces):
+    """
+    Fan triangulation of convex polygons, preserving their winding. Triangles
+    with repeated vertices (e.g. from polygons collapsed by mergeVertices) are
+    removed.
+
+    :param faces: polygons as vertex indices, one array per polygon size
+    :type faces: list of array(F,K)
+    :returns: triangles
+    :rtype: array(T,3)
+    """
+    triangles = [_np.empty((0, 3), dtype=_np.int64)]
+    for f in faces:
+        f = _np.asarray(f, dtype=_np.int64)
+        if f.size == 0:
+            continue
+        for k in range(1, f.shape[1] - 1):
+            triangles.append(_np.stack([f[:, 0], f[:, k], f[:, k + 1]], axis=1))
+    triangles = _np.concatenate(triangles)
+
+    degenerate = (
+        (triangles[:, 0] == triangles[:, 1])
+        | (triangles[:, 1] == triangles[:, 2])
+        | (triangles[:, 2] == triangles[:, 0])
+    )
+    return triangles[~degenerate]
+
+
+def removeUnusedVertices(vertices, faces):
+    """
+    Remove vertices not referenced by any face and renumber the faces.
+
+    :param vertices: vertex positions
+    :type vertices: array(N,3)
+    :param faces: polygons as vertex indices, one array per polygon size
+    :type faces: list of array(F,K)
+    :returns: [used vertices, faces]
+    """
+    used = _np.zeros(len(vertices), dtype=bool)
+    for f in faces:
+        used[_np.asarray(f, dtype=_np.int64).ravel()] = True
+    newIndex = _np.cumsum(used) - 1
+
+    return vertices[used], [newIndex[_np.asarray(f, dtype=_np.int64)] for f in faces]
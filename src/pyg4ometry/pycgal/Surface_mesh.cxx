@@ -1,5 +1,6 @@
 #include <vector>
 
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/pytypes.h>
 #include <pybind11/stl.h>
@@ -220,6 +221,54 @@ py::list *toVerticesAndPolygons(Surface_mesh_EPECK &sm) {
   return ret;
 }
 
+py::tuple toVerticesAndFaces(Surface_mesh_EPECK &sm) {
+
+  // vertices (N,3) float64 and triangles (M,3) int32 written straight into
+  // numpy owned buffers, faces with more than three vertices are fan
+  // triangulated
+  std::vector<int32_t> vertexIndex(sm.num_vertices(), -1);
+
+  py::ssize_t nVertices = (py::ssize_t)sm.number_of_vertices();
+  py::array_t<double> vertices(std::vector<py::ssize_t>{nVertices, 3});
+  auto v = vertices.mutable_unchecked<2>();
+
+  py::ssize_t iVertex = 0;
+  for (Surface_mesh_EPECK::Vertex_index vd : sm.vertices()) {
+    const Point_3_EPECK &p = sm.point(vd);
+    v(iVertex, 0) = CGAL::to_double(p.x());
+    v(iVertex, 1) = CGAL::to_double(p.y());
+    v(iVertex, 2) = CGAL::to_double(p.z());
+    vertexIndex[(size_t)vd] = (int32_t)iVertex;
+    ++iVertex;
+  }
+
+  py::ssize_t nTriangles = 0;
+  for (Surface_mesh_EPECK::Face_index fd : sm.faces()) {
+    nTriangles += sm.degree(fd) - 2;
+  }
+
+  py::array_t<int32_t> faces(std::vector<py::ssize_t>{nTriangles, 3});
+  auto f = faces.mutable_unchecked<2>();
+
+  py::ssize_t iFace = 0;
+  std::vector<int32_t> cell;
+  for (Surface_mesh_EPECK::Face_index fd : sm.faces()) {
+    cell.clear();
+    for (Surface_mesh_EPECK::Halfedge_index hd :
+         CGAL::halfedges_around_face(sm.halfedge(fd), sm)) {
+      cell.push_back(vertexIndex[(size_t)sm.source(hd)]);
+    }
+    for (size_t k = 1; k + 1 < cell.size(); k++) {
+      f(iFace, 0) = cell[0];
+      f(iFace, 1) = cell[k];
+      f(iFace, 2) = cell[k + 1];
+      ++iFace;
+    }
+  }
+
+  return py::make_tuple(vertices, faces);
+}
+
 void toCGALSurfaceMesh(Surface_mesh_EPECK &sm, py::list &polygons) {
 
   std::vector<Vector> verts;
@@ -296,6 +345,29 @@ void toCGALSurfaceMesh(Surface_mesh_EPECK &sm, py::list &polygons) {
   }
 }
 
+void toCGALSurfaceMesh(
+    Surface_mesh_EPECK &sm,
+    py::array_t<double, py::array::c_style | py::array::forcecast> &vertices,
+    py::array_t<int64_t, py::array::c_style | py::array::forcecast>
+        &triangles) {
+
+  // vertices (N,3) and triangles (F,3), vertices are expected to be unique
+  auto v = vertices.unchecked<2>();
+  auto t = triangles.unchecked<2>();
+
+  sm.reserve(v.shape(0), 3 * t.shape(0) / 2, t.shape(0));
+
+  for (py::ssize_t i = 0; i < v.shape(0); i++) {
+    sm.add_vertex(Point_3_EPECK(v(i, 0), v(i, 1), v(i, 2)));
+  }
+
+  for (py::ssize_t i = 0; i < t.shape(0); i++) {
+    sm.add_face(Surface_mesh_EPECK::Vertex_index((size_t)t(i, 0)),
+                Surface_mesh_EPECK::Vertex_index((size_t)t(i, 1)),
+                Surface_mesh_EPECK::Vertex_index((size_t)t(i, 2)));
+  }
+}
+
 void toCGALSurfaceMesh(Surface_mesh_EPECK &sm1, Surface_mesh_ECER &sm2) {
   py::list *polys = new py::list();
 
@@ -605,8 +677,16 @@ PYBIND11_MODULE(Surface_mesh, m) {
   m.def("toCGALSurfaceMesh", [](Surface_mesh_EPECK &sm, py::list &polygons) {
     toCGALSurfaceMesh(sm, polygons);
   });
+  m.def("toCGALSurfaceMeshFromArrays",
+        [](Surface_mesh_EPECK &sm,
+           py::array_t<double, py::array::c_style | py::array::forcecast>
+               &vertices,
+           py::array_t<int64_t, py::array::c_style | py::array::forcecast>
+               &triangles) { toCGALSurfaceMesh(sm, vertices, triangles); });
   m.def("toVerticesAndPolygons",
         [](Surface_mesh_EPECK &sm) { return toVerticesAndPolygons(sm); });
+  m.def("toVerticesAndFaces",
+        [](Surface_mesh_EPECK &sm) { return toVerticesAndFaces(sm); });
 
   /**********************************************************************
   ECER
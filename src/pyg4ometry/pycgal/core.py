@@ -13,6 +13,9 @@ from . import Triangle_3
 from . import Vector_3
 from . import CGAL
 from . import pythonHelpers
+from ..meshutils import mergeVertices as _mergeVertices
+from ..meshutils import removeUnusedVertices as _removeUnusedVertices
+from ..meshutils import triangulateFaces as _triangulateFaces
 
 import numpy as _np
 
@@ -29,9 +32,35 @@ class CSG:
         Polygon_mesh_processing.triangulate_faces(csg.sm)
         return csg
 
+    @classmethod
+    def fromArrays(cls, vertices, faces):
+        """
+        Mesh from numpy arrays. Coincident vertices are merged and the (convex)
+        polygons triangulated, as for fromPolygons.
+
+        :param vertices: vertex positions
+        :type vertices: array(N,3)
+        :param faces: polygons as vertex indices, one array per polygon size
+        :type faces: list of array(F,K)
+        """
+        vertices, faces = _mergeVertices(vertices, faces)
+        vertices, (triangles,) = _removeUnusedVertices(vertices, [_triangulateFaces(faces)])
+
+        csg = CSG()
+        Surface_mesh.toCGALSurfaceMeshFromArrays(csg.sm, vertices, triangles)
+        return csg
+
     def toVerticesAndPolygons(self):
         return Surface_mesh.toVerticesAndPolygons(self.sm)
 
+    def toVerticesAndFaces(self):
+        """
+        Mesh as numpy arrays, without intermediate python lists.
+
+        :returns: [vertices array(N,3) float64, triangles array(M,3) int32]
+        """
+        return Surface_mesh.toVerticesAndFaces(self.sm)
+
     def clone(self):
         csg = CSG()
         csg.sm = self.sm.clone()
@@ -77,6 +77,26 @@ class CSG(object):
         csg.polygons = polygons
         return csg
 
+    @classmethod
+    def fromArrays(cls, vertices, faces):
+        """
+        Mesh from numpy arrays of vertices (N,3) and faces, a list with one (F,K)
+        array of vertex indices per polygon size. Coincident vertices are merged
+        and polygons collapsed to fewer than three vertices dropped.
+        """
+        from pyg4ometry.meshutils import mergeVertices as _mergeVertices
+
+        vertices, faces = _mergeVertices(vertices, faces)
+        vertices = vertices.tolist()
+
+        polygons = []
+        for f in faces:
+            for face in f.tolist():
+                face = [iv for k, iv in enumerate(face) if iv != face[k - 1]]
+                if len(set(face)) >= 3:
+                    polygons.append(Polygon([_Vertex(_Vector(*vertices[iv])) for iv in face]))
+        return CSG.fromPolygons(polygons)
+
     def clone(self):
         csg = CSG()
         csg.polygons = list([p.clone() for p in self.polygons])
@@ -232,6 +252,16 @@ class CSG(object):
             verts.append(tuple(p))
         return verts, polys, count
 
+    def toVerticesAndFaces(self):
+        """
+        Return vertices as an (N,3) float64 array and the polygons fan
+        triangulated as an (M,3) int32 array, as pycgal CSG.toVerticesAndFaces.
+        """
+        verts, polys, count = self.toVerticesAndPolygons()
+        triangles = [[p[0], p[k], p[k + 1]] for p in polys for k in range(1, len(p) - 1)]
+        return (_np.array(verts, dtype=_np.float64).reshape(-1, 3),
+                _np.array(triangles, dtype=_np.int32).reshape(-1, 3))
+
     def saveVTK(self, filename):
         """
         Save polygons in VTK file.
@@ -2,23 +2,21 @@ import numpy as _np
 import re as _re
 import warnings as _warnings
 import struct
-import io
 
 import pyg4ometry.visualisation as _vi
 import pyg4ometry.geant4 as _g4
 import pyg4ometry.gdml as _gd
+from pyg4ometry.meshutils import weldVertices as _weldVertices
 
+# binary STL facet: normal, three vertices and an attribute byte count
+_binaryFacet = _np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
 
-class _Facet:
-    def __init__(self, normal=(0, 0, 0)):
-        self.vertices = []
-        self.normal = normal
-
-    def add_vertex(self, xyztup):
-        self.vertices.append(xyztup)
-
-    def dump(self):
-        return (tuple(self.vertices), self.normal)
+# some exporters write nan or inf normals for degenerate facets
+_floatRe = rb"([-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?|[-+]?(?i:nan|inf(?:inity)?))"
+_asciiNormalRe = _re.compile(rb"facet\s+normal\s+" + rb"\s+".join([_floatRe] * 3))
+_asciiVertexRe = _re.compile(rb"vertex\s+" + rb"\s+".join([_floatRe] * 3))
 
 
 class Reader:
@@ -56,7 +54,6 @@ class Reader:
         self.solidname = solidname
 
         self.worldVolumeName = ""
-        self.facet_list = []
 
         self.scale = float(scale)
 
@@ -66,7 +63,7 @@ class Reader:
             # this detection is not good, there might be binary STL files that start with 'solid'.
             is_binary = forcebinary or struct.unpack("5s", data[0:5])[0] != b"solid"
             try:
-                self.facet_list = list(
+                triangles, self.normals = (
                     self._load_binary(data) if is_binary else self._load_ascii(data)
                 )
             except Exception as e:
@@ -80,75 +77,67 @@ class Reader:
                     )
                 ) from e
 
+        # weld the corners of the triangles into a compact vertex and index array
+        self.vertices, index = _weldVertices(triangles.reshape(-1, 3))
+        self.faces = index.reshape(-1, 3)
+
         # centre model if requested
         if centre:
             self.extentCentre()
 
         self.solid = _g4.solid.TessellatedSolid(
             self.solidname,
-            self.facet_list,
+            [self.vertices, self.faces],
             self._registry,
             _g4.solid.TessellatedSolid.MeshType.Stl,
         )
 
+    @property
+    def facet_list(self):
+        """
+        Facets as a list of ((vertex1, vertex2, vertex3), normal)
+        """
+        return [
+            (tuple(map(tuple, triangle)), tuple(normal))
+            for triangle, normal in zip(self.vertices[self.faces].tolist(), self.normals.tolist())
+        ]
+
     def _load_ascii(self, data):
         """
         Load ASCII STL file from bytes instance
 
         :type data: bytes
+        :returns: [triangles array(F,3,3), normals array(F,3)]
         """
-        # Compile re to match numbers
-        num_re = _re.compile(r"^[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?$")
-
-        def extractXYZ(string):
-            # The scaling here is a bit cheeky, but the scale parameter in
-            # GDML seems to be ignored by Geant4 for Tessellated Solids
-            return tuple([self.scale * float(v) for v in string.split() if num_re.match(v)])
-
-        f = io.TextIOWrapper(io.BytesIO(data))
-        line = f.readline()
-        facet = None
-        while line:
-            sline = line.strip()
-            if sline.startswith("facet"):  # Indicates a facet, only first char comparison
-                assert facet == None
-                normal = extractXYZ(sline)
-                facet = _Facet(normal)
-
-            elif sline.startswith("vertex"):
-                assert facet != None
-                vertex = extractXYZ(sline)
-                facet.add_vertex(vertex)
-
-            elif sline.startswith("endfacet"):
-                yield facet.dump()
-                facet = None
-
-            line = f.readline()
+        # The scaling here is a bit cheeky, but the scale parameter in
+        # GDML seems to be ignored by Geant4 for Tessellated Solids
+        normals = _np.array(_asciiNormalRe.findall(data), dtype=float).reshape(-1, 3)
+        vertices = _np.array(_asciiVertexRe.findall(data), dtype=float).reshape(-1, 3)
+        if len(vertices) != 3 * len(normals):
+            msg = f"{len(vertices)} vertices for {len(normals)} triangular facets"
+            raise ValueError(msg)
+
+        return self.scale * vertices.reshape(-1, 3, 3), self.scale * normals
 
     def _load_binary(self, data):
         """
         Load binary STL file from bytes instance
 
         :type data: bytes
+        :returns: [triangles array(F,3,3), normals array(F,3)]
         """
         # ignore the first 80 bytes of data, as this is the header.
         faces = struct.unpack("<I", data[80:84])[0]
 
-        def extractVector(d):
-            vec = struct.unpack("<fff", d)
-            return tuple([self.scale * v for v in vec])
-
-        for fc in range(faces):
-            fo = 84 + fc * 50  # offset of the current facet
-            facet = _Facet(extractVector(data[fo : fo + 12]))
-            for v in range(1, 4):
-                vo = fo + v * 12
-                facet.add_vertex(extractVector(data[vo : vo + 12]))
-            # ignore last 2 bytes of facet definition - this might break if the additional byte count
-            # _actually_ refers to an additional byte count, but it not always does (some application
-            # directly store metadata in those two bytes).
-            yield facet.dump()
+        # ignore last 2 bytes of facet definition - this might break if the additional byte count
+        # _actually_ refers to an additional byte count, but it not always does (some application
+        # directly store metadata in those two bytes).
+        facets = _np.frombuffer(data, dtype=_binaryFacet, count=faces, offset=84)
+
+        return (
+            self.scale * facets["vertices"].astype(float),
+            self.scale * facets["normal"].astype(float),
+        )
 
     def extent(self):
         """
@@ -158,30 +147,10 @@ class Reader:
         :rtype: [[xmin,ymin,zmin],[xmax, ymax, zmax]]
         """
 
-        xmin = 1e9
-        ymin = 1e9
-        zmin = 1e9
-        xmax = -1e9
-        ymax = -1e9
-        zmax = -1e9
-
-        for f in self.facet_list:
-            for v in f[0]:
-                if v[0] < xmin:
-                    xmin = v[0]
-                if v[1] < ymin:
-                    ymin = v[1]
-                if v[2] < zmin:
-                    zmin = v[2]
-
-                if v[0] > xmax:
-                    xmax = v[0]
-                if v[1] > ymax:
-                    ymax = v[1]
-                if v[2] > zmax:
-                    zmax = v[2]
-
-        return [[xmin, ymin, zmin], [xmax, ymax, zmax]]
+        if len(self.vertices) == 0:
+            return [[1e9, 1e9, 1e9], [-1e9, -1e9, -1e9]]
+
+        return [self.vertices.min(axis=0).tolist(), self.vertices.max(axis=0).tolist()]
 
     def extentCentre(self):
         """
@@ -202,18 +171,7 @@ class Reader:
 
         """
 
-        facet_list = []
-
-        for f in self.facet_list:
-            vl = []
-            n = f[1]
-            for v in f[0]:
-                vt = list(_np.array(v) + _np.array(translation))
-                vl.append(vt)
-
-            facet_list.append([vl, n])
-
-        self.facet_list = facet_list
+        self.vertices = self.vertices + _np.asarray(translation, dtype=float)
 
     def getSolid(self):
         """
@@ -1,4 +1,6 @@
 import vtk as _vtk
+from vtk.util import numpy_support as _numpy_support
+from vtk.util.numpy_support import numpy_to_vtk as _numpy_to_vtk
 import copy as _copy
 import numpy as _np
 
@@ -11,37 +13,64 @@ def mkVtkIdList(it):
     return vil
 
 
-# convert pycsh mesh to vtkPolyData
-def pycsgMeshToVtkPolyData(mesh):
-    # refine mesh
-    # mesh.refine()
+def numpyToVtkCellArray(cells):
+    """
+    Build a vtkCellArray from an (M,K) array of point indices, each row one cell
+    of K points, with a single copy of the offsets and connectivity arrays.
+
+    :param cells: cell point indices
+    :type cells: array(M,K)
+    """
+    cells = _np.asarray(cells)
+    nCells = len(cells)
+    cellSize = cells.shape[1] if cells.ndim == 2 else 0
+
+    idType = _numpy_support.get_numpy_array_type(_vtk.VTK_ID_TYPE)
+    connectivity = _np.ascontiguousarray(cells, dtype=idType).ravel()
+    offsets = _np.arange(0, nCells * cellSize + 1, max(cellSize, 1), dtype=idType)[: nCells + 1]
 
-    verts, cells, count = mesh.toVerticesAndPolygons()
-    meshPolyData = _vtk.vtkPolyData()
-    points = _vtk.vtkPoints()
     polys = _vtk.vtkCellArray()
-    scalars = _vtk.vtkFloatArray()
+    polys.SetData(
+        _numpy_support.numpy_to_vtkIdTypeArray(offsets, deep=True),
+        _numpy_support.numpy_to_vtkIdTypeArray(connectivity, deep=True),
+    )
+    return polys
 
-    for v in verts:
-        points.InsertNextPoint(v)
 
-    for p in cells:
-        polys.InsertNextCell(mkVtkIdList(p))
+def verticesAndFacesToVtkPolyData(verts, faces):
+    """
+    Build a vtkPolyData from numpy vertex and face arrays, as returned by
+    CSG.toVerticesAndFaces.
 
-    for i in range(count):
-        scalars.InsertTuple1(i, 1)
+    :param verts: vertex positions
+    :type verts: array(N,3)
+    :param faces: face vertex indices
+    :type faces: array(M,K)
+    """
+    verts = _np.ascontiguousarray(verts, dtype=_np.float64).reshape(-1, 3)
+
+    points = _vtk.vtkPoints()
+    points.SetData(_numpy_to_vtk(verts, deep=True))
 
+    scalars = _numpy_to_vtk(_np.ones(len(faces), dtype=_np.float32), deep=True)
+
+    meshPolyData = _vtk.vtkPolyData()
     meshPolyData.SetPoints(points)
-    meshPolyData.SetPolys(polys)
+    meshPolyData.SetPolys(numpyToVtkCellArray(faces))
     meshPolyData.GetPointData().SetScalars(scalars)
 
-    del points
-    del polys
-    del scalars
-
     return meshPolyData
 
 
+# convert pycsh mesh to vtkPolyData
+def pycsgMeshToVtkPolyData(mesh):
+    # refine mesh
+    # mesh.refine()
+
+    verts, cells = mesh.toVerticesAndFaces()
+    return verticesAndFacesToVtkPolyData(verts, cells)
+
+
 def vtkPolyDataToNumpy(fileName):
     r = _vtk.vtkPolyDataReader()
     r.SetFileName(fileName)
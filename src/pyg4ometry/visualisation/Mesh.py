@@ -5,8 +5,14 @@ import pyg4ometry.exceptions
 
 if _config.meshing == _config.meshingType.pycsg:
     from pyg4ometry.pycsg.core import CSG as _CSG
+    from pyg4ometry.pycsg.geom import Vector as _Vector
+    from pyg4ometry.pycsg.geom import Vertex as _Vertex
+    from pyg4ometry.pycsg.geom import Polygon as _Polygon
 elif _config.meshing == _config.meshingType.cgal_sm:
     from pyg4ometry.pycgal.core import CSG as _CSG
+    from pyg4ometry.pycgal.geom import Vector as _Vector
+    from pyg4ometry.pycgal.geom import Vertex as _Vertex
+    from pyg4ometry.pycgal.geom import Polygon as _Polygon
 
 
 import logging as _log
@@ -20,15 +26,19 @@ class OverlapType:
 
 
 class Mesh:
-    def __init__(self, solid):
+    def __init__(self, solid, localmesh=None):
         parameters = []
         values = {}
 
         # solid which contains the mesh
         self.solid = solid
 
-        # mesh in local coordinates
-        self.localmesh = self.solid.mesh()
+        # mesh in local coordinates, unless already made e.g. by Registry.prefetchMeshes
+        self.localmesh = self.solid.mesh() if localmesh is None else localmesh
+
+        # bounding box of localmesh, cached by getLocalBoundingBox
+        self._localBoundingBox = None
+        self._localBoundingBoxMesh = None
 
         # bounding mesh in local coordinates
         self.localboundingmesh = self.getBoundingBoxMesh()
@@ -52,11 +62,25 @@ class Mesh:
     def getLocalMesh(self):
         return self.localmesh
 
+    def getLocalBoundingBox(self):
+        """
+        Axes aligned bounding box of the local mesh as an array(2,3) of the
+        minimum and maximum, cached until the local mesh is replaced.
+        """
+        if self._localBoundingBoxMesh is not self.localmesh:
+            self._localBoundingBox = _np.array(
+                _getBoundingBox(self.localmesh, nameForError=self.solid)
+            )
+            self._localBoundingBoxMesh = self.localmesh
+        return self._localBoundingBox
+
     def getBoundingBox(self, rotationMatrix=None, translation=None):
         """
         Axes aligned bounding box. Can also provide a rotation and
         a translation (applied in that order) to the vertices.
         """
+        if rotationMatrix is None and translation is None:
+            return self.getLocalBoundingBox().tolist()
         return _getBoundingBox(self.localmesh, rotationMatrix, translation, self.solid)
 
     def getBoundingBoxMesh(self):
@@ -69,15 +93,13 @@ def _getBoundingBox(aMesh, rotationMatrix=None, translation=None, nameForError="
     Axes aligned bounding box. Can also provide a rotation and
     a translation (applied in that order) to the vertices.
     """
-    vertices, _, _ = aMesh.toVerticesAndPolygons()
-    if not vertices:
+    vertices, _ = aMesh.toVerticesAndFaces()
+    if len(vertices) == 0:
         print("Warning> getBoundingBox null mesh error : ", nameForError)
         if _config.meshingNullException:
             raise pyg4ometry.exceptions.NullMeshError(nameForError)
         else:
             return [[-1e-9, -1e-9, -1e-9], [1e9, 1e9, 1e9]]
-    vertices = _np.vstack(vertices)
-
     if rotationMatrix is not None:
         vertices = rotationMatrix.dot(vertices.T).T
     if translation is not None:
@@ -85,8 +107,8 @@ def _getBoundingBox(aMesh, rotationMatrix=None, translation=None, nameForError="
         vertices[..., 1] += translation[1]
         vertices[..., 2] += translation[2]
 
-    vMin = [min(vertices[..., 0]), min(vertices[..., 1]), min(vertices[..., 2])]
-    vMax = [max(vertices[..., 0]), max(vertices[..., 1]), max(vertices[..., 2])]
+    vMin = vertices.min(axis=0).tolist()
+    vMax = vertices.max(axis=0).tolist()
 
     _log.info("visualisation.Mesh.getBoundingBox> %s %s", vMin, vMax)
 
@@ -111,3 +133,15 @@ def _getBoundingBoxMesh(boundingBox):
 
     mesh = _CSG.cube(center=[x0, y0, z0], radius=[pX, pY, pZ])
     return mesh
+
+
+def _meshFromVerticesAndPolygons(vertices, polygons):
+    """
+    Build a mesh from the output of toVerticesAndPolygons, e.g. after transfer
+    between processes as meshes themselves cannot be pickled.
+    """
+    polygons = [
+        _Polygon([_Vertex(_Vector(*vertices[iVertex])) for iVertex in polygon])
+        for polygon in polygons
+    ]
+    return _CSG.fromPolygons(polygons)
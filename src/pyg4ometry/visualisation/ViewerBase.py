@@ -1,6 +1,9 @@
 import base64 as _base64
+import hashlib as _hashlib
+import json as _json
 import numpy as _np
 import random as _random
+import struct as _struct
 import pyg4ometry.pycgal as _pycgal
 import pyg4ometry.transformation as _transformation
 from pyg4ometry.visualisation.VisualisationOptions import (
@@ -34,6 +37,65 @@ def _daughterSubtractedMesh(lv):
     return mm
 
 
+def _matricesToQuaternions(matrices):
+    """
+    Unit quaternions (x, y, z, w) of rotation matrices.
+
+    :param matrices: rotation matrices
+    :type matrices: array(N,3,3)
+    :returns: quaternions
+    :rtype: array(N,4)
+    """
+    m = _np.asarray(matrices, dtype=float).reshape(-1, 3, 3)
+    m00, m01, m02 = m[:, 0, 0], m[:, 0, 1], m[:, 0, 2]
+    m10, m11, m12 = m[:, 1, 0], m[:, 1, 1], m[:, 1, 2]
+    m20, m21, m22 = m[:, 2, 0], m[:, 2, 1], m[:, 2, 2]
+
+    # largest of the four diagonal combinations for numerical stability
+    diagonals = _np.stack(
+        [m00 + m11 + m22, m00 - m11 - m22, m11 - m00 - m22, m22 - m00 - m11], axis=1
+    )
+    case = _np.argmax(diagonals, axis=1)
+    s = 2 * _np.sqrt(_np.maximum(1 + diagonals[_np.arange(len(m)), case], 1e-300))
+
+    # (x, y, z, w) * s for each case
+    q = _np.where(
+        (case == 0)[:, None],
+        _np.stack([m21 - m12, m02 - m20, m10 - m01, s * s / 4], axis=1),
+        _np.where(
+            (case == 1)[:, None],
+            _np.stack([s * s / 4, m01 + m10, m02 + m20, m21 - m12], axis=1),
+            _np.where(
+                (case == 2)[:, None],
+                _np.stack([m01 + m10, s * s / 4, m12 + m21, m02 - m20], axis=1),
+                _np.stack([m02 + m20, m12 + m21, s * s / 4, m10 - m01], axis=1),
+            ),
+        ),
+    )
+    q = q / s[:, None]
+    return q / _np.linalg.norm(q, axis=1)[:, None]
+
+
+def _glbBytes(gltfJson, blob):
+    """
+    GLB container of a glTF json document and its binary buffer.
+    """
+    jsonChunk = gltfJson.encode("utf-8")
+    jsonChunk += b" " * (-len(jsonChunk) % 4)
+    blob += b"\0" * (-len(blob) % 4)
+
+    length = 12 + 8 + len(jsonChunk) + 8 + len(blob)
+    return b"".join(
+        [
+            _struct.pack("<4sII", b"glTF", 2, length),
+            _struct.pack("<I4s", len(jsonChunk), b"JSON"),
+            jsonChunk,
+            _struct.pack("<I4s", len(blob), b"BIN\0"),
+            blob,
+        ]
+    )
+
+
 class ViewerBase:
     """
     Base class for all viewers and exporters. Handles unique meshes and their instances
@@ -79,7 +141,7 @@ class ViewerBase:
         name=None,
     ):
         """
-        Add a logical volume to viewer (recursively)
+        Add a logical volume and all volumes placed in it (from its PlacementTree) to viewer
 
         :param mtra: Transformation matrix for logical volume
         :type mtra: matrix(3,3)
@@ -89,6 +151,31 @@ class ViewerBase:
         :type visOptions: VisualisationOptions
         """
 
+        tree = lv.placementTree()
+
+        # global transforms of all placements in the frame given by mtra and tra
+        rotations = _np.asarray(mtra) @ tree.rotations
+        translations = tree.translations @ _np.asarray(mtra).T + tra
+
+        self._addLogicalVolumeMeshes(lv, mtra, tra, visOptions, depth, name)
+
+        for i in range(1, len(tree)):
+            pv = tree.physicalVolumes[i]
+            pvDepth = depth + int(tree.depth[i])
+            if pv.type == "placement":
+                self._addLogicalVolumeMeshes(
+                    pv.logicalVolume,
+                    rotations[i],
+                    translations[i],
+                    pv.visOptions,
+                    pvDepth,
+                    pv.name,
+                )
+            else:
+                # copies are placed in the mother, which has the same global transform
+                self._addReplicaMeshes(pv, rotations[i], translations[i], pvDepth - 1)
+
+    def _addLogicalVolumeMeshes(self, lv, mtra, tra, visOptions, depth, name):
         if lv.type == "logical" and lv.mesh is not None and lv.solid.type == "extruder":
             for extruName in lv.solid.g4_decomposed_extrusions:
                 meshName = lv.name + "_" + extruName
@@ -144,62 +231,39 @@ class ViewerBase:
         else:
             print("Unknown logical volume type or null mesh")
 
-        for pv in lv.daughterVolumes:
-            if pv.type == "placement":
+    def _addReplicaMeshes(self, pv, mtra, tra, depth):
+        if pv.type == "replica" or pv.type == "division":
+            for mesh, trans in zip(pv.meshes, pv.transforms):
                 # pv transform
-                pvmrot = _np.linalg.inv(_transformation.tbxyz2matrix(pv.rotation.eval()))
-                if pv.scale:
-                    pvmsca = _np.diag(pv.scale.eval())
-                else:
-                    pvmsca = _np.diag([1, 1, 1])
-
-                pvtra = _np.array(pv.position.eval())
+                pvmrot = _transformation.tbxyz2matrix(trans[0])
+                pvtra = _np.array(trans[1])
 
                 # pv compound transform
-                mtra_new = mtra @ pvmrot @ pvmsca
-                tra_new = mtra @ pvtra + tra
+                new_mtra = mtra @ pvmrot
+                new_tra = mtra @ pvtra + tra
 
-                # pv.visOptions.colour = [_random.random(), _random.random(), _random.random()]
-                self.addLogicalVolume(
-                    pv.logicalVolume,
-                    mtra_new,
-                    tra_new,
-                    pv.visOptions,
-                    depth + 1,
-                    pv.name,
-                )
-            elif pv.type == "replica" or pv.type == "division":
-                for mesh, trans in zip(pv.meshes, pv.transforms):
-                    # pv transform
-                    pvmrot = _transformation.tbxyz2matrix(trans[0])
-                    pvtra = _np.array(trans[1])
-
-                    # pv compound transform
-                    new_mtra = mtra @ pvmrot
-                    new_tra = mtra @ pvtra + tra
+                pv.visOptions.depth = depth + 2
 
-                    pv.visOptions.depth = depth + 2
+                self.addMesh(pv.name, mesh.localmesh)
+                self.addInstance(pv.name, new_mtra, new_tra, pv.name)
+                self.addVisOptions(pv.name, pv.visOptions)
+        elif pv.type == "parametrised":
+            for mesh, trans, i in zip(pv.meshes, pv.transforms, range(0, len(pv.meshes), 1)):
+                pv_name = pv.name + "_param_" + str(i)
 
-                    self.addMesh(pv.name, mesh.localmesh)
-                    self.addInstance(pv.name, new_mtra, new_tra, pv.name)
-                    self.addVisOptions(pv.name, pv.visOptions)
-            elif pv.type == "parametrised":
-                for mesh, trans, i in zip(pv.meshes, pv.transforms, range(0, len(pv.meshes), 1)):
-                    pv_name = pv.name + "_param_" + str(i)
-
-                    # pv transform
-                    pvmrot = _transformation.tbxyz2matrix(trans[0].eval())
-                    pvtra = _np.array(trans[1].eval())
+                # pv transform
+                pvmrot = _transformation.tbxyz2matrix(trans[0].eval())
+                pvtra = _np.array(trans[1].eval())
 
-                    # pv compound transform
-                    new_mtra = mtra @ pvmrot
-                    new_tra = mtra @ pvtra + tra
+                # pv compound transform
+                new_mtra = mtra @ pvmrot
+                new_tra = mtra @ pvtra + tra
 
-                    pv.visOptions.depth = depth + 2
+                pv.visOptions.depth = depth + 2
 
-                    self.addMesh(pv_name, mesh.localmesh)
-                    self.addInstance(pv_name, new_mtra, new_tra, pv_name)
-                    self.addVisOptions(pv_name, pv.visOptions)
+                self.addMesh(pv_name, mesh.localmesh)
+                self.addInstance(pv_name, new_mtra, new_tra, pv_name)
+                self.addVisOptions(pv_name, pv.visOptions)
 
     def addFlukaRegions(self, fluka_registry, max_region=1000000, debugIO=False):
         icount = 0
@@ -384,7 +448,11 @@ class ViewerBase:
 
     def exportGLTFScene(self, gltfFileName="test.gltf", singleInstance=False):
         """Export entire scene as gltf file, filename extension dictates binary (glb) or readable json (gltf)
-        singleInstance is a Boolean flag to supress all but one instance"""
+        singleInstance is a Boolean flag to supress all but one instance
+
+        The whole scene is packed in a single binary buffer. Each mesh is written once, meshes
+        with identical geometry share their data, and each instance is a node referring to its
+        mesh."""
 
         try:
             from pygltflib import (
@@ -398,7 +466,6 @@ class ViewerBase:
                 Mesh,
                 Attributes,
                 Primitive,
-                Node,
                 ARRAY_BUFFER,
                 ELEMENT_ARRAY_BUFFER,
                 FLOAT,
@@ -410,43 +477,71 @@ class ViewerBase:
             print("pygltflib needs to be installed for export : 'pip install pygltflib'")
             return
 
+        if gltfFileName.find("gltf") != -1:
+            binary = False
+        elif gltfFileName.find("glb") != -1:
+            binary = True
+        else:
+            print("ViewerBase::exportGLTFScene> unknown gltf extension")
+            return
+
         materials = []
-        buffers = []
-        bufferViews = []
         accessors = []
         meshes = []
         nodes = []
-        scenes = []
+
+        # geometry of the meshes, identical geometry only once
+        trisArrays = []
+        vertsArrays = []
+        trisOffset = 0
+        vertsOffset = 0
+        geometryAccessors = {}  # geometry hash : (indices accessor, positions accessor)
 
         # loop over meshes
-        iBuffer = 0
-        key_iBuffer = {}
+        key_iMesh = {}
         for k in self.localmeshes:
-            key_iBuffer[k] = iBuffer
-
-            # get mesh
-            csg = self.localmeshes[k]
+            verts, tris = self.localmeshes[k].toVerticesAndFaces()
+            if len(tris) == 0:
+                continue
 
+            # depth ordering of coincident surfaces without changing the scene mesh
             scale = 1 - 0.001 * self.instanceVisOptions[k][0].depth
-            csg.scale([scale, scale, scale])
-
-            inf = csg.info()
-
-            vAndPs = csg.toVerticesAndPolygons()
-            verts = vAndPs[0]
-            tris = vAndPs[1]
-
-            verts = _np.array(verts).astype(_np.float32)
-            tris = _np.array(tris).astype(_np.uint32)
-
-            verts_binary_blob = verts.flatten().tobytes()
-            tris_binary_blob = tris.flatten().tobytes()
-
-            pyg4VisOpt = self.instanceVisOptions[k][0]
+            verts = _np.ascontiguousarray(verts * scale, dtype=_np.float32)
+            tris = _np.ascontiguousarray(tris, dtype=_np.uint32)
+
+            geometryHash = _hashlib.sha1(verts.tobytes())
+            geometryHash.update(tris.tobytes())
+            geometryHash = geometryHash.digest()
+
+            if geometryHash not in geometryAccessors:
+                accessors.append(
+                    Accessor(
+                        bufferView=0,
+                        byteOffset=trisOffset,
+                        componentType=UNSIGNED_INT,
+                        count=tris.size,
+                        type=SCALAR,
+                        max=[int(tris.max())],
+                        min=[int(tris.min())],
+                    )
+                )
+                accessors.append(
+                    Accessor(
+                        bufferView=1,
+                        byteOffset=vertsOffset,
+                        componentType=FLOAT,
+                        count=len(verts),
+                        type=VEC3,
+                        max=verts.max(axis=0).tolist(),
+                        min=verts.min(axis=0).tolist(),
+                    )
+                )
+                geometryAccessors[geometryHash] = (len(accessors) - 2, len(accessors) - 1)
 
-            pyg4_color = pyg4VisOpt.colour
-            pyg4_alpha = pyg4VisOpt.alpha
-            pyg4_rep = pyg4VisOpt.representation
+                trisArrays.append(tris)
+                vertsArrays.append(verts)
+                trisOffset += tris.nbytes
+                vertsOffset += verts.nbytes
 
             pbrMetallicRoughness = PbrMetallicRoughness(
                 baseColorFactor=[
@@ -458,127 +553,98 @@ class ViewerBase:
                 metallicFactor=_random.random(),
                 roughnessFactor=_random.random(),
             )
-            # alphaMode = "OPAQUE"
-
-            # if pyg4_rep == "wireframe" :
-            #    alphaMode = "BLEND"
-            #    alphaCutoff = pyg4_alpha
-
             materials.append(Material(pbrMetallicRoughness=pbrMetallicRoughness))
 
-            buffers.append(
-                Buffer(
-                    uri="data:application/octet-stream;base64,"
-                    + str(_base64.b64encode(tris_binary_blob + verts_binary_blob).decode("utf-8")),
-                    byteLength=len(tris_binary_blob) + len(verts_binary_blob),
-                )
-            )
-
-            bufferViews.append(
-                BufferView(
-                    buffer=iBuffer,
-                    byteLength=len(tris_binary_blob),
-                    target=ELEMENT_ARRAY_BUFFER,
-                )
-            )
-            bufferViews.append(
-                BufferView(
-                    buffer=iBuffer,
-                    byteOffset=len(tris_binary_blob),
-                    byteLength=len(verts_binary_blob),
-                    target=ARRAY_BUFFER,
-                )
-            )
-            accessors.append(
-                Accessor(
-                    bufferView=2 * iBuffer,
-                    componentType=UNSIGNED_INT,
-                    count=tris.size,
-                    type=SCALAR,
-                    max=[int(tris.max())],
-                    min=[int(tris.min())],
-                )
-            )
-            accessors.append(
-                Accessor(
-                    bufferView=2 * iBuffer + 1,
-                    componentType=FLOAT,
-                    count=int(verts.size / 3),
-                    type=VEC3,
-                    max=verts.max(axis=0).tolist(),
-                    min=verts.min(axis=0).tolist(),
-                )
-            )
+            iIndices, iPositions = geometryAccessors[geometryHash]
             meshes.append(
                 Mesh(
                     primitives=[
                         Primitive(
-                            attributes=Attributes(POSITION=2 * iBuffer + 1),
-                            indices=2 * iBuffer,
-                            material=iBuffer,
+                            attributes=Attributes(POSITION=iPositions),
+                            indices=iIndices,
+                            material=len(materials) - 1,
                         )
                     ]
                 )
             )
-
-            iBuffer += 1
+            key_iMesh[k] = len(meshes) - 1
 
         # loop over instances
-        iMesh = 0
         for k in self.instancePlacements:
-            iInstance = 0
-            for p in self.instancePlacements[k]:
-                t = p["translation"]
-                r = p["transformation"]
-                aa = _transformation.matrix2axisangle(r)
-                axis = aa[0]
-                angle = aa[1]
-
-                nodes.append(
-                    Node(
-                        name=k + "_" + str(iInstance),
-                        mesh=iMesh,
-                        translation=[float(t[0]), float(t[1]), float(t[2])],
-                        rotation=[
-                            axis[0] * _np.sin(angle / 2),
-                            axis[1] * _np.sin(angle / 2),
-                            axis[2] * _np.sin(angle / 2),
-                            _np.cos(angle / 2),
-                        ],
-                    )
-                )
+            if k not in key_iMesh:
+                continue
 
+            placements = self.instancePlacements[k]
+            if singleInstance:
                 # Only make a single instance
-                if singleInstance:
-                    break
-
-                iInstance += 1
-
-            iMesh += 1
-
-        scene = Scene(nodes=list(range(0, len(nodes), 1)))
-        scenes.append(scene)
+                placements = placements[:1]
+
+            rotations = _np.array([p["transformation"] for p in placements], dtype=float)
+            rotations = rotations.reshape(-1, 3, 3)
+            translations = _np.array([p["translation"] for p in placements], dtype=float)
+            translations = translations.reshape(-1, 3).tolist()
+
+            # quaternions for rotations, full matrices for reflections and scaling
+            proper = _np.all(
+                _np.abs(rotations @ rotations.transpose(0, 2, 1) - _np.identity(3)) < 1e-9,
+                axis=(1, 2),
+            ) & (_np.linalg.det(rotations) > 0)
+            quaternions = _np.round(_matricesToQuaternions(rotations), 9).tolist()
+
+            # nodes as plain json, as (de)serialising pygltflib nodes is slow for large scenes
+            for iInstance in range(len(placements)):
+                node = {"name": k + "_" + str(iInstance), "mesh": key_iMesh[k]}
+                if proper[iInstance]:
+                    node["translation"] = translations[iInstance]
+                    node["rotation"] = quaternions[iInstance]
+                else:
+                    matrix = _np.identity(4)
+                    matrix[:3, :3] = rotations[iInstance]
+                    matrix[:3, 3] = translations[iInstance]
+                    node["matrix"] = matrix.T.ravel().tolist()  # column major
+                nodes.append(node)
+
+        # single buffer of all indices followed by all vertices
+        blob = b"".join([a.tobytes() for a in trisArrays + vertsArrays])
+        bufferViews = [
+            BufferView(buffer=0, byteLength=trisOffset, target=ELEMENT_ARRAY_BUFFER),
+            BufferView(
+                buffer=0,
+                byteOffset=trisOffset,
+                byteLength=vertsOffset,
+                target=ARRAY_BUFFER,
+            ),
+        ]
+
+        if binary:
+            buffers = [Buffer(byteLength=len(blob))]
+        else:
+            buffers = [
+                Buffer(
+                    uri="data:application/octet-stream;base64,"
+                    + _base64.b64encode(blob).decode("utf-8"),
+                    byteLength=len(blob),
+                )
+            ]
 
         gltf = GLTF2(
             scene=0,
-            scenes=scenes,
-            nodes=nodes,
+            scenes=[Scene(nodes=list(range(0, len(nodes), 1)))],
             meshes=meshes,
             accessors=accessors,
             bufferViews=bufferViews,
             buffers=buffers,
             materials=materials,
         )
+        gltf = _json.loads(gltf.gltf_to_json())
+        gltf["nodes"] = nodes
 
-        if gltfFileName.find("gltf") != -1:
-            gltf.save_json(gltfFileName)
-        elif gltfFileName.find("glb") != -1:
-            glb = b"".join(gltf.save_to_bytes())
-            f = open(gltfFileName, "wb")
-            f.write(glb)
-            f.close()
+        if binary:
+            with open(gltfFileName, "wb") as f:
+                f.write(_glbBytes(_json.dumps(gltf, separators=(",", ":")), blob))
         else:
-            print("ViewerBase::exportGLTFScene> unknown gltf extension")
+            with open(gltfFileName, "w") as f:
+                _json.dump(gltf, f, indent=2)
 
     def exportGLTFAssets(self, gltfFileName="test.gltf"):
         """Export all the assets (meshes) without all the instances. The position of the asset is
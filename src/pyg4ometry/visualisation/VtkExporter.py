@@ -201,18 +201,29 @@ class VtkExporter:
 
     def add_logical_volume_recursive(self, lv, rotation, translation, color_dico, first_level=True):
         """
-        Method that receives a logical volume and add calls addMesh() on its mesh.
-        The method is recursive and will be called on all the daughter logical volumes of the logical volume.
+        Method that receives a logical volume and calls addMesh() on the mesh of every volume
+        placed in it (at any depth), using the transforms of its PlacementTree.
 
         :param lv: Logical volume
         :param rotation: numpy.matrix
         :param ranslation: numpy.array
         :param color_dico: A dictionary with the keys R, G and B whose item is a dictionary
         with as keys the logical volumes names and as item the respective RGB value
-        :param first_level: Boolean indicating if we are at the first level of recursivity
+        :param first_level: Boolean indicating if each daughter of lv starts a new element
         """
-        for pv in lv.daughterVolumes:
-            if first_level:
+        tree = lv.placementTree()
+
+        # global transforms of all placements in the frame given by rotation and translation
+        rotation = _np.asarray(rotation)
+        rotations = rotation @ tree.rotations
+        translations = tree.translations @ rotation.T + _np.asarray(translation).flatten()
+
+        for i in range(1, len(tree)):
+            pv = tree.physicalVolumes[i]
+            if pv.type != "placement":
+                continue
+
+            if first_level and tree.depth[i] == 1:
                 self.element_name = self.getElementName(pv.logicalVolume.name)
 
                 if self.element_name not in self.mbdico.keys():
@@ -224,16 +235,6 @@ class VtkExporter:
 
             solid_name = pv.logicalVolume.solid.name
 
-            pvmrot = _np.linalg.inv(_transformation.tbxyz2matrix(pv.rotation.eval()))
-            if pv.scale:
-                pvmsca = _np.diag(pv.scale.eval())
-            else:
-                pvmsca = _np.diag([1, 1, 1])
-            pvtra = _np.array(pv.position.eval())
-
-            new_mtra = rotation * pvmsca * pvmrot
-            new_tra = (_np.array(rotation.dot(pvtra)) + translation)[0]
-
             mesh = pv.logicalVolume.mesh.localmesh
 
             if self.materialVisualisationOptions:
@@ -248,11 +249,7 @@ class VtkExporter:
                 colour[2] = color_dico["B"][pv.logicalVolume.name]
                 visOptions.colour = tuple(colour)
 
-            self.addMesh(solid_name, mesh, new_mtra, new_tra, visOptions=visOptions)
-
-            self.add_logical_volume_recursive(
-                pv.logicalVolume, new_mtra, new_tra, color_dico, False
-            )
+            self.addMesh(solid_name, mesh, rotations[i], translations[i], visOptions=visOptions)
 
     def addMesh(self, solid_name, mesh, rotation, translation, visOptions=None):
         """
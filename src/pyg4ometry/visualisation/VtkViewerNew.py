@@ -1,4 +1,6 @@
+import numpy as _np
 import vtk as _vtk
+from vtk.util.numpy_support import numpy_to_vtk as _numpy_to_vtk
 
 import pyg4ometry.transformation as _transformation
 import pyg4ometry.visualisation.ViewerBase as _ViewerBase
@@ -8,6 +10,50 @@ from .VisualisationOptions import (
     getPredefinedMaterialVisOptions as _getPredefinedMaterialVisOptions,
 )
 from pyg4ometry.pycgal.Polygon_mesh_processing import isotropic_remeshing as _isotropic_remeshing
+from .ViewerBase import _matricesToQuaternions
+
+
+def _placementsToVtkPolyData(rotations, translations):
+    """
+    Instance points for a vtkGlyph3DMapper. Each 3x3 transformation is split into a
+    rotation (quaternion w, x, y, z in the "orientation" array) and per axis scale
+    factors (in the "scale" array), negative for a reflection.
+
+    :param rotations: instance transformations
+    :type rotations: array(N,3,3)
+    :param translations: instance translations
+    :type translations: array(N,3)
+    """
+    rotations = _np.asarray(rotations, dtype=float).reshape(-1, 3, 3)
+    translations = _np.asarray(translations, dtype=float).reshape(-1, 3)
+
+    scales = _np.linalg.norm(rotations, axis=1)
+    scales[:, 2] *= _np.where(_np.linalg.det(rotations) < 0, -1, 1)
+    quaternions = _matricesToQuaternions(rotations / scales[:, None, :])
+
+    points = _vtk.vtkPoints()
+    points.SetData(_numpy_to_vtk(translations, deep=True))
+
+    orientation = _numpy_to_vtk(_np.roll(quaternions, 1, axis=1), deep=True)
+    orientation.SetName("orientation")
+    scale = _numpy_to_vtk(scales, deep=True)
+    scale.SetName("scale")
+
+    instancesPolyData = _vtk.vtkPolyData()
+    instancesPolyData.SetPoints(points)
+    instancesPolyData.GetPointData().AddArray(orientation)
+    instancesPolyData.GetPointData().AddArray(scale)
+
+    return instancesPolyData
+
+
+def _expandedInstancesToVtkPolyData(verts, tris, rotations, translations):
+    """
+    Single polydata holding a transformed copy of a mesh for each instance.
+    """
+    verts = _np.einsum("nij,vj->nvi", rotations, verts) + translations[:, None, :]
+    tris = tris[None, :, :] + (len(verts[0]) * _np.arange(len(verts)))[:, None, None]
+    return _Convert.verticesAndFacesToVtkPolyData(verts.reshape(-1, 3), tris.reshape(-1, 3))
 
 
 class VtkViewerNew(_ViewerBase):
@@ -57,6 +103,9 @@ class VtkViewerNew(_ViewerBase):
 
         self.pdNameDict = {}  # polydata to LV name
         self.instanceNameDict = {}  # instance transformation to PV name
+        self.instancedActorDict = {}  # glyph actor to LV name and instance placements
+        self.clipperPlanes = []  # mapper clipping planes
+        self.clipperCloseCutters = []  # cut filters closing clipped instances
 
         self.bBuiltPipelines = False
 
@@ -144,11 +193,24 @@ class VtkViewerNew(_ViewerBase):
             self.addCutter("clipperCutter", origin, normal)
 
     def setClipper(self, origin, normal):
+        self.clipperOrigin = origin
+        self.clipperNormal = normal
+
         for c in self.clippers:
             p = c.GetClipFunction()
             p.SetOrigin(*origin)
             p.SetNormal(*normal)
 
+        # mapper clipping planes keep the side the normal points to, as the clip filters do
+        for p in self.clipperPlanes:
+            p.SetOrigin(*origin)
+            p.SetNormal(*normal)
+
+        for c in self.clipperCloseCutters:
+            p = c.GetCutFunction()
+            p.SetOrigin(*origin)
+            p.SetNormal(*normal)
+
         if self.bClipperCutter:
             self.setCutter("clipperCutter", origin, normal)
 
@@ -163,7 +225,7 @@ class VtkViewerNew(_ViewerBase):
             )
             return
 
-        if len(self.clippers) == 0:
+        if len(self.clippers) == 0 and len(self.clipperPlanes) == 0:
             print(
                 "Need to add a clipping plane adding clipper widget e.g. v.addClipper([0, 0, 0], [0, 0, 1], True"
             )
@@ -172,8 +234,8 @@ class VtkViewerNew(_ViewerBase):
         plaRep = _vtk.vtkImplicitPlaneRepresentation()
         # plaRep.SetPlaceFactor(1.25)
         plaRep.PlaceWidget(next(iter(self.actors.values())).GetBounds())
-        plaRep.SetNormal(self.clippers[0].GetClipFunction().GetNormal())
-        plaRep.SetOrigin(self.clippers[0].GetClipFunction().GetOrigin())
+        plaRep.SetNormal(*self.clipperNormal)
+        plaRep.SetOrigin(*self.clipperOrigin)
 
         self.clipperPlaneWidget = _vtk.vtkImplicitPlaneWidget2()
         self.clipperPlaneWidget.SetInteractor(self.iren)
@@ -386,6 +448,195 @@ class VtkViewerNew(_ViewerBase):
 
         self.bBuiltPipelines = True
 
+    def buildPipelinesInstanced(self):
+        """
+        Build pipelines keeping one polydata per mesh. All instances of a mesh with
+        the same visualisation options are drawn by a single vtkGlyph3DMapper from
+        their placements, rather than appending a transformed copy of the mesh per
+        instance as buildPipelinesAppend does. Clipping is done by the mappers. Cutters
+        and closing the clipped volumes need the placed geometry, so only when those
+        are requested are the instances expanded into a polydata for the cut filters.
+        """
+        bCut = len(self.cutterOrigins) != 0 or (
+            self.clipperNormal is not None and self.bClipperCloseCuts
+        )
+
+        # loop over meshes and create polydata
+        meshArrays = {}
+        for k in self.localmeshes:
+            verts, tris = self.localmeshes[k].toVerticesAndFaces()
+            self.polydata[k] = _Convert.verticesAndFacesToVtkPolyData(verts, tris)
+            if bCut:
+                meshArrays[k] = (verts, tris)
+
+        if self.clipperNormal is not None:
+            self.ren.GetActiveCamera().SetFocalPoint(0, 0, 0)
+
+        # loop over polydata and create an actor per set of vis options
+        for k in self.instancePlacements:
+            vos = self.instanceVisOptions[k]  # (v)isualisation (o)ption(s)
+            ips = self.instancePlacements[k]  # (i)nstance (p)placement(s)
+            pd = self.polydata[k]
+
+            groups = {}
+            for i in range(len(ips)):
+                groups.setdefault(str(vos[i]), []).append(i)
+
+            for iGroup, vok in enumerate(groups):
+                indices = groups[vok]
+                visOpt = vos[indices[0]]
+                name = k + "_" + str(iGroup)
+
+                rotations = _np.array(
+                    [ips[i]["transformation"] for i in indices], dtype=float
+                ).reshape(-1, 3, 3)
+                translations = _np.array(
+                    [ips[i]["translation"] for i in indices], dtype=float
+                ).reshape(-1, 3)
+
+                glyMap = _vtk.vtkGlyph3DMapper()  # (gly)ph (Map)per
+                glyMap.SetSourceData(pd)
+                glyMap.SetInputData(_placementsToVtkPolyData(rotations, translations))
+                glyMap.SetOrientationArray("orientation")
+                glyMap.SetOrientationModeToQuaternion()
+                glyMap.SetScaleArray("scale")
+                glyMap.SetScaleModeToScaleByVectorComponents()
+                glyMap.ScalingOn()
+                glyMap.ScalarVisibilityOff()
+                glyMap.SetResolveCoincidentTopologyToPolygonOffset()
+                glyMap.SetRelativeCoincidentTopologyPolygonOffsetParameters(0, 3 * visOpt.depth)
+
+                actor = _vtk.vtkActor()  # vtk(Actor)
+                actor.SetMapper(glyMap)
+                self.actors[name] = actor
+                self.instancedActorDict[actor] = (
+                    k,
+                    rotations,
+                    translations,
+                    [ips[i]["name"] for i in indices],
+                )
+
+                if visOpt.representation == "wireframe":
+                    actor.GetProperty().SetRepresentationToWireframe()
+
+                actor.GetProperty().SetOpacity(visOpt.alpha)
+                actor.GetProperty().SetColor(*visOpt.colour)
+
+                self.ren.AddActor(actor)
+
+                if bCut:
+                    placedPolyData = _expandedInstancesToVtkPolyData(
+                        *meshArrays[k], rotations, translations
+                    )
+
+                # Add cutters
+                for ck in self.cutterOrigins:
+                    plane = _vtk.vtkPlane()
+                    plane.SetOrigin(*self.cutterOrigins[ck])
+                    plane.SetNormal(*self.cutterNormals[ck])
+
+                    cutFilt = _vtk.vtkCutter()
+                    cutFilt.SetCutFunction(plane)
+                    cutFilt.SetInputData(placedPolyData)
+
+                    self.cutters.setdefault(ck, []).append(cutFilt)
+
+                    cutMap = _vtk.vtkPolyDataMapper()
+                    cutMap.ScalarVisibilityOff()
+                    cutMap.SetInputConnection(cutFilt.GetOutputPort())
+
+                    cutActor = _vtk.vtkActor()  # vtk(Actor)
+                    cutActor.SetMapper(cutMap)
+                    cutActor.GetProperty().SetLineWidth(4)
+                    cutActor.GetProperty().SetColor(*[1, 0, 0])
+                    cutActor.GetProperty().SetRepresentationToSurface()
+                    self.actors[name + "_" + ck] = cutActor
+                    self.ren.AddActor(cutActor)
+
+                # Add clipper
+                if self.clipperNormal is None:
+                    continue
+
+                plane = _vtk.vtkPlane()
+                plane.SetOrigin(*self.clipperOrigin)
+                plane.SetNormal(*self.clipperNormal)
+                glyMap.AddClippingPlane(plane)
+                self.clipperPlanes.append(plane)
+
+                if not self.bClipperCloseCuts:
+                    continue
+
+                # close the clipped instances with the loops cut by the clipping plane
+                plane = _vtk.vtkPlane()
+                plane.SetOrigin(*self.clipperOrigin)
+                plane.SetNormal(*self.clipperNormal)
+
+                cutFilt = _vtk.vtkCutter()
+                cutFilt.SetCutFunction(plane)
+                cutFilt.SetInputData(placedPolyData)
+                self.clipperCloseCutters.append(cutFilt)
+
+                cleFlt = _vtk.vtkContourLoopExtraction()
+                cleFlt.SetInputConnection(cutFilt.GetOutputPort())
+
+                strFlt = _vtk.vtkStripper()
+                strFlt.SetInputConnection(cleFlt.GetOutputPort())
+
+                edgMap = _vtk.vtkPolyDataMapper()
+                edgMap.SetInputConnection(strFlt.GetOutputPort())
+                edgMap.SetResolveCoincidentTopologyToPolygonOffset()
+                edgMap.SetRelativeCoincidentTopologyPolygonOffsetParameters(0, -3 * visOpt.depth)
+                edgMap.ScalarVisibilityOff()
+                edgActor = _vtk.vtkActor()
+                edgActor.SetMapper(edgMap)
+
+                if visOpt.representation == "wireframe":
+                    edgActor.GetProperty().SetRepresentationToWireframe()
+
+                edgActor.GetProperty().SetOpacity(visOpt.alpha)
+                edgActor.GetProperty().SetColor(*visOpt.colour)
+
+                self.actors[name + "_clipper"] = edgActor
+                self.ren.AddActor(edgActor)
+
+        self.bBuiltPipelines = True
+
+    def pickInstance(self, actor, point):
+        """
+        Find the instance of an actor built by buildPipelinesInstanced at a point.
+
+        :param actor: glyph mapped actor
+        :type actor: vtkActor
+        :param point: picked position in the global frame
+        :type point: list(3)
+        :returns: [lv name, instance index, pv name, rotation, translation] or None
+        """
+        if actor not in self.instancedActorDict:
+            return None
+
+        k, rotations, translations, names = self.instancedActorDict[actor]
+        pd = self.polydata[k]
+
+        # point in the frame of each instance, compared with the mesh extent first
+        local = _np.einsum(
+            "nij,nj->ni", _np.linalg.inv(rotations), _np.asarray(point) - translations
+        )
+        bounds = _np.array(pd.GetBounds()).reshape(3, 2)
+        tolerance = 1e-3 * max(bounds[:, 1] - bounds[:, 0]) + 1e-6
+        inside = _np.all(
+            (local >= bounds[:, 0] - tolerance) & (local <= bounds[:, 1] + tolerance), axis=1
+        )
+        candidates = _np.flatnonzero(inside)
+        if len(candidates) == 0:
+            return None
+
+        pdd = _vtk.vtkImplicitPolyDataDistance()
+        pdd.SetInput(pd)
+        distances = [abs(pdd.EvaluateFunction(*local[i])) for i in candidates]
+        i = candidates[int(_np.argmin(distances))]
+
+        return [k, i, names[i], rotations[i], translations[i]]
+
     def buildPipelinesTransformed(self):
         pass
 
@@ -521,6 +772,11 @@ class MouseInteractorNamePhysicalVolume(_vtk.vtkInteractorStyleTrackballCamera):
         picker.Pick(clickPos[0], clickPos[1], 0, self.ren)
         actor = picker.GetActor()
 
+        # instances drawn by a glyph mapper have no polydata of their own to pick in
+        if actor is not None and actor in self.vtkviewer.instancedActorDict:
+            self.rightButtonPressInstanced(actor, picker.GetPickPosition())
+            return
+
         pointPicker = _vtk.vtkPointPicker()
         pointPicker.Pick(clickPos[0], clickPos[1], 0, self.ren)
         print("pointId>", pointPicker.GetPointId())
@@ -596,6 +852,52 @@ class MouseInteractorNamePhysicalVolume(_vtk.vtkInteractorStyleTrackballCamera):
 
         self.ren.AddActor(self.highLightActor)
 
+        self.setHighLightText(lvName, pvName, tba, tra, localExtent, globalExtent)
+
+        # update rendering
+        self.ren.GetRenderWindow().Render()
+
+    def rightButtonPressInstanced(self, actor, point):
+        picked = self.vtkviewer.pickInstance(actor, point)
+        if picked is None:
+            return
+
+        [lvName, i, pvName, mtra, tra] = picked
+        pd = self.vtkviewer.polydata[lvName]
+
+        traFlt = _vtk.vtkTransformPolyDataFilter()  # (tra)nsform (F)i(lt)er
+        vtra = _vtk.vtkGeneralTransform()
+        vtra.Concatenate(_Convert.pyg42VtkTransformation(mtra, tra))
+        traFlt.SetInputData(pd)
+        traFlt.SetTransform(vtra)
+        traFlt.Update()
+
+        globalExtent = traFlt.GetOutput().GetBounds()
+        localExtent = pd.GetBounds()
+
+        tba = _transformation.matrix2tbxyz(mtra)
+
+        print("instance>", i, lvName, pvName, tba, tra, localExtent, globalExtent)
+
+        if self.highLightActor:
+            self.ren.RemoveActor(self.highLightActor)
+
+        highLightMapper = _vtk.vtkPolyDataMapper()
+        highLightMapper.SetInputConnection(traFlt.GetOutputPort())
+
+        self.highLightActor = _vtk.vtkActor()
+        self.highLightActor.SetMapper(highLightMapper)
+        self.highLightActor.GetProperty().SetColor(0, 1, 0)
+        self.highLightActor.GetProperty().SetOpacity(0.5)
+
+        self.ren.AddActor(self.highLightActor)
+
+        self.setHighLightText(lvName, pvName, tba, tra, localExtent, globalExtent)
+
+        # update rendering
+        self.ren.GetRenderWindow().Render()
+
+    def setHighLightText(self, lvName, pvName, tba, tra, localExtent, globalExtent):
         if self.highLightTextActor:
             self.ren.RemoveActor(self.highLightTextActor)
 
@@ -623,6 +925,3 @@ class MouseInteractorNamePhysicalVolume(_vtk.vtkInteractorStyleTrackballCamera):
         )
         self.highLightTextActor.SetDisplayPosition(20, 30)
         self.ren.AddActor(self.highLightTextActor)
-
-        # update rendering
-        self.ren.GetRenderWindow().Render()
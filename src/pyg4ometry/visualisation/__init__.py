@@ -2,6 +2,7 @@ from .Mesh import Mesh
 from .Mesh import OverlapType
 from .Mesh import _getBoundingBox
 from .Mesh import _getBoundingBoxMesh
+from .Mesh import _meshFromVerticesAndPolygons
 from .ViewerBase import ViewerBase
 from .VisualisationOptions import *
 from .VtkViewer import *
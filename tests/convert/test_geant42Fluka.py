@@ -1,5 +1,11 @@
+import numpy as _np
 import pytest
 
+import pyg4ometry.geant4 as _g4
+import pyg4ometry.fluka as _fluka
+import pyg4ometry.transformation as _transformation
+from pyg4ometry.convert.geant42Fluka import SolidRegionCache, geant4Solid2FlukaRegion
+
 from . import T001_geant4Box2Fluka
 from . import T002_geant4Tubs2Fluka
 from . import T003_geant4CutTubs2Fluka
@@ -362,3 +368,53 @@ def test_Geant42FlukaConversion_T201_extrudedSubtraction(tmptestdir, testdata):
         outputPath=tmptestdir,
         refFilePath=testdata["convert/T201_extrudedSubtraction.inp"],
     )
+
+
+@pytest.mark.parametrize("solidType", ["Subtraction", "ExtrudedSolid", "Cons"])
+def test_Geant42FlukaConversion_SolidRegionCache(solidType):
+    reg = _g4.Registry()
+    if solidType == "Subtraction":
+        box = _g4.solid.Box("box", 10, 20, 30, reg, "mm")
+        tubs = _g4.solid.Tubs("tubs", 0, 5, 40, 0, 2 * _np.pi, reg, "mm", "rad")
+        solid = _g4.solid.Subtraction("sub", box, tubs, [[0.1, 0, 0], [1, 2, 3]], reg)
+    elif solidType == "Cons":
+        solid = _g4.solid.Cons("cons", 1, 5, 2, 8, 40, 0.1, 1.5 * _np.pi, reg, "mm", "rad")
+    else:
+        polygon = [[-20, -10], [-20, 10], [0, 20], [20, 10], [20, -10], [0, 5]]
+        slices = [[-20, [0, 0], 1], [20, [0, 0], 1]]
+        solid = _g4.solid.ExtrudedSolid("xs", polygon, slices, reg)
+
+    # including a reflected placement (a scale of -1) and a half turn, which change
+    # the reflection signs used by the ExtrudedSolid conversion, rotations, which
+    # change the Cons axis, and a repeated placement, whose equal bodies are shared
+    mtra = _transformation.tbxyz2matrix([0.1, 0.2, 0.3])
+    placements = [
+        (_np.identity(3), _np.array([0, 0, 0])),
+        (mtra, _np.array([10, 20, 30])),
+        (mtra.T, _np.array([-5, 0, 0])),
+        (mtra @ _np.diag([-1, 1, 1]), _np.array([0, 5, 0])),
+        (_transformation.tbxyz2matrix([0, 0, _np.pi]), _np.array([0, 0, 5])),
+        (mtra, _np.array([10, 20, 30])),
+    ]
+
+    cache = SolidRegionCache()
+    fregCached = _fluka.FlukaRegistry()
+    fregDirect = _fluka.FlukaRegistry()
+    nCached = nDirect = 0
+    for m, t in placements:
+        rCached, nCached = cache.region(nCached, solid, m, t, fregCached, commentName="pv")
+        rDirect, nDirect = geant4Solid2FlukaRegion(
+            nDirect, solid, m, t, fregDirect, commentName="pv"
+        )
+
+        assert nCached == nDirect
+        assert rCached.flukaFreeString() == rDirect.flukaFreeString()
+
+    def bodies(freg):
+        return [(b.flukaFreeString(), b.comment, b.transform.name) for b in freg.bodyDict.values()]
+
+    assert bodies(fregCached) == bodies(fregDirect)
+    assert (
+        fregCached.rotoTranslations.flukaFreeString()
+        == fregDirect.rotoTranslations.flukaFreeString()
+    )
@@ -3,7 +3,10 @@ import numpy as np
 import pytest
 
 import pyg4ometry.visualisation.VtkViewerNew as _VtkViewerNew
-from pyg4ometry.fluka.fluka_registry import RotoTranslationStore, FlukaRegistry
+from pyg4ometry.fluka.fluka_registry import RotoTranslationStore, FlukaRegistry, FlukaBodyStore
+from pyg4ometry.fluka import body as _body
+from pyg4ometry.fluka import Region, Zone
+import pyg4ometry.convert as _convert
 from pyg4ometry.fluka.directive import rotoTranslationFromTra2
 
 import T001_RPP
@@ -1410,6 +1413,121 @@ def test_addRotoTranslation():
     #    store.addRotoTranslation(rtrans5)
 
 
+def test_FlukaBodyStore_degenerateBodies():
+    store = FlukaBodyStore()
+
+    p1 = store.make(_body.XYP, "P1", 10.0)
+    p2 = store.make(_body.XYP, "P2", 10.0 * (1 + 1e-9))
+    p3 = store.make(_body.XYP, "P3", 10.1)
+    assert p2 is p1
+    assert p3 is not p1
+
+    c1 = store.make(_body.ZCC, "C1", 1.0, 2.0, 5.0)
+    c2 = store.make(_body.ZCC, "C2", 1.0, 2.0, 5.0 + 1e-12)
+    c3 = store.make(_body.ZCC, "C3", 1.0, 2.0, 6.0)
+    assert c2 is c1
+    assert c3 is not c1
+
+    r1 = store.make(_body.RPP, "R1", -1, 1, -1, 1, -1, 1)
+    assert store.getDegenerateBody(_body.RPP("R2", -1, 1, -1, 1, -1, 1)).name == "R2"
+
+    assert set(store) == {"P1", "P3", "C1", "C3", "R1", "R2"}
+    assert store["C1"] is c1
+    assert store["R1"] is r1
+    assert "P2" not in store
+
+    del store["P1"]
+    assert "P1" not in store
+    assert store.getDegenerateBody(_body.XYP("P4", 10.0)).name == "P4"
+    with pytest.raises(KeyError):
+        del store["P1"]
+
+
+def test_fluka2Geant4_parallel():
+    def flukaRegistry():
+        freg = FlukaRegistry()
+        rpp1 = _body.RPP("RPP1", 0, 10, 0, 10, 0, 10, flukaregistry=freg)
+        rpp2 = _body.RPP("RPP2", 2, 4, 2, 4, -1, 11, flukaregistry=freg)
+        rpp3 = _body.RPP("RPP3", 20, 30, 0, 10, 0, 10, flukaregistry=freg)
+        rpp4 = _body.RPP("RPP4", -50, 50, -50, 50, -50, 50, flukaregistry=freg)
+
+        z1 = Zone()
+        z1.addIntersection(rpp1)
+        z1.addSubtraction(rpp2)
+        z2 = Zone()
+        z2.addIntersection(rpp2)
+        z3 = Zone()
+        z3.addIntersection(rpp3)
+        z4 = Zone()
+        z4.addIntersection(rpp4)
+        for body in [rpp1, rpp2, rpp3]:
+            z4.addSubtraction(body)
+
+        for name, zones in [("REG1", [z1]), ("REG2", [z2, z3]), ("REG3", [z4])]:
+            region = Region(name)
+            for zone in zones:
+                region.addZone(zone)
+            freg.addRegion(region)
+            freg.assignma("COPPER", region)
+        return freg
+
+    serial = _convert.fluka2Geant4(flukaRegistry())
+    parallel = _convert.fluka2Geant4(flukaRegistry(), parallel=2)
+
+    # RPP2 is shared by the three regions but only made once (boolean names are random)
+    def solids(reg):
+        return [(type(s).__name__, len(s.dependents)) for s in reg.solidDict.values()]
+
+    assert solids(parallel) == solids(serial)
+    assert [n for n in parallel.solidDict if n.startswith("RPP")] == [
+        "RPP1",
+        "RPP2",
+        "RPP3",
+        "RPP4",
+    ]
+    assert list(parallel.logicalVolumeDict) == list(serial.logicalVolumeDict)
+    for solid in parallel.solidDict.values():
+        assert solid.registry is parallel
+        for dependent in solid.dependents:
+            assert dependent is parallel.solidDict[dependent.name]
+
+    for name, lv in parallel.logicalVolumeDict.items():
+        serialMesh = serial.logicalVolumeDict[name].mesh.localmesh
+        assert lv.mesh.localmesh.getNumberPolys() == serialMesh.getNumberPolys()
+
+
+def test_Region_connectedZones():
+    freg = FlukaRegistry()
+    region = Region("REG")
+    for i, x in enumerate([0, 5, 20, 8, 40]):
+        zone = Zone()
+        zone.addIntersection(_body.RPP(f"RPP{i}", x, x + 6, 0, 6, 0, 6, flukaregistry=freg))
+        region.addZone(zone)
+
+    # 0-1-3 overlap in a chain, 2 and 4 are on their own
+    connected = sorted(sorted(c) for c in region.connectedZones())
+    assert connected == [[0, 1, 3], [2], [4]]
+
+    single = Region("SINGLE")
+    single.addZone(region.zones[0])
+    assert single.connectedZones() == [{0}]
+
+
+def test_Region_connectedZonesNested():
+    freg = FlukaRegistry()
+    region = Region("REG")
+    for i, (lower, upper) in enumerate([(0, 10), (3, 6), (20, 30), (22, 28)]):
+        zone = Zone()
+        zone.addIntersection(
+            _body.RPP(f"RPP{i}", lower, upper, lower, upper, lower, upper, flukaregistry=freg)
+        )
+        region.addZone(zone)
+
+    # zones nested inside another have no intersecting surfaces but are connected
+    connected = sorted(sorted(c) for c in region.connectedZones())
+    assert connected == [[0, 1], [2, 3]]
+
+
 def test_fluka_vis(tmptestdir, testdata):
     r = T902_cube_from_six_PLAs.Test(
         False,
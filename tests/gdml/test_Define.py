@@ -632,3 +632,78 @@ def test_GdmlDefine_MatrixGetItemInRegistry():
     mat = pyg4ometry.gdml.Matrix("mat", 2, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10], r, True)
     v = mat[0, 0]
     assert v.expression.expressionString == "mat[1,1]"
+
+
+def test_GdmlDefine_ExpressionParserCache():
+    r = pyg4ometry.geant4.Registry()
+    c = pyg4ometry.gdml.Constant("c", "10", r)
+    e = pyg4ometry.gdml.Expression("e", "2*c+sin(0)", r)
+    assert e.eval() == 20
+
+    parser = r.getExpressionParser()
+    assert parser.compiledCache["2*c+sin(0)"] is not None
+    assert parser.parse("2*c+sin(0)") is parser.parse("2*c+sin(0)")
+
+    # cached expressions still see changed defines
+    c.setExpression("5")
+    assert e.eval() == 10
+
+    # same result as the parse tree visitor
+    tree = parser.parse("2*c+sin(0)")
+    assert parser.evaluate(tree, r.defineDict) == parser.evaluateExpression(
+        "2*c+sin(0)", r.defineDict
+    )
+
+    # plain numbers are converted without caching
+    assert parser.evaluateExpression("1.5e3") == 1500
+    assert parser.variables(" -2 ") == []
+    assert "1.5e3" not in parser.compiledCache
+    assert " -2 " not in parser.variablesCache
+
+
+def test_GdmlDefine_DefineCache():
+    r = pyg4ometry.geant4.Registry()
+    a = pyg4ometry.gdml.Constant("a", "2", r)
+    b = pyg4ometry.gdml.Constant("b", "3*a", r)
+    x = pyg4ometry.gdml.Constant("x", "1", r)
+    p = pyg4ometry.gdml.Position("p", "a", "b", "x", "cm", r)
+    q = pyg4ometry.gdml.Position("", 1, 2, "b", "mm", r, False)
+
+    assert p.eval() == [20, 60, 10]
+    assert q.eval() == [1, 2, 6]
+
+    nMisses = r.defineCache.nMisses
+    assert p.eval() == [20, 60, 10]
+    assert r.defineCache.nMisses == nMisses
+
+    # only downstream defines are re-evaluated
+    x.setExpression("2")
+    assert q.eval() == [1, 2, 6]
+    assert r.defineCache.nMisses == nMisses
+    assert p.eval() == [20, 60, 20]
+
+    a.setExpression("3")
+    assert b.eval() == 9
+    assert p.eval() == [30, 90, 20]
+    assert q.eval() == [1, 2, 9]
+
+    b.expression.expressionString = "a"
+    assert q.eval() == [1, 2, 3]
+
+    p.unit = "mm"
+    assert p.eval() == [3, 3, 2]
+
+
+def test_GdmlDefine_DefineCacheMatrix():
+    r = pyg4ometry.geant4.Registry()
+    m = pyg4ometry.gdml.Matrix("mt", 2, [1, 2, 3, 4], r)
+    c = pyg4ometry.gdml.Constant("c", "mt[1,2]*10", r)
+
+    assert c.eval() == 20
+
+    # changing an element drops the values of the defines using the matrix
+    m.values[1].setExpression("7")
+    assert c.eval() == 70
+
+    m.values[1].expression.expressionString = "8"
+    assert c.eval() == 80
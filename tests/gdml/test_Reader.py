@@ -2,6 +2,7 @@ import pyg4ometry
 
 import pytest
 import os as _os
+import gzip as _gzip
 import git as _git
 
 from subprocess import Popen as _Popen, PIPE as _PIPE
@@ -815,6 +816,97 @@ def test_GdmlLoad_Entity(testdata):
     # registry, writtenFilename = pyg4ometryLoadWriteTest(testdata["gdml/203_temp.gdml"])
 
 
+def test_GdmlLoad_StreamingEntity(tmptestdir):
+    with open(tmptestdir / "streaming_solids.xml", "w") as f:
+        f.write('<box name="b" x="10" y="10" z="10" lunit="mm"/>\n')
+
+    with open(tmptestdir / "streaming_entity.gdml", "w") as f:
+        f.write(f"""<?xml version="1.0" ?>
+<!DOCTYPE gdml [
+<!ENTITY solids SYSTEM "{tmptestdir / 'streaming_solids.xml'}">
+]>
+<gdml>
+  <define>
+    <!-- comment -->
+    <constant name="wx" value="100"/>
+    <expression name="ex">
+      2*wx
+    </expression>
+  </define>
+  <materials/>
+  <solids>
+    <box name="ws" x="ex" y="ex" z="ex" lunit="mm"/>
+    &solids;
+  </solids>
+  <structure>
+    <volume name="bl">
+      <materialref ref="G4_Fe"/>
+      <solidref ref="b"/>
+    </volume>
+    <volume name="wl">
+      <materialref ref="G4_AIR"/>
+      <solidref ref="ws"/>
+      <physvol name="bp">
+        <volumeref ref="bl"/>
+      </physvol>
+    </volume>
+  </structure>
+  <setup name="Default" version="1.0">
+    <world ref="wl"/>
+  </setup>
+</gdml>
+""")
+
+    registry = pyg4ometry.gdml.Reader(str(tmptestdir / "streaming_entity.gdml")).getRegistry()
+
+    assert registry.defineDict["ex"].eval() == 200
+    assert set(registry.solidDict) == {"ws", "b"}
+    assert registry.getWorldVolume().name == "wl"
+    assert registry.logicalVolumeDict["wl"].daughterVolumes[0].logicalVolume.name == "bl"
+
+
+def test_GdmlWrite_Streaming(tmptestdir):
+    reg = pyg4ometry.geant4.Registry()
+    wx = pyg4ometry.gdml.Constant("wx", "100", reg)
+    ws = pyg4ometry.geant4.solid.Box("ws", wx, wx, wx, reg)
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg)
+    tv = [
+        pyg4ometry.gdml.Position("", *v, "mm", reg, False)
+        for v in [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    ]
+    ts = pyg4ometry.geant4.solid.Tet("ts", *tv, reg)
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    tl = pyg4ometry.geant4.LogicalVolume(ts, "G4_Fe", "tl", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "bp", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [20, 0, 0], tl, "tp", wl, reg)
+    reg.setWorld(wl)
+
+    writer = pyg4ometry.gdml.Writer()
+    writer.addDetector(reg)
+    writer.write(str(tmptestdir / "streaming_written.gdml"))
+
+    # the temporary section files are closed once written
+    with pytest.raises(ValueError, match="cannot be written again"):
+        writer.write(str(tmptestdir / "streaming_written_again.gdml"))
+
+    writer = pyg4ometry.gdml.Writer()
+    writer.addDetector(reg)
+    writer.write(str(tmptestdir / "streaming_written.gdml.gz"))
+
+    with open(tmptestdir / "streaming_written.gdml") as f:
+        contents = f.read()
+    with _gzip.open(tmptestdir / "streaming_written.gdml.gz", "rt") as f:
+        assert f.read() == contents
+
+    # defines written by solids are in the define section
+    assert contents.index("ts_v1") < contents.index("<solids>")
+
+    registry = pyg4ometry.gdml.Reader(str(tmptestdir / "streaming_written.gdml")).getRegistry()
+    assert set(registry.solidDict) == {"ws", "bs", "ts"}
+    assert registry.getWorldVolume().name == "wl"
+
+
 def test_GdmlLoad_300_MalformedGdml(testdata):
     import xml.parsers.expat as _expat
 
@@ -203,6 +203,27 @@ def test_Python_FreeCadImportFail():
 # #############################
 # Mesh
 # #############################
+def test_Python_SweepAndPrune():
+    from pyg4ometry.meshutils import sweepAndPrune
+
+    aabbMin = _np.array([[0, 0, 0], [3, 3, 3], [1, 1, 1], [20, 0, 0], [2, 0, 10]])
+    aabbMax = aabbMin + 2
+    pairs = sweepAndPrune(aabbMin, aabbMax)
+
+    assert pairs.tolist() == [[0, 2], [1, 2]]
+    assert sweepAndPrune(aabbMin[:1], aabbMax[:1]).shape == (0, 2)
+
+
+def test_Python_PointsInsideMesh():
+    import pyg4ometry
+    from pyg4ometry.meshutils import pointsInsideMesh
+
+    reg = pyg4ometry.geant4.Registry()
+    box = pyg4ometry.geant4.solid.Box("box", 10, 10, 10, reg)
+    vertices, triangles = box.mesh().toVerticesAndFaces()
+    points = [[0, 0, 0], [4.9, -4.9, 4.9], [6, 0, 0], [0, 0, -20]]
+
+    assert pointsInsideMesh(points, vertices, triangles).tolist() == [True, True, False, False]
 
 
 # #############################
@@ -228,6 +249,376 @@ def test_Python_Remesh():
     l1.mesh.remesh()
 
 
+def _overlappingBoxes():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 100, 100, 100, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "b_pv1", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [5, 0, 0], bl, "b_pv2", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [30, 0, 0], bl, "b_pv3", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [48, 0, 0], bl, "b_pv4", wl, reg)
+    return wl
+
+
+def test_Python_CheckOverlapsParallel():
+    serial = [0]
+    _overlappingBoxes().checkOverlaps(recursive=True, nOverlapsDetected=serial)
+
+    parallel = [0]
+    wl = _overlappingBoxes()
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=parallel, parallel=2)
+
+    assert serial[0] == 2
+    assert parallel[0] == serial[0]
+    assert len(wl.mesh.overlapmeshes) == 2
+
+
+def test_Python_CheckOverlapsCache(tmptestdir):
+    import pyg4ometry
+
+    cacheFile = str(tmptestdir / "overlapCache.pickle")
+
+    cache = pyg4ometry.geant4.OverlapCache(cacheFile)
+    n = [0]
+    _overlappingBoxes().checkOverlaps(recursive=True, nOverlapsDetected=n, cache=cache)
+    assert n[0] == 2
+    assert cache.nHits == 0
+
+    # everything reused from file
+    cache = pyg4ometry.geant4.OverlapCache(cacheFile)
+    n = [0]
+    wl = _overlappingBoxes()
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=n, cache=cache)
+    assert n[0] == 2
+    assert cache.nMisses == 0
+
+    # move one placement from one overlap into another and check again, only the
+    # new pair is tested (a placement moved into empty space needs no test at all)
+    wl.daughterVolumes[1].position = pyg4ometry.gdml.Position(
+        "moved", 25, 0, 0, "mm", wl.registry, False
+    )
+    nHits = cache.nHits
+    n = [0]
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=n, cache=cache)
+    assert n[0] == 2
+    assert cache.nMisses == 1
+    assert cache.nHits > nHits
+
+    # volumes are rechecked against the cache without print out too
+    n = [0]
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=n, cache=cache, printOut=False)
+    assert n[0] == 2
+
+    # the least recently used results and mesh hashes are evicted
+    cache = pyg4ometry.geant4.OverlapCache(maxResults=2, maxMeshHashes=1)
+    n = [0]
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=n, cache=cache)
+    assert n[0] == 2
+    assert len(cache) == 2
+    assert len(cache._meshHashes) == 1
+
+
+def test_Python_MeshCache():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    b1 = pyg4ometry.geant4.solid.Box("b1", 10, 10, 10, reg, "mm")
+    b2 = pyg4ometry.geant4.solid.Box("b2", 10, 10, 10, reg, "mm")
+    us = pyg4ometry.geant4.solid.Union("us", b1, b2, [[0, 0, 0], [5, 0, 0]], reg)
+    ss = pyg4ometry.geant4.solid.Subtraction("ss", us, b1, [[0, 0, 0], [0, 5, 0]], reg)
+
+    volume = ss.mesh().volume()
+    assert reg.meshCache.nMisses == 2
+    assert ss.mesh().volume() == pytest.approx(volume)
+    assert reg.meshCache.nHits == 1
+
+    # editing an operand invalidates the solid and its dependents
+    b2.pX = 20
+    assert len(reg.meshCache) == 0
+    assert ss.mesh().volume() > volume
+
+    # least recently used meshes are evicted beyond the memory cap
+    reg.meshCache.maxMemory = reg.meshCache.meshSize(us.mesh())
+    ss.mesh()
+    assert len(reg.meshCache) == 1
+    assert reg.meshCache.memory <= reg.meshCache.maxMemory
+
+
+@pytest.mark.parametrize("parallel", [0, 2])
+def test_Python_LazyMeshing(monkeypatch, parallel):
+    import pyg4ometry
+
+    monkeypatch.setattr(pyg4ometry.config, "lazyMeshing", True)
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 100, 100, 100, reg, "mm")
+    b1 = pyg4ometry.geant4.solid.Box("b1", 10, 10, 10, reg, "mm")
+    b2 = pyg4ometry.geant4.solid.Box("b2", 10, 10, 10, reg, "mm")
+    us = pyg4ometry.geant4.solid.Union("us", b1, b2, [[0, 0, 0], [5, 0, 0]], reg)
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    l1 = pyg4ometry.geant4.LogicalVolume(us, "G4_Fe", "l1", reg)
+    l2 = pyg4ometry.geant4.LogicalVolume(us, "G4_Fe", "l2", reg)
+    l3 = pyg4ometry.geant4.LogicalVolume(b1, "G4_Fe", "l3", reg)
+
+    # nothing is meshed until used
+    assert not any(lv.isMeshed() for lv in [wl, l1, l2, l3])
+    assert l3.mesh.localmesh.volume() == pytest.approx(1000)
+    assert l3.isMeshed()
+
+    # the remaining volumes all at once, sharing the mesh of the shared solid
+    reg.prefetchMeshes(parallel=parallel)
+    assert all(lv.isMeshed() for lv in [wl, l1, l2])
+    assert l1.mesh.localmesh.volume() == pytest.approx(1500)
+    assert l2.mesh.localmesh.volume() == pytest.approx(1500)
+    assert l1.mesh.localmesh is not l2.mesh.localmesh
+
+    # a new solid is meshed on next use
+    l3.setSolid(b2)
+    assert not l3.isMeshed()
+    assert l3.mesh is not None
+
+
+def test_Python_ParameterisedSharedMeshes(monkeypatch):
+    import pyg4ometry
+
+    monkeypatch.setattr(pyg4ometry.config, "lazyMeshing", True)
+
+    reg = pyg4ometry.geant4.Registry()
+    bx = pyg4ometry.gdml.Constant("bx", "10", reg, True)
+    ws = pyg4ometry.geant4.solid.Box("ws", 1000, 1000, 1000, reg, "mm")
+    ms = pyg4ometry.geant4.solid.Box("ms", 500, 500, 500, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", bx, bx, bx, reg, "mm")
+    ts = pyg4ometry.geant4.solid.Tubs("ts", 0, 100, 100, 0, "2*pi", reg, "mm", "rad")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    ml = pyg4ometry.geant4.LogicalVolume(ms, "G4_Galactic", "ml", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    tl = pyg4ometry.geant4.LogicalVolume(ts, "G4_Fe", "tl", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], ml, "ml_pv", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 300], tl, "tl_pv", wl, reg)
+
+    # copies 0, 2 and 3 have the same dimensions written differently
+    dims = [
+        pyg4ometry.geant4.ParameterisedVolume.BoxDimensions(bx, bx, bx),
+        pyg4ometry.geant4.ParameterisedVolume.BoxDimensions(2 * bx, bx, bx),
+        pyg4ometry.geant4.ParameterisedVolume.BoxDimensions(10, 10, 10),
+        pyg4ometry.geant4.ParameterisedVolume.BoxDimensions("bx", "bx", "bx"),
+    ]
+    transforms = [[[0, 0, 0], [0, 0, 50 * i]] for i in range(4)]
+    pbv = pyg4ometry.geant4.ParameterisedVolume("pbv", bl, ml, 4, dims, transforms, reg)
+
+    assert len(pbv.meshes) == 4
+    assert pbv.meshes.uniqueCount() == 2
+    assert not any(pbv.meshes.isMeshed(i) for i in range(4))
+
+    # only the asked for copy (and copies sharing its dimensions) is meshed
+    m0 = pbv.meshes[0]
+    assert pbv.meshes.isMeshed(2)
+    assert pbv.meshes.isMeshed(3)
+    assert not pbv.meshes.isMeshed(1)
+    assert pbv.meshes[2] is m0
+    assert pbv.meshes[3] is m0
+    assert pbv.meshes[1].localmesh.volume() == pytest.approx(2000)
+    assert m0.localmesh.volume() == pytest.approx(1000)
+
+    # rho slices of a replica are meshed on use
+    rv = pyg4ometry.geant4.ReplicaVolume(
+        "rv", tl, wl, pyg4ometry.geant4.ReplicaVolume.Axis.kRho, 4, 25, 0, reg
+    )
+    assert len(rv.meshes) == 4
+    assert not rv.meshes.isMeshed(0)
+    assert rv.meshes[1].solid.pRMin == 25
+    assert not rv.meshes.isMeshed(2)
+
+
+def test_Python_PlacementTree():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 1000, 1000, 1000, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", 100, 50, 20, reg, "mm")
+    ss = pyg4ometry.geant4.solid.Box("ss", 10, 10, 10, reg, "mm")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    sl = pyg4ometry.geant4.LogicalVolume(ss, "G4_Cu", "sl", reg)
+    s1 = pyg4ometry.geant4.PhysicalVolume(
+        [0.1, 0.2, 0.3], [5, 6, 7], sl, "s1", bl, reg, scale=[-1, 1, 1]
+    )
+    pyg4ometry.geant4.PhysicalVolume([0.4, -0.2, 0.9], [-20, 6, 3], sl, "s2", bl, reg)
+    b1 = pyg4ometry.geant4.PhysicalVolume([0.7, 0.1, 0.2], [100, 200, 300], bl, "b1", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume(
+        [0, 0.5, 0], [-100, -200, 300], bl, "b2", wl, reg, scale=[1, -1, 1]
+    )
+
+    def placement(pv):
+        m = _np.linalg.inv(_trans.tbxyz2matrix(pv.rotation.eval()))
+        if pv.scale:
+            m = m @ _np.diag(pv.scale.eval())
+        return m, _np.array(pv.position.eval())
+
+    def check(tree):
+        # compare with composing the transforms along the path of each node
+        for i in range(1, len(tree)):
+            m, t = _np.identity(3), _np.zeros(3)
+            path = []
+            j = i
+            while j > 0:
+                path.append(tree.physicalVolumes[j])
+                j = tree.parentIndex[j]
+            for pv in reversed(path):
+                pm, pt = placement(pv)
+                t = m @ pt + t
+                m = m @ pm
+            assert _np.allclose(tree.rotations[i], m)
+            assert _np.allclose(tree.translations[i], t)
+
+    tree = wl.placementTree()
+    assert [pv.name if pv else None for pv in tree.physicalVolumes] == [
+        None,
+        "b1",
+        "s1",
+        "s2",
+        "b2",
+        "s1",
+        "s2",
+    ]
+    assert tree.parentIndex.tolist() == [-1, 0, 1, 1, 0, 4, 4]
+    assert tree.depth.tolist() == [0, 1, 2, 2, 1, 2, 2]
+    assert tree.subtreeEnd.tolist() == [7, 4, 3, 4, 7, 6, 7]
+    assert tree.children(0) == [1, 4]
+    assert tree.logicalVolume(5) is sl
+    check(tree)
+
+    # moving a placement recomputes its subtree only
+    b1.position = pyg4ometry.gdml.Position("b1_moved", 0, 0, -300, "mm", reg, False)
+    assert wl.placementTree() is tree
+    assert tree.refresh().tolist() == []
+    b1.position = pyg4ometry.gdml.Position("b1_moved2", 0, 0, 300, "mm", reg, False)
+    assert tree.refresh([b1]).tolist() == [1, 2, 3]
+    check(tree)
+    s1.rotation = pyg4ometry.gdml.Rotation("s1_rot", 0, 0, 1, "rad", reg, False)
+    assert tree.refresh().tolist() == [2, 5]
+    check(tree)
+
+    # a new placement rebuilds the tree
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], sl, "s3", wl, reg)
+    tree = wl.placementTree()
+    assert len(tree) == 8
+    check(tree)
+
+
+def test_Python_PlacementTreeExtent():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 1000, 1000, 1000, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", 100, 50, 20, reg, "mm")
+    ss = pyg4ometry.geant4.solid.Box("ss", 10, 10, 10, reg, "mm")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    sl = pyg4ometry.geant4.LogicalVolume(ss, "G4_Cu", "sl", reg)
+    pyg4ometry.geant4.PhysicalVolume(
+        [0.1, 0.2, 0.3], [60, 6, 7], sl, "s1", bl, reg, scale=[-1, 1, 1]
+    )
+    b1 = pyg4ometry.geant4.PhysicalVolume([0.7, 0.1, 0.2], [100, 200, 300], bl, "b1", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0.5, 0], [-100, -200, 300], bl, "b2", wl, reg)
+
+    def worldVertices(tree, i):
+        vertices, _ = tree.logicalVolume(i).mesh.localmesh.toVerticesAndFaces()
+        return vertices @ tree.rotations[i].T + tree.translations[i]
+
+    def check(tree):
+        # the box of each node bounds its transformed mesh, exactly for boxes
+        boxMin, boxMax = tree.boundingBoxes()
+        for i in range(len(tree)):
+            vertices = worldVertices(tree, i)
+            assert _np.allclose(boxMin[i], vertices.min(axis=0))
+            assert _np.allclose(boxMax[i], vertices.max(axis=0))
+
+    tree = wl.placementTree()
+    check(tree)
+
+    # only the daughters b1 and b2 bound the extent, not s1 placed in them
+    extent = _np.array(wl.extent())
+    assert tree.outerNodes() == [1, 3]
+    vertices = _np.concatenate([worldVertices(tree, i) for i in tree.outerNodes()])
+    assert _np.allclose(extent, [vertices.min(axis=0), vertices.max(axis=0)])
+    assert _np.allclose(wl.extent(True), [[-500, -500, -500], [500, 500, 500]])
+
+    # only the moved subtree is recomputed
+    boxMin = tree.boundingBoxes()[0].copy()
+    b1.position = pyg4ometry.gdml.Position("b1_moved", 0, 0, -300, "mm", reg, False)
+    wl.extent()
+    check(tree)
+    moved = _np.any(tree.boundingBoxes()[0] != boxMin, axis=1)
+    assert moved.tolist() == [False, True, True, False, False]
+
+    # a new mesh of a volume recomputes all its nodes
+    ss.pX = pyg4ometry.gdml.Constant("ss_pX", 40, reg)
+    sl.reMesh()
+    check(tree)
+
+    # replica copies are bounded in the mother frame
+    rs = pyg4ometry.geant4.solid.Box("rs", 10, 50, 20, reg, "mm")
+    rl = pyg4ometry.geant4.LogicalVolume(rs, "G4_Cu", "rl", reg)
+    rv = pyg4ometry.geant4.ReplicaVolume(
+        "rv", rl, bl, pyg4ometry.geant4.ReplicaVolume.Axis.kXAxis, 10, 10, 0, reg
+    )
+    tree = wl.placementTree()
+    extent = _np.array(rv.extent())
+    assert _np.allclose(extent, [[-50, -25, -10], [50, 25, 10]])
+    i = tree.physicalVolumes.index(rv)
+    corners = _np.array(_np.meshgrid(*extent.T)).reshape(3, -1).T
+    corners = corners @ tree.rotations[i].T + tree.translations[i]
+    boxMin, boxMax = tree.boundingBoxes()
+    assert _np.allclose([boxMin[i], boxMax[i]], [corners.min(axis=0), corners.max(axis=0)])
+
+
+def test_Python_PlacementTreeExtentLazyMeshing(monkeypatch):
+    import pyg4ometry
+
+    monkeypatch.setattr(pyg4ometry.config, "lazyMeshing", True)
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 1000, 1000, 1000, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", 100, 100, 100, reg, "mm")
+    ss = pyg4ometry.geant4.solid.Box("ss", 10, 10, 10, reg, "mm")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    sl = pyg4ometry.geant4.LogicalVolume(ss, "G4_Cu", "sl", reg)
+    al = pyg4ometry.geant4.AssemblyVolume("al", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], sl, "s1", bl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 200], bl, "b1", al, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [100, 0, 0], al, "a1", wl, reg)
+
+    # the extent of the world meshes only the volume placed through the assembly
+    assert _np.allclose(wl.extent(), [[50, -50, 150], [150, 50, 250]])
+    assert bl.isMeshed()
+    assert not wl.isMeshed()
+    assert not sl.isMeshed()
+
+
+@pytest.mark.parametrize(("concatenateDisjoint", "parallel"), [(False, 0), (True, 0), (True, 2)])
+def test_Python_MultiUnionBalanced(monkeypatch, concatenateDisjoint, parallel):
+    import pyg4ometry
+
+    monkeypatch.setattr(pyg4ometry.config, "multiUnionConcatenateDisjoint", concatenateDisjoint)
+    monkeypatch.setattr(pyg4ometry.config, "multiUnionParallel", parallel)
+
+    # 10 boxes in overlapping pairs, the pairs disjoint from each other
+    reg = pyg4ometry.geant4.Registry()
+    box = pyg4ometry.geant4.solid.Box("b", 10, 10, 10, reg, "mm")
+    positions = [[20 * (i // 2) + 5 * (i % 2), 0, 0] for i in range(10)]
+    mu = pyg4ometry.geant4.solid.MultiUnion(
+        "mu", [box] * 10, [[[0, 0, 0], p] for p in positions], reg
+    )
+
+    assert mu.mesh().volume() == pytest.approx(5 * 1500)
+
+
 def test_Python_ExceptionNullMeshErrorIntersection():
     import pyg4ometry
 
@@ -377,6 +768,70 @@ def test_Python_VisualisationVtk_DefaultMaterial(simple_box):
     v.addLogicalVolume(wlv)
 
 
+def test_Python_Visualisation_exportGLTFScene(tmptestdir):
+    import pygltflib
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 1000, 1000, 1000, reg)
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 20, 30, reg)
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    for i in range(3):
+        pyg4ometry.geant4.PhysicalVolume([0, 0, 0.1 * i], [50 * i, 0, 0], bl, f"b_pv{i}", wl, reg)
+    reg.setWorld(wl)
+
+    v = pyg4ometry.visualisation.ViewerBase()
+    v.addLogicalVolume(wl)
+
+    for fileName in ["scene.glb", "scene.gltf"]:
+        v.exportGLTFScene(str(tmptestdir / fileName))
+        gltf = pygltflib.GLTF2().load(str(tmptestdir / fileName))
+
+        # one mesh per logical volume in a single buffer, one node per placement
+        assert len(gltf.buffers) == 1
+        assert len(gltf.meshes) == 2
+        assert len(gltf.nodes) == 4
+        nodes = {n.name: n for n in gltf.nodes}
+        assert nodes["bl_0"].mesh == nodes["bl_2"].mesh
+        assert _np.allclose(nodes["bl_2"].translation, [100, 0, 0])
+        assert len(nodes["bl_2"].rotation) == 4
+
+
+def test_Python_VisualisationVtkNew_Instanced():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 1000, 1000, 1000, reg)
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 20, 30, reg)
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    for i in range(3):
+        pyg4ometry.geant4.PhysicalVolume([0, 0, 0.1 * i], [50 * i, 0, 0], bl, f"b_pv{i}", wl, reg)
+    reg.setWorld(wl)
+
+    v = pyg4ometry.visualisation.VtkViewerNew()
+    v.addLogicalVolume(wl)
+    v.addCutter("xy", [0, 0, 0], [0, 0, 1])
+    v.addClipper([0, 0, 0], [0, 1, 0])
+    v.buildPipelinesInstanced()
+
+    # one polydata per logical volume and one glyph mapped actor per mesh and vis options
+    assert len(v.polydata) == 2
+    assert len(v.instancedActorDict) == 2
+    actor = next(a for a in v.instancedActorDict if v.instancedActorDict[a][0] == "bl")
+    assert actor.GetMapper().GetInput().GetNumberOfPoints() == 3
+    assert len(v.cutters["xy"]) == 2
+    assert len(v.clipperPlanes) == 2
+
+    assert v.pickInstance(actor, [100, 0, 14])[2] == "b_pv2"
+    assert v.pickInstance(actor, [25, 0, 0]) is None
+
+    # the same side is kept as by the clip filters of buildPipelinesAppend
+    v.setClipper([0, 0, 0], [1, 0, 0])
+    assert list(v.clipperPlanes[0].GetNormal()) == [1, 0, 0]
+
+
 # TODO reinstate test
 # def test_Python_VisualisationVtk_CustomMaterialColours(lhc_blm):
 #    import pyg4ometry
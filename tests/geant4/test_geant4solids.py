@@ -608,6 +608,45 @@ def test_PythonGeant_T033_Tessellated(tmptestdir, testdata):
     )
 
 
+def test_TessellatedSolid_arrays():
+    reg = pyg4ometry.geant4.Registry()
+    T = pyg4ometry.geant4.solid.TessellatedSolid
+
+    # square pyramid with a quadrangle base and a duplicated apex
+    vertices = [[0, 0, 0], [0, 1, 0], [1, 1, 0], [1, 0, 0], [0.5, 0.5, 1], [0.5, 0.5, 1]]
+    facets = [[0, 1, 2, 3], [0, 3, 4], [3, 2, 5], [2, 1, 4], [1, 0, 5]]
+    s = T("pyramid", [vertices, facets], reg)
+
+    assert s.vertices.dtype == _np.float64
+    assert s.faces.dtype == _np.uint32
+    assert s.faces.shape == (5, 4)
+    assert s.quads.tolist() == [True, False, False, False, False]
+    assert s.facets() == facets
+    assert s.meshtess == [vertices, facets]
+
+    s.removeDuplicateVertices()
+    assert len(s.vertices) == 5
+    assert s.facets() == [[0, 1, 2, 3], [0, 3, 4], [3, 2, 4], [2, 1, 4], [1, 0, 4]]
+    assert s.mesh().polygonCount() > 0
+
+    # vertices and faces added one at a time
+    t = T("added", None, reg)
+    for v in vertices:
+        t.addVertex(v)
+    for f in facets:
+        t.addTriangle(f)
+    assert t.facets() == facets
+
+    # stl facets are welded, gdml vertex defines are referred to by name
+    stl = T(
+        "stl", [(s.vertices[f[:3]].tolist(), (0, 0, 0)) for f in s.facets()], reg, T.MeshType.Stl
+    )
+    assert len(stl.vertices) == 5
+    gdml = T("gdml", [["v0", "v1", "v2"], ["v2", "v1", "v3", "v0"]], reg, T.MeshType.Gdml)
+    assert gdml.vertexNames == ["v0", "v1", "v2", "v3"]
+    assert gdml.meshtess == [["v0", "v1", "v2"], ["v2", "v1", "v3", "v0"]]
+
+
 def test_PythonGeant_T101_PhysicalLogical(tmptestdir, testdata):
     T101_physical_logical.Test(
         vis=False,
@@ -1086,6 +1125,33 @@ def test_PythonGeant_T434_MergeRegistry_CollapseAssembly(tmptestdir, testdata):
     )
 
 
+def test_MergeRegistry_SharedVolumes():
+    g4 = pyg4ometry.geant4
+
+    reg1 = g4.Registry()
+    ws = g4.solid.Box("ws", 1000, 1000, 1000, reg1)
+    ms = g4.solid.Box("ms", 100, 100, 100, reg1)
+    bs = g4.solid.Box("bs", 10, 10, 10, reg1)
+    wl = g4.LogicalVolume(ws, "G4_Galactic", "wl", reg1)
+    ml = g4.LogicalVolume(ms, "G4_AIR", "ml", reg1)
+    bl = g4.LogicalVolume(bs, "G4_Fe", "bl", reg1)
+    cl = g4.LogicalVolume(bs, "G4_Fe", "cl", reg1)
+    g4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "b_pv", ml, reg1)
+    g4.PhysicalVolume([0, 0, 0], [20, 0, 0], cl, "c_pv", ml, reg1)
+    for i in range(5):
+        g4.PhysicalVolume([0, 0, 0], [200 * i, 0, 0], ml, f"m_pv{i}", wl, reg1)
+
+    # a volume placed many times is transferred, and so renamed, once
+    reg0 = g4.Registry()
+    reg0.addVolumeRecursive(wl, userRenameDict={"^": "p_"})
+    reg0.setWorld(wl.name)
+
+    assert sorted(reg0.logicalVolumeDict) == ["p_bl", "p_cl", "p_ml", "p_wl"]
+    assert sorted(reg0.solidDict) == ["p_bs", "p_ms", "p_ws"]
+    assert len(reg0.physicalVolumeDict) == 7
+    assert reg0.logicalVolumeList == ["p_bl", "p_cl", "p_ml", "p_wl"]
+
+
 def test_PythonGeant_T600_LVTessellated(tmptestdir, testdata):
     T600_LVTessellated.Test(
         vis=False,
@@ -0,0 +1,44 @@
+import numpy as _np
+import pytest
+
+import pyg4ometry.pycgal as _cgal
+
+
+def test_cgal_from_arrays_cube():
+    # each face has its own vertices, which are merged
+    corners = _np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=float)
+    quads = _np.array(
+        [
+            [0, 1, 3, 2],
+            [4, 6, 7, 5],
+            [0, 4, 5, 1],
+            [2, 3, 7, 6],
+            [0, 2, 6, 4],
+            [1, 5, 7, 3],
+        ]
+    )
+    vertices = corners[quads.ravel()]
+    faces = [_np.arange(24).reshape(6, 4)]
+
+    c = _cgal.CSG.fromArrays(vertices, faces)
+
+    assert c.vertexCount() == 8
+    assert c.polygonCount() == 12
+    assert c.isClosed()
+    assert c.volume() == pytest.approx(8)
+    assert _cgal.CGAL.is_outward_oriented(c.sm)
+
+
+def test_cgal_to_vertices_and_faces():
+    c = _cgal.CSG.cube([1, 2, 3], [1, 1, 1])
+    verts, polys, _ = c.toVerticesAndPolygons()
+
+    vertices, faces = c.toVerticesAndFaces()
+
+    assert vertices.dtype == _np.float64
+    assert vertices.shape == (len(verts), 3)
+    assert faces.dtype == _np.int32
+    assert faces.shape == (sum(len(p) - 2 for p in polys), 3)
+    assert _np.allclose(vertices, verts)
+    assert _np.allclose(vertices.min(axis=0), [0, 1, 2])
+    assert _np.allclose(vertices.max(axis=0), [2, 3, 4])
@@ -34,3 +34,79 @@ def test_StlWrite_T001_Box(testdata, tmptestdir, simple_box):
     m = lv.daughterVolumes[0].logicalVolume.mesh.localmesh
     pd = Convert.pycsgMeshToVtkPolyData(m)
     Writer.writeVtkPolyDataAsSTLFile(str(tmptestdir / "T001_Box.stl"), [pd])
+
+
+def test_Convert_pycsgMeshToVtkPolyData(simple_box):
+    import numpy as np
+    from vtk.util.numpy_support import vtk_to_numpy
+
+    m = simple_box["logicalVolume"].daughterVolumes[0].logicalVolume.mesh.localmesh
+    verts, tris = m.toVerticesAndFaces()
+    pd = Convert.pycsgMeshToVtkPolyData(m)
+
+    assert pd.GetNumberOfPoints() == len(verts)
+    assert pd.GetNumberOfCells() == len(tris)
+    assert np.allclose(vtk_to_numpy(pd.GetPoints().GetData()), verts)
+    assert np.array_equal(vtk_to_numpy(pd.GetPolys().GetConnectivityArray()), tris.ravel())
+    assert np.array_equal(
+        vtk_to_numpy(pd.GetPolys().GetOffsetsArray()), np.arange(0, 3 * len(tris) + 1, 3)
+    )
+
+
+def test_StlLoad_BinaryAndAsciiWelded(tmptestdir):
+    import struct
+    import numpy as np
+
+    # unit cube as 12 triangles
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=float)
+    triangles = [
+        [0, 2, 3], [0, 3, 1], [4, 5, 7], [4, 7, 6], [0, 1, 5], [0, 5, 4],
+        [2, 6, 7], [2, 7, 3], [0, 4, 6], [0, 6, 2], [1, 3, 7], [1, 7, 5],
+    ]  # fmt: skip
+
+    binaryName = str(tmptestdir / "cube_binary.stl")
+    with open(binaryName, "wb") as f:
+        f.write(b"\0" * 80 + struct.pack("<I", len(triangles)))
+        for t in triangles:
+            f.write(struct.pack("<12fH", 0, 0, 0, *corners[t].ravel(), 0))
+
+    asciiName = str(tmptestdir / "cube_ascii.stl")
+    with open(asciiName, "w") as f:
+        f.write("solid cube\n")
+        for t in triangles:
+            f.write("facet normal 0 0 0\nouter loop\n")
+            for v in corners[t]:
+                f.write(f"vertex {v[0]:e} {v[1]:e} {v[2]:e}\n")
+            f.write("endloop\nendfacet\n")
+        f.write("endsolid cube\n")
+
+    readers = [
+        stl.Reader(fn, scale=2, registry=geant4.Registry()) for fn in [binaryName, asciiName]
+    ]
+    for r in readers:
+        assert r.vertices.shape == (8, 3)
+        assert r.faces.shape == (12, 3)
+        assert np.array_equal(r.vertices[r.faces], 2 * corners[np.array(triangles)])
+        assert r.extent() == [[0, 0, 0], [2, 2, 2]]
+        assert np.shares_memory(r.getSolid().vertices, r.vertices)
+
+    assert readers[0].facet_list == readers[1].facet_list
+
+
+def test_StlLoad_AsciiNanNormals(tmptestdir):
+    import numpy as np
+
+    fileName = str(tmptestdir / "nan_normals.stl")
+    with open(fileName, "w") as f:
+        f.write("solid nan\n")
+        for normal in ["nan nan nan", "-NaN inf -Infinity"]:
+            f.write(f"facet normal {normal}\nouter loop\n")
+            f.write("vertex 0 0 0\nvertex 1 0 0\nvertex 0 1 0\n")
+            f.write("endloop\nendfacet\n")
+        f.write("endsolid nan\n")
+
+    r = stl.Reader(fileName, registry=geant4.Registry())
+    assert r.faces.shape == (2, 3)
+    assert np.isnan(r.normals[0]).all()
+    assert np.isnan(r.normals[1, 0])
+    assert r.normals[1, 1:].tolist() == [np.inf, -np.inf]